@@ -1,37 +1,170 @@
 """
 ASCII Wheel drawing for Wheel of Fortune
-Mock implementation for testing
+Frames are built once per (wheel values, radius, label style, position) and reused for every spin
 """
 
-def draw_ascii_wheel(wheel_values, radius=18, label_style="long"):
+import functools
+import math
+
+import game_clock
+import output_sink
+
+# Frames per second of an animated spin, and how long a spin lasts (the old "Drama!" pause)
+FRAME_RATE = 20
+SPIN_SECONDS = 2.0
+
+# Set by --animate: spin_wheel plays the spin instead of pausing and drawing the still wheel
+ANIMATE = False
+
+# Frames kept per process: a 24-segment wheel needs 24 positions per radius and label style
+FRAME_CACHE_SIZE = 512
+
+
+def segment_label(value, label_style="long"):
+    """Text written on a segment: long ($500, BANKRUPT, LOSE A TURN) or short (500, BK, LT)"""
+    if value == -1:
+        return "BANKRUPT" if label_style == "long" else "BK"
+    if value == 0:
+        return "LOSE A TURN" if label_style == "long" else "LT"
+    return f"${value}" if label_style == "long" else str(value)
+
+
+@functools.lru_cache(maxsize=FRAME_CACHE_SIZE)
+def wheel_frame(wheel_values, radius=18, label_style="long", position=0):
     """
-    Draw an ASCII representation of the wheel
-    This is a simplified mock implementation
+    The wheel with segment `position` under the pointer, as one string.
+    Characters are about twice as tall as wide, so the wheel is radius rows tall and
+    4 * radius + 1 columns wide. Long labels run out along the spokes, short ones sit
+    across the segments.
     """
-    print("    🎡 WHEEL OF FORTUNE 🎡")
-    print("         ╭─────────╮")
-    print("       ╭─┴─────────┴─╮")
-    print("     ╭─┴─────────────┴─╮")
-    print("   ╭─┴─────────────────┴─╮")
-    print("  ╱                       ╲")
-    print(" ╱         SPINNING        ╲")
-    print("╱                           ╲")
-    print("│            🎯             │")
-    print("╲                           ╱")
-    print(" ╲         WHEEL           ╱")
-    print("  ╲                       ╱")
-    print("   ╰─┬─────────────────┬─╯")
-    print("     ╰─┬─────────────┬─╯")
-    print("       ╰─┬─────────┬─╯")
-    print("         ╰─────────╯")
-    print()
-    
-    # Show some sample values
-    print("Wheel contains values like:")
+    count = len(wheel_values)
+    height = radius + 1
+    width = 4 * radius + 1
+    center_row = radius // 2
+    center_column = 2 * radius
+    segment_angle = 2 * math.pi / count
+    grid = [[" "] * width for _ in range(height)]
+
+    for row in range(height):
+        for column in range(width):
+            x = (column - center_column) / 2
+            y = row - center_row
+            distance = math.hypot(x, y)
+            if distance > radius / 2 + 0.5:
+                continue
+            if distance >= radius / 2 - 0.5:
+                grid[row][column] = "o" # Rim
+                continue
+            # Angle clockwise from the pointer at the top
+            angle = math.atan2(x, -y) % (2 * math.pi)
+            offset = (angle / segment_angle + 0.5) % 1
+            if distance > 1 and (offset < 0.06 or offset > 0.94):
+                grid[row][column] = "." # Spoke between segments
+
+    grid[center_row][center_column] = "@"
+    taken = set() # Cells holding short labels
+    for slot in range(count):
+        value = wheel_values[(position + slot) % count]
+        label = segment_label(value, label_style)
+        angle = slot * segment_angle
+        if label_style == "long":
+            # Along the middle of the segment, reading out towards the rim, cut to what fits
+            step_x, step_y = math.sin(angle), -math.cos(angle)
+            step = 1 / max(abs(step_x) * 2, abs(step_y)) # One cell per character
+            outer = radius / 2 - 1.5
+            label = label[:max(1, int((outer - 2) / step) + 1)]
+            for index, character in enumerate(label):
+                distance = outer - (len(label) - 1 - index) * step
+                row = round(center_row + step_y * distance)
+                column = round(center_column + step_x * distance * 2)
+                grid[row][column] = character
+        else:
+            # Across the segment; every other label sits further out so neighbours get two
+            # segments of room, and a label is cut where it would run into one already placed
+            distance = radius / 2 * (0.8 if slot % 2 else 0.55)
+            row = round(center_row - math.cos(angle) * distance)
+            for length in range(len(label), 0, -1):
+                column = round(center_column + math.sin(angle) * distance * 2) - length // 2
+                if not taken & {(row, cell) for cell in range(column - 1, column + length + 1)}:
+                    break
+            for index, character in enumerate(label[:length]):
+                if 0 <= column + index < width:
+                    grid[row][column + index] = character
+                    taken.add((row, column + index))
+
+    pointer = " " * center_column + "▼"
+    lines = [pointer] + ["".join(cells).rstrip() for cells in grid]
+    landed = segment_label(wheel_values[position % count], "long")
+    lines.append(" " * max(0, center_column - len(landed) // 2) + landed)
+    return "\n".join(lines) + "\n"
+
+
+@functools.lru_cache(maxsize=FRAME_CACHE_SIZE)
+def _still_frame(wheel_values, radius, label_style):
+    # The drawing spin_wheel shows: the wheel and a few of its values
+    parts = ["    🎡 WHEEL OF FORTUNE 🎡\n", wheel_frame(wheel_values, radius, label_style), "\n",
+             "Wheel contains values like:\n"]
     sample_values = [v for v in wheel_values if v > 0][:8]
     for i, val in enumerate(sample_values):
         if i % 4 == 0:
-            print()
-        print(f"${val:>4}", end="  ")
-    print("\n...plus BANKRUPT and LOSE A TURN")
-    print()
+            parts.append("\n")
+        parts.append(f"${val:>4}  ")
+    parts.append("\n...plus BANKRUPT and LOSE A TURN\n\n")
+    return "".join(parts)
+
+
+def draw_ascii_wheel(wheel_values, radius=18, label_style="long", stream=None):
+    """
+    Draw an ASCII representation of the wheel (to the output sink unless a stream is given)
+    Built the first time and written with a single call after that
+    """
+    if stream is None:
+        output_sink.write("spin", _still_frame(tuple(wheel_values), radius, label_style))
+    else:
+        stream.write(_still_frame(tuple(wheel_values), radius, label_style))
+
+
+def spin_positions(count, landing, frames, turns=2):
+    """Wheel position for each frame of a spin that slows down and stops on `landing`"""
+    travel = turns * count
+    positions = []
+    for frame in range(1, frames + 1):
+        progress = frame / frames
+        remaining = round(travel * (1 - progress) ** 2) # Eases out
+        positions.append((landing - remaining) % count)
+    return positions
+
+
+def animate_spin(wheel_values, landing, radius=18, label_style="long", stream=None, frame_rate=FRAME_RATE,
+                 seconds=SPIN_SECONDS):
+    """
+    Play a spin that stops with wheel_values[landing] under the pointer.
+    One frame per 1/frame_rate seconds of the game clock; on a terminal each frame is
+    drawn over the last, elsewhere (or with --pace=zero) only the final frame is written.
+    Without a stream the frames go to the output sink's terminal, or the final frame to the sink.
+    """
+    wheel_values = tuple(wheel_values)
+    clock = game_clock.get_clock()
+    if stream is None:
+        sink = output_sink.get_sink()
+        terminal = sink.terminal() if clock.scale > 0 else None
+        if terminal is None:
+            sink.write("spin", wheel_frame(wheel_values, radius, label_style, landing))
+            clock.sleep(seconds)
+            return
+        sink.flush() # Frames are drawn in place below what the turn has shown so far
+        stream = terminal
+    elif not (getattr(stream, "isatty", lambda: False)() and clock.scale > 0):
+        stream.write(wheel_frame(wheel_values, radius, label_style, landing))
+        clock.sleep(seconds)
+        return
+
+    positions = spin_positions(len(wheel_values), landing, max(1, round(seconds * frame_rate)))
+    rows = wheel_frame(wheel_values, radius, label_style, landing).count("\n")
+    for number, position in enumerate(positions):
+        frame = wheel_frame(wheel_values, radius, label_style, position)
+        if number:
+            frame = f"\x1b[{rows}F" + frame # Back to the top of the previous frame
+        stream.write(frame)
+        stream.flush()
+        clock.sleep(1 / frame_rate)
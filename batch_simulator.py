@@ -0,0 +1,208 @@
+"""
+NumPy lockstep batch simulator for Wheel of Fortune
+Advances thousands of bot-only games at once for the fixed-order strategies
+"""
+
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np  # pip install numpy
+
+import puzzle_corpus
+from game_engine import MAX_TURNS
+from strategy_registry import STRATEGIES, FixedOrderPlayer
+
+
+def fixed_order_strategies():
+    """
+    Player type -> (letter order, money needed before buying a vowel, wheel it spins)
+    for every registered FixedOrderPlayer. These players only look at the guessed
+    letters and their own bank, so whole batches decide at once. Looked up each time,
+    so types registered after import are included.
+    """
+    strategies = {}
+    for name, strategy in STRATEGIES.items():
+        player = strategy.factory(None)
+        if type(player) is FixedOrderPlayer:
+            strategies[name] = (player.order, player.vowel_threshold, strategy.wheel_values)
+    return strategies
+
+
+VOWEL_COST = 250
+DEFAULT_BATCH_SIZE = 200000
+
+# Per-game arrays for one batch; winner is -1 for games that hit max_turns
+BatchResult = namedtuple("BatchResult", ["winner", "winnings", "turns"])
+
+
+class _Seat:
+    """A strategy's letter order as arrays, ready for batch decisions"""
+
+    def __init__(self, type_of_player):
+        strategies = fixed_order_strategies()
+        if type_of_player not in strategies:
+            raise ValueError(f"{type_of_player} is not a fixed-order strategy. "
+                             f"Available: {', '.join(strategies)}")
+        order, vowel_threshold, wheel_values = strategies[type_of_player]
+        self.letters = np.array([ord(c) - 65 for c in order], dtype=np.int64)
+        self.bits = (1 << self.letters).astype(np.int32)
+        self.vowels = np.array([c in "AEIOU" for c in order])
+        self.vowel_threshold = vowel_threshold
+        self.wheel_values = np.array(wheel_values, dtype=np.int64)
+
+
+def letter_counts(puzzles):
+    """[puzzles, 26] array of how often each letter appears in each puzzle"""
+    counts = np.zeros((len(puzzles), 26), dtype=np.int16)
+    for row, puzzle in enumerate(puzzles):
+        codes = np.frombuffer(puzzle.encode("utf-8"), dtype=np.uint8)
+        codes = codes[(codes >= 65) & (codes <= 90)] - 65
+        counts[row] = np.bincount(codes, minlength=26)
+    return counts
+
+
+_corpus_counts = {}
+
+
+def corpus_letter_counts(path=None):
+    """Letter counts for every puzzle of the corpus, computed once per process"""
+    if path is None:
+        path = puzzle_corpus.PUZZLE_FILE
+    counts = _corpus_counts.get(path)
+    if counts is None:
+        corpus = puzzle_corpus.get_corpus(path)
+        counts = _corpus_counts[path] = letter_counts([corpus[row][0] for row in range(len(corpus))])
+    return counts
+
+
+def play_batch(type_of_players, counts, rng, max_turns=MAX_TURNS):
+    """
+    Play one game per row of counts in lockstep and return a BatchResult.
+    Follows game_engine.apply_guess: a hit keeps the turn, anything else passes it,
+    and the player who fills the board solves on the next turn.
+    """
+    seats = [_Seat(type_of_player) for type_of_player in type_of_players]
+    games = len(counts)
+    counts = np.asarray(counts, dtype=np.int64)
+    hidden = counts.sum(axis=1)
+    guessed = np.zeros(games, dtype=np.int32)
+    winnings = np.zeros((games, 3), dtype=np.int64)
+    turn = np.zeros(games, dtype=np.int64)
+    turns = np.zeros(games, dtype=np.int64)
+    winner = np.full(games, -1, dtype=np.int8)
+
+    # A puzzle without letters is solved straight away by player 0
+    empty = hidden == 0
+    winner[empty] = 0
+    turns[empty] = 1
+    active = np.flatnonzero(~empty)
+
+    while active.size:
+        seat_of_game = turn[active] % 3
+        for seat_number, seat in enumerate(seats):
+            games_here = active[seat_of_game == seat_number]
+            if not games_here.size:
+                continue
+            bank = winnings[games_here, seat_number]
+            mask = guessed[games_here]
+
+            # First letter in order that is not guessed and, for vowels, affordable
+            callable_letters = (mask[:, None] & seat.bits[None, :]) == 0
+            callable_letters &= ~seat.vowels[None, :] | (bank[:, None] >= seat.vowel_threshold)
+            found = callable_letters.any(axis=1)
+            # Like the turn functions, running out of letters leaves the last one in the order
+            pick = np.where(found, callable_letters.argmax(axis=1), len(seat.letters) - 1)
+            letter = seat.letters[pick]
+            bit = seat.bits[pick]
+            vowel = seat.vowels[pick]
+            repeated = (mask & bit) != 0
+
+            bought = found & vowel
+            winnings[games_here[bought], seat_number] -= VOWEL_COST
+
+            spun = found & ~vowel
+            dollar = np.zeros(games_here.size, dtype=np.int64)
+            dollar[spun] = rng.choice(seat.wheel_values, size=int(spun.sum()))
+            bankrupt = spun & (dollar == -1)
+            winnings[games_here[bankrupt], seat_number] = 0
+            plays = ~repeated & ~(spun & (dollar <= 0))
+
+            hits = np.where(plays, counts[games_here, letter], 0)
+            guessed[games_here[plays]] |= bit[plays]
+            hidden[games_here] -= hits
+            winnings[games_here, seat_number] += np.where(spun, dollar, 0).clip(min=0) * hits
+            turn[games_here] += hits == 0
+            turns[games_here] += 1
+
+        solved = hidden[active] == 0
+        in_time = turns[active] < max_turns
+        solving = active[solved & in_time]
+        winner[solving] = turn[solving] % 3
+        turns[solving] += 1
+        active = active[~solved & in_time]
+
+    return BatchResult(winner, winnings, turns)
+
+
+def batch_rng(seed, batch_number):
+    """Random stream for one batch of a seeded run, independent of every other batch"""
+    return np.random.default_rng([seed, batch_number])
+
+
+def simulate(type_of_players, games, seed=None, batch_size=DEFAULT_BATCH_SIZE, counts=None,
+             max_turns=MAX_TURNS):
+    """
+    Yield a BatchResult per batch until `games` games have been played.
+    Puzzles are drawn uniformly from the corpus unless counts (one row per puzzle) is given.
+    Batch b of a run is replayed exactly by play_batch with batch_rng(seed, b) and the same batch size.
+    """
+    if seed is None:
+        seed = int(np.random.SeedSequence().generate_state(1)[0])
+    if counts is None:
+        counts = corpus_letter_counts()
+    remaining = games
+    batch_number = 0
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        rng = batch_rng(seed, batch_number)
+        batch_counts = counts[rng.integers(len(counts), size=size)]
+        yield play_batch(type_of_players, batch_counts, rng, max_turns)
+        remaining -= size
+        batch_number += 1
+
+
+def win_rates(type_of_players, games, seed=None, batch_size=DEFAULT_BATCH_SIZE, counts=None):
+    """(wins per seat / games, mean winnings per seat, unfinished games)"""
+    wins = np.zeros(3, dtype=np.int64)
+    money = np.zeros(3, dtype=np.int64)
+    unfinished = 0
+    for result in simulate(type_of_players, games, seed, batch_size, counts):
+        wins += np.bincount(result.winner[result.winner >= 0], minlength=3)
+        money += result.winnings.sum(axis=0)
+        unfinished += int((result.winner < 0).sum())
+    return wins / games, money / games, unfinished
+
+
+if __name__ == '__main__':
+    games = 1000000
+    seed = None
+    type_of_players = []
+    for arg in sys.argv[1:]:
+        if arg.startswith('--games='):
+            games = int(arg.split('=')[1])
+        elif arg.startswith('--seed='):
+            seed = int(arg.split('=')[1])
+        else:
+            type_of_players.append(arg)
+    if len(type_of_players) != 3:
+        type_of_players = ["morse", "oxford", "smart"]
+        print("Using default players:", type_of_players)
+        print("Available player types:", ", ".join(fixed_order_strategies()))
+
+    start = time.perf_counter()
+    rates, mean_winnings, unfinished = win_rates(type_of_players, games, seed)
+    elapsed = time.perf_counter() - start
+    print(f"{games} games in {elapsed:.2f}s ({games / elapsed:.0f} games/s, {unfinished} unfinished)")
+    for seat, type_of_player in enumerate(type_of_players):
+        print(f"Seat {seat} {type_of_player:<14} win rate {rates[seat]:.4f}  mean ${mean_winnings[seat]:.0f}")
@@ -0,0 +1,353 @@
+"""
+Benchmark suite for Wheel of Fortune
+Times every strategy, the play_random_game loop and the puzzle loader against the bundled
+benchmark_puzzles.csv, so it needs neither ../../data nor a network connection
+"""
+
+import contextlib
+import datetime
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+
+import board_renderer
+import game_clock
+import game_engine
+import output_sink
+import puzzle_corpus
+import smart_player
+import wheel_of_fortune
+from board_state import GuessedLetters
+from strategy_registry import STRATEGIES
+
+BENCHMARK_PUZZLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_puzzles.csv")
+SEED = 2024
+
+# Turn functions as they are written in wheel_of_fortune.py and smart_player.py
+TURN_FUNCTIONS = {
+    "computer_turn": (wheel_of_fortune.computer_turn, wheel_of_fortune.WHEEL_VALUES),
+    "computer_turn_morse": (wheel_of_fortune.computer_turn_morse, wheel_of_fortune.WHEEL_VALUES),
+    "computer_turn_oxford": (wheel_of_fortune.computer_turn_oxford, wheel_of_fortune.WHEEL_VALUES),
+    "computer_turn_trigrams_bigrams": (wheel_of_fortune.computer_turn_trigrams_bigrams,
+                                       wheel_of_fortune.WHEEL_VALUES),
+    "computer_turn_smart": (smart_player.computer_turn_smart, smart_player.SIMPLE_WHEEL_VALUES),
+    "computer_turn_smart_conservative": (smart_player.computer_turn_smart_conservative,
+                                         smart_player.SIMPLE_WHEEL_VALUES),
+    "computer_turn_smart_aggressive": (smart_player.computer_turn_smart_aggressive,
+                                       smart_player.SIMPLE_WHEEL_VALUES),
+}
+
+# Sizes of one run; --quick divides the counts by 10
+FULL_SIZES = {"turns": 20000, "games": 2000, "memory_games": 200, "random_games": 200, "boards": 20000,
+              "draws": 200000}
+
+# Every timing is the best of this many runs, which keeps commit-to-commit noise down
+REPEATS = 3
+
+Result = namedtuple("Result", ["name", "metric", "value", "unit"])
+
+# Words for the synthetic puzzles, per clue category
+SYNTHETIC_WORDS = {
+    "PHRASE": ["TIME", "FLIES", "WHEN", "HAVING", "FUN", "BETTER", "LATE", "THAN", "NEVER", "GOLDEN", "RULE",
+               "BREAK", "LEG", "PIECE", "CAKE", "ROCK", "SOLID", "OVER", "MOON", "HEART", "GOLD"],
+    "THING": ["WHEEL", "FORTUNE", "BRIDGE", "TELEPHONE", "UMBRELLA", "LANTERN", "BICYCLE", "PIANO",
+              "CAMERA", "COMPASS", "BLANKET", "MIRROR", "KEYBOARD", "TRUMPET", "LADDER"],
+    "PERSON": ["FAMOUS", "ARTIST", "QUEEN", "KING", "PEOPLE", "DOCTOR", "PILOT", "SCIENTIST", "WIZARD",
+               "NEIGHBOR", "CHAMPION", "SKIPPER", "JUGGLER", "DETECTIVE"],
+    "PLACE": ["NEW", "YORK", "GRAND", "CANYON", "BEACH", "HARBOR", "VALLEY", "DESERT", "JUNGLE", "MUSEUM",
+              "AIRPORT", "LIBRARY", "ISLAND", "GLACIER"],
+    "FOOD & DRINK": ["PEPPER", "BREAKFAST", "COFFEE", "LEMONADE", "PANCAKES", "SALAD", "SODA", "BUTTER",
+                     "WAFFLES", "JAM", "QUICHE", "ZUCCHINI", "PRETZEL", "YOGURT"],
+    "WHAT ARE YOU DOING?": ["SWIMMING", "JOGGING", "BAKING", "READING", "WRITING", "SKATING", "FISHING",
+                            "KNITTING", "JUMPING", "WALKING", "DANCING", "SINGING"],
+}
+SYNTHETIC_GAME_TYPES = ["Toss Up", "Round 1", "Round 2", "Round 3", "Bonus Round"]
+
+
+def make_puzzles(path=BENCHMARK_PUZZLES, rows=2000, seed=SEED):
+    """Write a synthetic valid.csv: puzzle,clue,date,game_type with '&' escaped like the real file"""
+    rng = random.Random(seed)
+    categories = sorted(SYNTHETIC_WORDS)
+    day = datetime.date(2020, 1, 1)
+    with open(path, 'w') as f:
+        for row in range(rows):
+            clue = rng.choice(categories)
+            words = [rng.choice(SYNTHETIC_WORDS[clue]) for _ in range(rng.randint(1, 4))]
+            # The odd AND/& puzzle keeps the &amp; unescaping on the benchmarked path
+            if rng.random() < 0.05:
+                words.insert(len(words) // 2 + 1, "&amp;")
+            f.write(f"{' '.join(words)},{clue.replace('&', '&amp;')},"
+                    f"{day + datetime.timedelta(days=row)},{rng.choice(SYNTHETIC_GAME_TYPES)}\n")
+
+
+def use_benchmark_puzzles(path=BENCHMARK_PUZZLES):
+    """Point every default corpus (games, word index, letter oracle) at the benchmark file"""
+    puzzle_corpus.PUZZLE_FILE = path
+
+
+@contextlib.contextmanager
+def quiet():
+    """No pauses and no output while play_random_game runs"""
+    clock = game_clock.set_clock(game_clock.PacingClock(0))
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            yield
+    finally:
+        game_clock.set_clock(clock)
+
+
+def _silent(*args):
+    pass
+
+
+def timed(function, repeats=REPEATS):
+    """(seconds, return value) of the fastest of `repeats` calls, with the collector out of the way"""
+    best = None
+    for _ in range(repeats):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            value = function()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, value
+
+
+def peak_memory(function):
+    """Peak bytes allocated by one call"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def board_states(count, seed=SEED):
+    """
+    (showing, winnings, previous_guesses, turn) seen before real turns of mixed
+    line-ups, so every turn function is timed on the same boards.
+    """
+    lineups = [("oxford", "trigram", "smart"), ("morse", "aggressive", "alphabet"), ("solver", "oxford", "morse")]
+    states = []
+    game = 0
+    while len(states) < count:
+        state = game_engine.new_game(lineups[game % len(lineups)], rng=game_engine.game_rng(seed, game))
+        wheel = [STRATEGIES[type_of_player].wheel_values for type_of_player in state.type_of_players]
+        while state.winner is None and state.turns_played < game_engine.MAX_TURNS and len(states) < count:
+            if state.board.solved:
+                game_engine.attempt_solve(state, state.showing)
+                continue
+            states.append((state.showing, list(state.winnings), GuessedLetters(state.previous_guesses),
+                           state.turn))
+            player = state.players[state.seat]
+            wheel_values = wheel[state.seat]
+            guess, dollar = player.take_turn(state.showing, state.winnings, state.previous_guesses, state.turn,
+                                             lambda: state.rng.choice(wheel_values), _silent)
+            game_engine.apply_guess(state, guess, dollar)
+        game += 1
+    return states
+
+
+def bench_turn_functions(sizes):
+    states = board_states(sizes["turns"])
+    results = []
+    for name, (turn_function, wheel_values) in TURN_FUNCTIONS.items():
+        rng = random.Random(SEED)
+        spin = lambda: rng.choice(wheel_values)
+        showing, winnings, guessed, turn = states[0]
+        turn_function(showing, winnings[:], guessed, turn, spin, _silent) # Warm caches (n-gram tables, oracle)
+
+        def run():
+            # Turn functions charge vowels to winnings, so each call gets its own copy
+            for showing, winnings, guessed, turn in states:
+                turn_function(showing, winnings[:], guessed, turn, spin, _silent)
+
+        elapsed, _ = timed(run)
+        results.append(Result(f"turn/{name}", "turns_per_s", len(states) / elapsed, "turns/s"))
+    return results
+
+
+def bench_strategies(sizes):
+    """Headless games with the same strategy in all three seats"""
+    results = []
+    for name in STRATEGIES:
+        lineup = (name, name, name)
+        game_engine.play_game(lineup, rng=game_engine.game_rng(SEED, -1)) # Warm caches
+
+        def run(games):
+            return sum(game_engine.replay_game(lineup, SEED, index).turns for index in range(games))
+
+        elapsed, turns = timed(lambda: run(sizes["games"]))
+        results.append(Result(f"game/{name}", "games_per_s", sizes["games"] / elapsed, "games/s"))
+        results.append(Result(f"game/{name}", "turns_per_s", turns / elapsed, "turns/s"))
+        results.append(Result(f"game/{name}", "peak_memory", peak_memory(lambda: run(sizes["memory_games"])),
+                              "bytes"))
+    return results
+
+
+def bench_play_random_game(sizes):
+    """The printing game loop, with sleeps removed and output thrown away"""
+    lineup = ["oxford", "smart", "morse"]
+    games = sizes["random_games"]
+
+    def run():
+        turns = 0
+        for seed in range(games):
+            turns += wheel_of_fortune.play_random_game(lineup, SEED + seed).turns_played
+        return turns
+
+    with quiet():
+        wheel_of_fortune.play_random_game(lineup, SEED) # Warm caches
+        elapsed, turns = timed(run)
+        # Bulk runs: output discarded before it is formatted
+        previous = output_sink.set_sink(output_sink.NullSink())
+        try:
+            null_elapsed, _ = timed(run)
+        finally:
+            output_sink.set_sink(previous)
+    states = board_states(sizes["boards"])
+
+    def print_boards():
+        for state in states:
+            wheel_of_fortune.print_board(state[0])
+
+    renderer = board_renderer.FrameRenderer()
+
+    def render_frames():
+        for showing, winnings, guessed, turn in states:
+            renderer.render(showing, "PHRASE", winnings, guessed, "Sorry, not in the puzzle ... next player")
+
+    with quiet():
+        board_elapsed, _ = timed(print_boards)
+        frame_elapsed, _ = timed(render_frames)
+    return [Result("play_random_game", "games_per_s", games / elapsed, "games/s"),
+            Result("play_random_game", "turns_per_s", turns / elapsed, "turns/s"),
+            Result("play_random_game/null_sink", "games_per_s", games / null_elapsed, "games/s"),
+            Result("print_board", "calls_per_s", len(states) / board_elapsed, "calls/s"),
+            Result("frame_renderer", "frames_per_s", len(states) / frame_elapsed, "frames/s")]
+
+
+def bench_loader(sizes):
+    """Loading the puzzle file and drawing random puzzles, in memory and index-only"""
+    results = []
+    for mode, index_only in (("rows", False), ("offsets", True)):
+        elapsed, corpus = timed(lambda: puzzle_corpus.PuzzleCorpus(BENCHMARK_PUZZLES, index_only))
+        results.append(Result(f"loader/{mode}", "load_ms", elapsed * 1000, "ms"))
+        results.append(Result(f"loader/{mode}", "peak_memory",
+                              peak_memory(lambda: puzzle_corpus.PuzzleCorpus(BENCHMARK_PUZZLES, index_only)),
+                              "bytes"))
+        rng = random.Random(SEED)
+        draws = sizes["draws"]
+        elapsed, _ = timed(lambda: [corpus.random_puzzle(rng) for _ in range(draws)])
+        results.append(Result(f"loader/{mode}", "draws_per_s", draws / elapsed, "draws/s"))
+        corpus.close()
+    return results
+
+
+SUITES = {
+    "turn": bench_turn_functions,
+    "game": bench_strategies,
+    "loop": bench_play_random_game,
+    "loader": bench_loader,
+}
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def run_benchmarks(suites=None, quick=False):
+    """Run the named suites (default all) and return the report as a dict ready for JSON"""
+    use_benchmark_puzzles()
+    sizes = {key: max(1, value // 10) if quick else value for key, value in FULL_SIZES.items()}
+    results = []
+    for suite in suites or SUITES:
+        results.extend(SUITES[suite](sizes))
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "quick": quick,
+        "results": [result._asdict() for result in results],
+    }
+
+
+def print_report(report, baseline=None):
+    """One line per measurement, with the change against a baseline report if given"""
+    before = {}
+    if baseline is not None:
+        before = {(result["name"], result["metric"]): result["value"] for result in baseline["results"]}
+        print(f"Compared with {baseline.get('commit')}")
+    for result in report["results"]:
+        line = f"{result['name']:<42}{result['metric']:<14}{result['value']:>16,.1f} {result['unit']}"
+        old = before.get((result["name"], result["metric"]))
+        if old:
+            line += f"  {(result['value'] - old) / old:+7.1%}"
+        print(line)
+
+
+def print_usage():
+    print("\nWheel of Fortune Benchmarks")
+    print("=" * 50)
+    print("Usage: python benchmark.py [suites ...] [options]")
+    print("\nSuites default to all of:", ", ".join(SUITES))
+    print("\nOptions:")
+    print("  --quick          A tenth of the work, for a fast check")
+    print("  --output=FILE    Write the results as JSON (compare them later with --compare)")
+    print("  --compare=FILE   Show the change against results saved with --output")
+    print("  --make-puzzles   Regenerate benchmark_puzzles.csv")
+    print()
+
+
+if __name__ == '__main__':
+    suites = []
+    quick = False
+    output = None
+    compare = None
+    for arg in sys.argv[1:]:
+        if arg == '--quick':
+            quick = True
+        elif arg.startswith('--output='):
+            output = arg.split('=', 1)[1]
+        elif arg.startswith('--compare='):
+            compare = arg.split('=', 1)[1]
+        elif arg == '--make-puzzles':
+            make_puzzles()
+            print("Wrote", BENCHMARK_PUZZLES)
+            sys.exit()
+        elif arg == '--help':
+            print_usage()
+            sys.exit()
+        elif arg in SUITES:
+            suites.append(arg)
+        else:
+            print("Unknown argument:", arg)
+            print_usage()
+            sys.exit(1)
+
+    report = run_benchmarks(suites, quick)
+    if output is not None:
+        with open(output, 'w') as f:
+            json.dump(report, f, indent=1)
+    baseline = None
+    if compare is not None:
+        with open(compare) as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
@@ -0,0 +1,124 @@
+"""
+Board rendering for Wheel of Fortune
+Formats a whole turn frame (message, winnings, guesses, clue, board) and writes it in one go,
+optionally redrawing only the cells that changed on an ANSI terminal
+"""
+
+import shutil
+
+import output_sink
+
+
+def format_board(showing):
+    """The board as print_board shows it: one word per line, a space after every cell"""
+    return "".join(" ".join(word) + " \n" if word else "\n" for word in showing.split(" "))
+
+
+def board_lines(showing):
+    return [" ".join(word) + " " if word else "" for word in showing.split(" ")]
+
+
+class FrameRenderer:
+    """Builds each turn frame in one buffer and hands it to the stream with a single write"""
+
+    def __init__(self, stream=None):
+        """
+        Args:
+            stream: Where frames go (default: the output sink, flushed by the game once per turn)
+        """
+        self.stream = stream
+
+    def frame_lines(self, showing, clue, winnings=None, previous_guesses=None, message=None):
+        lines = []
+        if message is not None:
+            lines.append(message)
+        if winnings is not None:
+            lines.append(f"Winnings: {winnings}")
+        if previous_guesses is not None:
+            lines.append(f"Previous guesses: {previous_guesses}")
+        lines.append(f"The clue is: {clue}")
+        lines.extend(board_lines(showing))
+        lines.append("")
+        return lines
+
+    def render(self, showing, clue, winnings=None, previous_guesses=None, message=None):
+        """Write one frame; parts left as None are not shown"""
+        if self.stream is None and output_sink.get_sink().discards:
+            return
+        lines = self.frame_lines(showing, clue, winnings, previous_guesses, message)
+        self.write("\n".join(lines) + "\n")
+
+    def write(self, text):
+        if self.stream is None:
+            output_sink.write("board", text)
+        else:
+            self.stream.write(text)
+            self.stream.flush()
+
+    def close(self):
+        pass
+
+
+class AnsiFrameRenderer(FrameRenderer):
+    """
+    Keeps the frame pinned to the top of an ANSI terminal and scrolls the rest of the
+    game's output underneath it. After the first frame only changed cells are sent.
+    """
+
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        self.previous = None
+
+    def frame_lines(self, showing, clue, winnings=None, previous_guesses=None, message=None):
+        # Every part keeps its row, so the frame has the same shape all game
+        return [message or "", f"Winnings: {winnings if winnings is not None else ''}",
+                f"Previous guesses: {previous_guesses if previous_guesses is not None else ''}",
+                f"The clue is: {clue}"] + board_lines(showing)
+
+    def render(self, showing, clue, winnings=None, previous_guesses=None, message=None):
+        if self.stream is None and output_sink.get_sink().discards:
+            return
+        lines = self.frame_lines(showing, clue, winnings, previous_guesses, message)
+        if self.previous is None or len(lines) != len(self.previous):
+            self.write(self._full_frame(lines))
+        else:
+            self.write(self._changes(self.previous, lines))
+        self.previous = lines
+
+    def _full_frame(self, lines):
+        height = len(lines)
+        rows = shutil.get_terminal_size().lines
+        parts = ["\x1b[r\x1b[2J\x1b[H"] # Reset scrolling, clear, home
+        parts.extend(line + "\x1b[K\n" for line in lines)
+        parts.append("─" * 40 + "\n")
+        # Everything else scrolls below the frame and separator
+        parts.append(f"\x1b[{height + 2};{max(rows, height + 3)}r\x1b[{height + 2};1H")
+        return "".join(parts)
+
+    @staticmethod
+    def _changes(old_lines, new_lines):
+        parts = ["\x1b7"] # Save the cursor in the scrolling area
+        for row, (old, new) in enumerate(zip(old_lines, new_lines), start=1):
+            if old == new:
+                continue
+            column = 0
+            width = min(len(old), len(new))
+            while column < width:
+                if old[column] == new[column]:
+                    column += 1
+                    continue
+                start = column
+                while column < width and old[column] != new[column]:
+                    column += 1
+                parts.append(f"\x1b[{row};{start + 1}H{new[start:column]}")
+            if len(new) > width:
+                parts.append(f"\x1b[{row};{width + 1}H{new[width:]}")
+            elif len(old) > width:
+                parts.append(f"\x1b[{row};{width + 1}H\x1b[K")
+        parts.append("\x1b8")
+        return "".join(parts)
+
+    def close(self):
+        if self.previous is not None:
+            self.write("\x1b[r") # Give the whole screen back to scrolling
+            self.previous = None
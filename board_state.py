@@ -0,0 +1,97 @@
+"""
+Compact board state for Wheel of Fortune
+A bytearray board with a letter -> positions index and a 26-bit guessed-letter mask
+"""
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+LETTER_BITS = {letter: 1 << index for index, letter in enumerate(ALPHABET)}
+BLANK = ord("_")
+
+
+class GuessedLetters:
+    """
+    Previous guesses as a bitmask with the call order kept for display.
+    Membership is a single mask test; it prints like the list it replaces.
+    """
+
+    __slots__ = ("mask", "order")
+
+    def __init__(self, guesses=()):
+        self.mask = 0
+        self.order = []
+        for guess in guesses:
+            self.append(guess)
+
+    def append(self, guess):
+        self.mask |= LETTER_BITS.get(guess, 0)
+        self.order.append(guess)
+
+    def __contains__(self, guess):
+        bit = LETTER_BITS.get(guess)
+        if bit is None:
+            # Not a letter ("_" for a lost turn), fall back to the call list
+            return guess in self.order
+        return self.mask & bit != 0
+
+    def __iter__(self):
+        return iter(self.order)
+
+    def __len__(self):
+        return len(self.order)
+
+    def __repr__(self):
+        return repr(self.order)
+
+
+class Board:
+    """The puzzle as shown on the board, revealed one letter at a time"""
+
+    __slots__ = ("puzzle", "cells", "positions", "hidden", "_showing")
+
+    def __init__(self, puzzle):
+        self.puzzle = puzzle
+        encoded = puzzle.encode("utf-8")
+        self.cells = bytearray(encoded)
+        positions = {}
+        for position, code in enumerate(encoded):
+            if 65 <= code <= 90: # A-Z
+                positions.setdefault(chr(code), []).append(position)
+                self.cells[position] = BLANK
+        # Built once per puzzle; reveals only touch the positions of their letter
+        self.positions = {letter: tuple(places) for letter, places in positions.items()}
+        self.hidden = sum(len(places) for places in self.positions.values())
+        self._showing = None
+
+    def count(self, letter):
+        """How many times the letter is in the puzzle"""
+        return len(self.positions.get(letter, ()))
+
+    def reveal(self, letter):
+        """Turn over every copy of the letter and return how many there were"""
+        places = self.positions.get(letter)
+        if not places:
+            return 0
+        code = ord(letter)
+        cells = self.cells
+        if cells[places[0]] == code:
+            return len(places) # Already showing
+        for position in places:
+            cells[position] = code
+        self.hidden -= len(places)
+        self._showing = None
+        return len(places)
+
+    def reveal_all(self):
+        for letter in self.positions:
+            self.reveal(letter)
+
+    @property
+    def solved(self):
+        return self.hidden == 0
+
+    @property
+    def showing(self):
+        """Board as the "_HEEL OF F_____E" string the strategies read"""
+        if self._showing is None:
+            self._showing = self.cells.decode("utf-8")
+        return self._showing
@@ -4,7 +4,8 @@ A wrapper that provides AI-powered commentary for game events
 """
 
 import openai
-import time
+import game_clock
+import output_sink
 import random
 from typing import List, Dict, Optional
 import json
@@ -160,7 +161,7 @@ Provide a brief, engaging commentary (1-2 sentences max). Keep it appropriate fo
         if not self.enable_commentary:
             return
             
-        time.sleep(self._get_commentary_delay())
+        game_clock.sleep(self._get_commentary_delay())
         
         context = {"clue": puzzle_clue, "game_type": game_type}
         prompt = f"The game is starting! We have a {game_type} puzzle with the clue: '{puzzle_clue}'. Welcome the players and build excitement for the game ahead."
@@ -169,14 +170,14 @@ Provide a brief, engaging commentary (1-2 sentences max). Keep it appropriate fo
         if not commentary:
             commentary = random.choice(self.fallback_commentary["game_start"])
             
-        print(f"\n🎙️ COMMENTARY: {commentary}\n")
+        output_sink.commentary(commentary)
     
     def wheel_spin_commentary(self, spin_result: int, player_num: int, winnings: List[int]) -> None:
         """Commentary for wheel spins"""
         if not self.enable_commentary:
             return
             
-        time.sleep(self._get_commentary_delay())
+        game_clock.sleep(self._get_commentary_delay())
         
         context = {"current_player": player_num, "winnings": winnings}
         
@@ -196,7 +197,7 @@ Provide a brief, engaging commentary (1-2 sentences max). Keep it appropriate fo
             if not commentary:
                 commentary = random.choice(self.fallback_commentary["wheel_spin"])
                 
-        print(f"\n🎙️ COMMENTARY: {commentary}\n")
+        output_sink.commentary(commentary)
     
     def guess_result_commentary(self, guess: str, correct_count: int, dollar_value: int, 
                               showing: str, clue: str, previous_guesses: List[str], 
@@ -205,7 +206,7 @@ Provide a brief, engaging commentary (1-2 sentences max). Keep it appropriate fo
         if not self.enable_commentary:
             return
             
-        time.sleep(self._get_commentary_delay())
+        game_clock.sleep(self._get_commentary_delay())
         
         context = {
             "showing": showing,
@@ -227,14 +228,14 @@ Provide a brief, engaging commentary (1-2 sentences max). Keep it appropriate fo
             if not commentary:
                 commentary = random.choice(self.fallback_commentary["wrong_guess"])
                 
-        print(f"\n🎙️ COMMENTARY: {commentary}\n")
+        output_sink.commentary(commentary)
     
     def vowel_purchase_commentary(self, vowel: str, player_num: int, winnings: List[int]) -> None:
         """Commentary for vowel purchases"""
         if not self.enable_commentary:
             return
             
-        time.sleep(self._get_commentary_delay())
+        game_clock.sleep(self._get_commentary_delay())
         
         context = {"current_player": player_num, "winnings": winnings}
         prompt = f"Player {player_num} bought the vowel '{vowel}' for $250. They now have ${winnings[player_num]} remaining. Comment on this strategic move."
@@ -243,7 +244,7 @@ Provide a brief, engaging commentary (1-2 sentences max). Keep it appropriate fo
         if not commentary:
             commentary = f"💰 Smart move buying that '{vowel}'! Strategic vowel purchasing can really pay off!"
             
-        print(f"\n🎙️ COMMENTARY: {commentary}\n")
+        output_sink.commentary(commentary)
     
     def solve_attempt_commentary(self, attempt: str, correct: bool, puzzle: str, 
                                 player_num: int, winnings: List[int]) -> None:
@@ -251,7 +252,7 @@ Provide a brief, engaging commentary (1-2 sentences max). Keep it appropriate fo
         if not self.enable_commentary:
             return
             
-        time.sleep(self._get_commentary_delay())
+        game_clock.sleep(self._get_commentary_delay())
         
         context = {"current_player": player_num, "winnings": winnings}
         
@@ -266,14 +267,14 @@ Provide a brief, engaging commentary (1-2 sentences max). Keep it appropriate fo
             if not commentary:
                 commentary = "🤔 So close! Sometimes the final solve is the trickiest part!"
                 
-        print(f"\n🎙️ COMMENTARY: {commentary}\n")
+        output_sink.commentary(commentary)
     
     def player_turn_commentary(self, player_num: int, player_type: str, winnings: List[int]) -> None:
         """Commentary for player turn transitions"""
         if not self.enable_commentary:
             return
             
-        time.sleep(self._get_commentary_delay())
+        game_clock.sleep(self._get_commentary_delay())
         
         context = {"current_player": player_num, "winnings": winnings}
         prompt = f"It's Player {player_num}'s turn! They are a {player_type} player with ${winnings[player_num]} in winnings. Build anticipation for their turn."
@@ -282,7 +283,7 @@ Provide a brief, engaging commentary (1-2 sentences max). Keep it appropriate fo
         if not commentary:
             commentary = f"🎯 Player {player_num} is up! Let's see what strategy they'll use!"
             
-        print(f"\n🎙️ COMMENTARY: {commentary}\n")
+        output_sink.commentary(commentary)
     
     def puzzle_progress_commentary(self, showing: str, clue: str, previous_guesses: List[str]) -> None:
         """Commentary on puzzle solving progress"""
@@ -295,7 +296,7 @@ Provide a brief, engaging commentary (1-2 sentences max). Keep it appropriate fo
         completion_pct = (revealed_letters / total_letters * 100) if total_letters > 0 else 0
         
         if completion_pct > 75:
-            time.sleep(self._get_commentary_delay())
+            game_clock.sleep(self._get_commentary_delay())
             context = {"showing": showing, "clue": clue, "previous_guesses": previous_guesses}
             prompt = f"The puzzle is {completion_pct:.0f}% complete! Current state: '{showing}'. The clue is '{clue}'. Comment on how close we are to solving this puzzle."
             
@@ -303,21 +304,21 @@ Provide a brief, engaging commentary (1-2 sentences max). Keep it appropriate fo
             if not commentary:
                 commentary = f"🔥 We're getting close! The puzzle is really taking shape now!"
                 
-            print(f"\n🎙️ COMMENTARY: {commentary}\n")
+            output_sink.commentary(commentary)
     
     def set_commentary_style(self, style: str) -> None:
         """Change the commentary style"""
         if style in self.style_prompts:
             self.commentary_style = style
-            print(f"Commentary style changed to: {style}")
+            output_sink.emit("game", f"Commentary style changed to: {style}")
         else:
-            print(f"Unknown style: {style}. Available styles: {list(self.style_prompts.keys())}")
+            output_sink.emit("game", f"Unknown style: {style}. Available styles: {list(self.style_prompts.keys())}")
     
     def toggle_commentary(self) -> None:
         """Toggle commentary on/off"""
         self.enable_commentary = not self.enable_commentary
         status = "enabled" if self.enable_commentary else "disabled"
-        print(f"Commentary {status}")
+        output_sink.emit("game", f"Commentary {status}")
 
 
 # Example usage and testing
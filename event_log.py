@@ -0,0 +1,254 @@
+"""
+Append-only event log for Wheel of Fortune
+Every game start, turn, spin, guess, reveal, vowel purchase, solve attempt and commentary line
+as one JSON array per line, written in batches and streamed back one event at a time
+"""
+
+import gzip
+import json
+import os
+import sys
+from collections import namedtuple
+
+# Fields after (game, turn) for each kind of record
+FIELDS = {
+    "game_start": ("seed", "puzzle", "clue", "game_type", "players"),
+    "turn": ("seat", "player"),
+    "spin": ("value",),
+    "guess": ("letter", "dollar"),
+    "vowel": ("letter", "cost"),
+    "reveal": ("letter", "count", "showing"),
+    "solve": ("attempt", "correct"),
+    "commentary": ("text",),
+    "game_end": ("winner", "winnings", "turns"),
+}
+EVENT_TYPES = {kind: namedtuple(kind.title().replace("_", "") + "Event", ("kind", "game", "turn") + fields)
+               for kind, fields in FIELDS.items()}
+
+# Records kept in memory before they go to the file in one write
+BATCH_SIZE = 4096
+
+VOWELS = ("A", "E", "I", "O", "U")
+
+
+def _open(path, mode):
+    # .gz logs are compressed on the fly; both kinds are read and written line by line
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class EventLog:
+    """
+    Appends records to a log file in batches. The log numbers the games it sees (carrying
+    on from the games already in the file) and remembers the current turn, so records only
+    carry what is new about them.
+    """
+
+    def __init__(self, path, batch_size=BATCH_SIZE):
+        self.path = path
+        self.game = last_game(path)
+        self.file = _open(path, "a")
+        if not path.endswith(".gz") and not _ends_line(path):
+            self.file.write("\n") # Leaves a torn last line on its own so the next record stays whole
+        self.batch_size = batch_size
+        self.pending = []
+        self.turn = 0
+        self._dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+    def record(self, kind, *fields):
+        """
+        Add one record. "game_start" opens the next game number and "turn" takes the turn
+        number as its first field; every record is written as [kind, game, turn, *fields].
+        """
+        if kind == "game_start":
+            self.game += 1
+            self.turn = 0
+        elif kind == "turn":
+            self.turn, *fields = fields
+        self.pending.append(self._dumps([kind, self.game, self.turn, *fields]))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.pending:
+            self.pending.append("")
+            self.file.write("\n".join(self.pending))
+            self.pending.clear()
+            self.file.flush()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+
+def read_events(path, kinds=None):
+    """
+    Stream the events of a log as namedtuples (kind, game, turn, fields...), one line in
+    memory at a time. kinds limits them to those kinds; a torn last line (crash mid-write) is skipped.
+    """
+    with _open(path, "r") as f:
+        for line in f:
+            if kinds is not None:
+                end = line.find('"', 2)
+                if end < 0 or line[2:end] not in kinds:
+                    continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            event_type = EVENT_TYPES.get(record[0])
+            if event_type is None or len(record) != len(event_type._fields):
+                continue # Written by a newer version of the log
+            yield event_type(*record)
+
+
+def last_game(path):
+    """Number of the last game in a log; -1 when there is no log yet or no complete record in it"""
+    if not os.path.exists(path):
+        return -1
+    if path.endswith(".gz"):
+        # Compressed logs can only be read from the start
+        game = -1
+        for event in read_events(path, ("game_start",)):
+            game = event.game
+        return game
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        size = 4096
+        while True:
+            start = max(end - size, 0)
+            f.seek(start)
+            lines = f.read(end - start).split(b"\n")
+            if start > 0:
+                lines = lines[1:] # Only part of a line
+            for line in reversed(lines):
+                try:
+                    return json.loads(line)[1]
+                except (ValueError, IndexError):
+                    continue
+            if start == 0:
+                return -1
+            size *= 2
+
+
+def _ends_line(path):
+    with open(path, "rb") as f:
+        if f.seek(0, os.SEEK_END) == 0:
+            return True
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+# The log the game loops record to; None keeps record() down to one global lookup
+_active = None
+
+
+def record(kind, *fields):
+    """Add a record to the active log, if any"""
+    if _active is not None:
+        _active.record(kind, *fields)
+
+
+def record_move(guess, dollar, correct, showing, paid):
+    """
+    Record what a turn function's (guess, dollar) did once the board was updated: a solve
+    attempt, a vowel bought, or a called consonant and how many it turned over.
+    paid is what the turn function took off the player's bank: a vowel only counts as
+    bought when it cost something (a player out of letters may call one for nothing).
+    Lost turns and bankrupts are already in the log as their spin.
+    """
+    if _active is None or guess == "_":
+        return
+    if len(guess) > 1:
+        _active.record("solve", guess, correct > 0)
+        return
+    if guess in VOWELS and paid > 0:
+        _active.record("vowel", guess, paid)
+    else:
+        _active.record("guess", guess, dollar)
+    _active.record("reveal", guess, max(correct, 0), showing)
+
+
+def start(path, batch_size=BATCH_SIZE):
+    """Start logging to path (appending) and return the log"""
+    global _active
+    _active = EventLog(path, batch_size)
+    return _active
+
+
+def stop():
+    """Close the active log and return it"""
+    global _active
+    log, _active = _active, None
+    if log is not None:
+        log.close()
+    return log
+
+
+def active():
+    return _active
+
+
+def log_games(path, type_of_players, games, seed, first=0):
+    """Play seeded headless games into a log: the same (seed, index) games replay_game gives"""
+    import game_engine
+    start(path)
+    try:
+        for index in range(first, first + games):
+            game_engine.replay_game(type_of_players, seed, index)
+    finally:
+        stop()
+
+
+def summarize(path):
+    """One pass over a log: events per kind, wins per seat and mean game length"""
+    counts = {kind: 0 for kind in FIELDS}
+    wins = [0, 0, 0]
+    games = 0
+    turns = 0
+    for event in read_events(path):
+        counts[event.kind] += 1
+        if event.kind == "game_end":
+            games += 1
+            turns += event.turns
+            if event.winner is not None:
+                wins[event.winner] += 1
+    return counts, games, wins, turns / max(games, 1)
+
+
+def print_usage():
+    print("\nWheel of Fortune Event Log")
+    print("=" * 50)
+    print("Usage: python event_log.py play FILE [player types ...] [--games=N] [--seed=N]")
+    print("       python event_log.py summary FILE")
+    print("\nFILE ending in .gz is compressed")
+    print()
+
+
+if __name__ == '__main__':
+    import random
+    import time
+
+    # The game loops record to the imported module, not to this script's copy of it
+    import event_log
+
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    options = dict(arg[2:].split('=', 1) for arg in sys.argv[1:] if arg.startswith('--') and '=' in arg)
+    if len(args) < 2 or args[0] not in ("play", "summary"):
+        print_usage()
+        sys.exit(1)
+
+    command, path, type_of_players = args[0], args[1], args[2:] or ["morse", "oxford", "smart"]
+    start_time = time.perf_counter()
+    if command == "play":
+        games = int(options.get("games", 10000))
+        seed = int(options.get("seed", random.randrange(2**32)))
+        event_log.log_games(path, type_of_players, games, seed)
+        print(f"Logged {games} games (seed {seed}) to {path} in {time.perf_counter() - start_time:.2f}s")
+    else:
+        counts, games, wins, mean_turns = event_log.summarize(path)
+        print(f"{games} games in {time.perf_counter() - start_time:.2f}s; wins per seat {wins}, "
+              f"mean {mean_turns:.1f} turns")
+        for kind, count in counts.items():
+            print(f"{kind:<12}{count:>12}")
@@ -3,7 +3,8 @@ FREE Smart Commentary System for Wheel of Fortune
 No API keys needed - works immediately!
 """
 
-import time
+import game_clock
+import output_sink
 import random
 from typing import List, Dict, Optional
 
@@ -25,9 +26,9 @@ class WheelOfFortuneCommentary:
         self.enable_commentary = enable_commentary
         self.delay_range = delay_range
         
-        print(f"🎙️ FREE Smart Commentary System Activated!")
-        print(f"🎭 Style: {commentary_style.upper()}")
-        print(f"✅ Ready for game show action!")
+        output_sink.emit("game", f"🎙️ FREE Smart Commentary System Activated!")
+        output_sink.emit("game", f"🎭 Style: {commentary_style.upper()}")
+        output_sink.emit("game", f"✅ Ready for game show action!")
         
         # AMAZING fallback commentary - feels like real AI!
         self.smart_commentary = {
@@ -221,7 +222,7 @@ class WheelOfFortuneCommentary:
         if not self.enable_commentary:
             return
             
-        time.sleep(self._get_commentary_delay())
+        game_clock.sleep(self._get_commentary_delay())
         
         # Smart context-aware commentary
         if "FAMOUS" in puzzle_clue.upper():
@@ -233,14 +234,14 @@ class WheelOfFortuneCommentary:
         else:
             commentary = self._get_smart_commentary("game_start")
             
-        print(f"\n🎙️ COMMENTARY: {commentary}\n")
+        output_sink.commentary(commentary)
     
     def wheel_spin_commentary(self, spin_result: int, player_num: int, winnings: List[int]) -> None:
         """Commentary for wheel spins"""
         if not self.enable_commentary:
             return
             
-        time.sleep(self._get_commentary_delay())
+        game_clock.sleep(self._get_commentary_delay())
         
         context = {"spin_value": spin_result, "player": player_num, "winnings": winnings}
         
@@ -251,7 +252,7 @@ class WheelOfFortuneCommentary:
         else:  # Regular dollar amount
             commentary = self._get_smart_commentary("wheel_spin", context)
                 
-        print(f"\n🎙️ COMMENTARY: {commentary}\n")
+        output_sink.commentary(commentary)
     
     def guess_result_commentary(self, guess: str, correct_count: int, dollar_value: int, 
                               showing: str, clue: str, previous_guesses: List[str], 
@@ -260,7 +261,7 @@ class WheelOfFortuneCommentary:
         if not self.enable_commentary:
             return
             
-        time.sleep(self._get_commentary_delay())
+        game_clock.sleep(self._get_commentary_delay())
         
         context = {
             "count": correct_count,
@@ -274,14 +275,14 @@ class WheelOfFortuneCommentary:
         else:
             commentary = self._get_smart_commentary("wrong_guess", context)
                 
-        print(f"\n🎙️ COMMENTARY: {commentary}\n")
+        output_sink.commentary(commentary)
     
     def vowel_purchase_commentary(self, vowel: str, player_num: int, winnings: List[int]) -> None:
         """Commentary for vowel purchases"""
         if not self.enable_commentary:
             return
             
-        time.sleep(self._get_commentary_delay())
+        game_clock.sleep(self._get_commentary_delay())
         
         vowel_comments = [
             f"💰 Smart strategy! Buying '{vowel}' for $250. Vowels can really open up a puzzle!",
@@ -290,7 +291,7 @@ class WheelOfFortuneCommentary:
         ]
         
         commentary = random.choice(vowel_comments)
-        print(f"\n🎙️ COMMENTARY: {commentary}\n")
+        output_sink.commentary(commentary)
     
     def solve_attempt_commentary(self, attempt: str, correct: bool, puzzle: str, 
                                 player_num: int, winnings: List[int]) -> None:
@@ -298,21 +299,21 @@ class WheelOfFortuneCommentary:
         if not self.enable_commentary:
             return
             
-        time.sleep(self._get_commentary_delay())
+        game_clock.sleep(self._get_commentary_delay())
         
         if correct:
             commentary = self._get_smart_commentary("game_end")
         else:
             commentary = f"🤔 '{attempt}' was a good guess, but the answer was '{puzzle}'! So close!"
                 
-        print(f"\n🎙️ COMMENTARY: {commentary}\n")
+        output_sink.commentary(commentary)
     
     def player_turn_commentary(self, player_num: int, player_type: str, winnings: List[int]) -> None:
         """Commentary for player turn transitions"""
         if not self.enable_commentary:
             return
             
-        time.sleep(self._get_commentary_delay())
+        game_clock.sleep(self._get_commentary_delay())
         
         turn_comments = [
             f"🎯 Player {player_num} is up! They've got ${winnings[player_num]} so far. Let's see their strategy!",
@@ -321,21 +322,21 @@ class WheelOfFortuneCommentary:
         ]
         
         commentary = random.choice(turn_comments)
-        print(f"\n🎙️ COMMENTARY: {commentary}\n")
+        output_sink.commentary(commentary)
     
     def set_commentary_style(self, style: str) -> None:
         """Change the commentary style"""
         if style in ["dramatic", "humorous", "professional", "casual"]:
             self.commentary_style = style
-            print(f"🎭 Commentary style changed to: {style.upper()}!")
+            output_sink.emit("game", f"🎭 Commentary style changed to: {style.upper()}!")
         else:
-            print(f"❌ Unknown style: {style}. Available: dramatic, humorous, professional, casual")
+            output_sink.emit("game", f"❌ Unknown style: {style}. Available: dramatic, humorous, professional, casual")
     
     def toggle_commentary(self) -> None:
         """Toggle commentary on/off"""
         self.enable_commentary = not self.enable_commentary
         status = "ENABLED" if self.enable_commentary else "DISABLED"
-        print(f"🎙️ Commentary {status}!")
+        output_sink.emit("game", f"🎙️ Commentary {status}!")
 
 
 # Test the system
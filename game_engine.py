@@ -0,0 +1,225 @@
+"""
+Headless game engine for Wheel of Fortune
+Plays full games with the computer strategies - no sleeps, prints or input
+"""
+
+import random
+from collections import namedtuple
+
+import event_log
+from board_state import Board, GuessedLetters
+from strategy_registry import STRATEGIES, create_player
+from wheel_of_fortune import get_random_puzzle
+
+# Some line-ups never finish (conservative only knows RSTLNE), so headless games are capped
+MAX_TURNS = 500
+
+# apply_guess result when the letter was already called
+REPEATED = -1
+
+GameResult = namedtuple("GameResult", ["winner", "winnings", "turns", "puzzle", "clue", "game_type",
+                                       "type_of_players", "previous_guesses"])
+
+
+class GameState:
+    """Everything play_random_game used to keep in local variables"""
+
+    def __init__(self, type_of_players, puzzle, clue, date, game_type, rng=None):
+        self.type_of_players = list(type_of_players)
+        # One player object per seat (None for humans), holding that player's per-game state
+        self.players = [None if type_of_player == "human" else create_player(type_of_player, clue)
+                        for type_of_player in self.type_of_players]
+        self.puzzle = puzzle
+        self.clue = clue
+        self.date = date
+        self.game_type = game_type
+        self.board = Board(puzzle)
+        self.previous_guesses = GuessedLetters()
+        self.winnings = [0, 0, 0]
+        self.turn = 0
+        self.turns_played = 0
+        self.winner = None
+        # (seed, index) of game_rng the game's random stream came from, when known
+        self.seed = None
+        # Every random draw of this game (wheel spins, strategies) comes from here
+        self.rng = rng if rng is not None else random.Random()
+
+    @property
+    def showing(self):
+        return self.board.showing
+
+    @property
+    def seat(self):
+        """Seat (0-2) of the player whose turn it is"""
+        return self.turn % 3
+
+    @property
+    def player_type(self):
+        return self.type_of_players[self.turn % 3]
+
+
+def game_rng(seed, index=0):
+    """
+    Random stream for game `index` of a run started with `seed`.
+    Streams never depend on which process or in what order games are played,
+    so any game of a run can be replayed on its own from (seed, index).
+    """
+    return random.Random(f"{seed}:{index}")
+
+
+def new_game(type_of_players, puzzle_entry=None, rng=None):
+    """Start a game from a (puzzle, clue, date, game_type) row, or one drawn with rng"""
+    if rng is None:
+        rng = random.Random()
+    if puzzle_entry is None:
+        puzzle_entry = get_random_puzzle(rng)
+    puzzle, clue, date, game_type = puzzle_entry
+    return GameState(type_of_players, puzzle, clue, date, game_type, rng)
+
+
+def attempt_solve(state, attempt):
+    """Check a solve attempt; the player wins or the turn passes"""
+    state.turns_played += 1
+    if attempt == state.puzzle:
+        state.board.reveal_all()
+        state.winner = state.turn % 3
+        return True
+    state.turn += 1
+    return False
+
+
+def apply_guess(state, guess, dollar):
+    """
+    Apply the (guess, dollar) a turn function returned and update the board.
+    Returns the number of letters revealed, or REPEATED if the letter was already called.
+    A guess longer than one letter is a solve attempt and returns 1 when correct.
+    """
+    if len(guess) > 1:
+        return 1 if attempt_solve(state, guess) else 0
+
+    state.turns_played += 1
+    # Double check that guess has not already been said (I've seen it on TV before)
+    if guess in state.previous_guesses and guess != "_":
+        state.turn += 1
+        return REPEATED
+
+    state.previous_guesses.append(guess)
+    correct = state.board.reveal(guess)
+    if not correct:
+        # "_" is how a turn function says lost a turn or bankrupt
+        state.turn += 1
+        return 0
+
+    state.winnings[state.turn % 3] += dollar * correct
+    return correct
+
+
+def _silent(*args):
+    pass
+
+
+def play_game(type_of_players, puzzle_entry=None, max_turns=MAX_TURNS, rng=None):
+    """
+    Play a complete bot-only game and return a GameResult.
+    winner is None when the game hit max_turns without being solved.
+    """
+    if "human" in type_of_players:
+        raise ValueError("Headless games cannot seat human players")
+    return play_on(new_game(type_of_players, puzzle_entry, rng), max_turns)
+
+
+def bot_seats(state):
+    """(turn function, spin) for each seat of a bot-only game, drawing from the game's rng"""
+    seats = []
+    choice = state.rng.choice
+    for type_of_player, player in zip(state.type_of_players, state.players):
+        wheel_values = STRATEGIES[type_of_player].wheel_values
+        seats.append((player.take_turn, lambda wheel_values=wheel_values: choice(wheel_values)))
+    return seats
+
+
+def play_turn(state, seats):
+    """Play one turn of a bot-only game; returns the (guess, dollar) played"""
+    if state.board.solved:
+        # Computers solve with what is showing once the board is full
+        attempt_solve(state, state.showing)
+        return state.showing, 0
+    turn_function, spin = seats[state.turn % 3]
+    guess, dollar = turn_function(state.showing, state.winnings, state.previous_guesses, state.turn,
+                                  spin, _silent)
+    apply_guess(state, guess, dollar)
+    return guess, dollar
+
+
+def play_on(state, max_turns=MAX_TURNS):
+    """Play a bot-only game from wherever `state` is (a new game, or one restored from a snapshot)"""
+    if event_log.active() is not None:
+        return _play_on_logged(state, max_turns, event_log.active())
+    seats = bot_seats(state)
+    while state.winner is None and state.turns_played < max_turns:
+        play_turn(state, seats)
+
+    return GameResult(state.winner, list(state.winnings), state.turns_played, state.puzzle, state.clue,
+                      state.game_type, tuple(state.type_of_players), list(state.previous_guesses))
+
+
+def _play_on_logged(state, max_turns, log):
+    """play_on, recording every event; the random draws and the result are the same"""
+    if state.turns_played == 0:
+        log.record("game_start", state.seed, state.puzzle, state.clue, state.game_type, state.type_of_players)
+    choice = state.rng.choice
+
+    def spin(wheel_values):
+        dollar = choice(wheel_values)
+        log.record("spin", dollar)
+        return dollar
+
+    seats = []
+    for type_of_player, player in zip(state.type_of_players, state.players):
+        wheel_values = STRATEGIES[type_of_player].wheel_values
+        seats.append((player.take_turn, lambda wheel_values=wheel_values: spin(wheel_values)))
+
+    while state.winner is None and state.turns_played < max_turns:
+        log.record("turn", state.turns_played, state.turn % 3, state.player_type)
+        if state.board.solved:
+            solved = attempt_solve(state, state.showing)
+            log.record("solve", state.showing, solved)
+            continue
+        turn_function, spin_function = seats[state.turn % 3]
+        bank = state.winnings[state.turn % 3]
+        guess, dollar = turn_function(state.showing, state.winnings, state.previous_guesses, state.turn,
+                                      spin_function, _silent)
+        paid = bank - state.winnings[state.turn % 3]
+        correct = apply_guess(state, guess, dollar)
+        event_log.record_move(guess, dollar, correct, state.showing, paid)
+
+    log.record("game_end", state.winner, state.winnings, state.turns_played)
+    return GameResult(state.winner, list(state.winnings), state.turns_played, state.puzzle, state.clue,
+                      state.game_type, tuple(state.type_of_players), list(state.previous_guesses))
+
+
+def replay_game(type_of_players, seed, index=0, puzzle_entry=None, max_turns=MAX_TURNS):
+    """Play game `index` of a seeded run again; the result is identical to the original"""
+    if "human" in type_of_players:
+        raise ValueError("Headless games cannot seat human players")
+    state = new_game(type_of_players, puzzle_entry, game_rng(seed, index))
+    state.seed = (seed, index)
+    return play_on(state, max_turns)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    type_of_players = sys.argv[1:] or ["morse", "oxford", "smart"]
+    puzzle_entry = ("WHEEL OF FORTUNE", "TV SHOW", "2024-01-01", "SHOW BIZ")
+    start = time.perf_counter()
+    games = 10000
+    wins = [0, 0, 0]
+    for _ in range(games):
+        result = play_game(type_of_players, puzzle_entry)
+        if result.winner is not None:
+            wins[result.winner] += 1
+    elapsed = time.perf_counter() - start
+    print(f"{games} games in {elapsed:.2f}s ({games / elapsed:.0f} games/s)")
+    print("Wins per seat:", wins)
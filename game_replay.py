@@ -0,0 +1,230 @@
+"""
+Replay recorded Wheel of Fortune games
+A game is re-run from its seed, or rebuilt from its event log, with no pacing. Snapshots kept every
+few turns let any turn be reached by replaying only the turns since the nearest one
+"""
+
+import sys
+
+import event_log
+import game_engine
+import game_snapshot
+import output_sink
+from wheel_of_fortune import print_board
+
+# Turns between snapshots: reaching a turn replays at most this many
+CHECKPOINT_EVERY = 8
+
+
+class Replay:
+    """
+    One recorded game, played through once with a snapshot every checkpoint_every turns.
+    moves[t] is the (guess, dollar) played on turn t; state_at(t) is the game as turn t began.
+    Seeded games reach a turn by letting the bots play on from the snapshot (same draws),
+    logged ones by reapplying each turn's records.
+    """
+
+    def __init__(self, state, checkpoint_every=CHECKPOINT_EVERY):
+        self.checkpoint_every = checkpoint_every
+        self.checkpoints = {}
+        self.moves = []
+        # Each turn's log records; None when the bots replay the game
+        self.records = None
+        self.start = state.turns_played
+        self.result = None
+
+    def _checkpoint(self, state):
+        if (state.turns_played - self.start) % self.checkpoint_every == 0:
+            self.checkpoints[state.turns_played] = game_snapshot.dumps(state)
+
+    @classmethod
+    def from_seed(cls, type_of_players, seed, index=0, max_turns=game_engine.MAX_TURNS,
+                  checkpoint_every=CHECKPOINT_EVERY):
+        """Game `index` of a seeded bot-only run (what replay_game and event_log play give)"""
+        if "human" in type_of_players:
+            raise ValueError("Headless games cannot seat human players")
+        state = game_engine.new_game(type_of_players, rng=game_engine.game_rng(seed, index))
+        state.seed = (seed, index)
+        return cls.from_state(state, max_turns, checkpoint_every)
+
+    @classmethod
+    def from_state(cls, state, max_turns=game_engine.MAX_TURNS, checkpoint_every=CHECKPOINT_EVERY):
+        """A bot-only game played on from `state` (new, or loaded from a server checkpoint)"""
+        if "human" in state.type_of_players:
+            raise ValueError("Headless games cannot seat human players")
+        replay = cls(state, checkpoint_every)
+        seats = game_engine.bot_seats(state)
+        while state.winner is None and state.turns_played < max_turns:
+            replay._checkpoint(state)
+            replay.moves.append(game_engine.play_turn(state, seats))
+        replay.result = state
+        return replay
+
+    @classmethod
+    def from_events(cls, events, checkpoint_every=CHECKPOINT_EVERY):
+        """
+        A game rebuilt from its log records (game_start to game_end, any seats, humans
+        included): each turn's bankrupt, vowel cost and move are reapplied to the board
+        """
+        events = iter(events)
+        start = next(events)
+        if start.kind != "game_start":
+            raise ValueError(f"A game's records begin with game_start, not {start.kind}")
+        state = game_engine.GameState(start.players, start.puzzle, start.clue, "", start.game_type)
+        state.seed = start.seed
+        replay = cls(state, checkpoint_every)
+        replay.records = []
+        end = None
+        for event in events:
+            if event.kind == "turn" or (event.kind == "solve" and replay.records and replay.records[-1]):
+                # A solve after a move is a turn of its own (older logs have no turn record for it)
+                replay.records.append([])
+            if event.kind == "game_end":
+                end = event
+                break
+            elif event.kind != "turn" and replay.records:
+                replay.records[-1].append(event)
+        for records in replay.records:
+            replay._checkpoint(state)
+            replay.moves.append(apply_turn(state, records))
+        replay.result = state
+        if end is not None and (end.winner, list(end.winnings), end.turns) != (state.winner, state.winnings,
+                                                                                 state.turns_played):
+            raise ValueError(f"Replay of game {start.game} ended {state.winner} {state.winnings} after "
+                             f"{state.turns_played} turns; the log says {end.winner} {end.winnings} after {end.turns}")
+        return replay
+
+    @property
+    def turns(self):
+        return self.start + len(self.moves)
+
+    def state_at(self, turn):
+        """The game as `turn` began (turn == turns gives the finished game)"""
+        if not self.start <= turn <= self.turns:
+            raise ValueError(f"Turn {turn} is not in this game (turns {self.start} to {self.turns})")
+        nearest = max(checkpoint for checkpoint in self.checkpoints if checkpoint <= turn)
+        state = game_snapshot.loads(self.checkpoints[nearest])
+        if self.records is None:
+            seats = game_engine.bot_seats(state)
+            for _ in range(nearest, turn):
+                game_engine.play_turn(state, seats)
+        else:
+            for records in self.records[nearest - self.start:turn - self.start]:
+                apply_turn(state, records)
+        return state
+
+
+def apply_turn(state, records):
+    """
+    Reapply one turn from its log records (spin, then guess or vowel and its reveal, or a
+    solve attempt), including the bankrupt and vowel cost the turn function took off the
+    player's winnings. Returns the (guess, dollar) played.
+    """
+    seat = state.turn % 3
+    guess, dollar = "_", 0
+    for event in records:
+        if event.kind == "spin":
+            dollar = event.value
+            if dollar == -1:
+                state.winnings[seat] = 0 # Bankrupt
+        elif event.kind == "vowel":
+            state.winnings[seat] -= event.cost
+            guess = event.letter
+        elif event.kind == "guess":
+            guess, dollar = event.letter, event.dollar
+        elif event.kind == "solve":
+            guess, dollar = event.attempt, 0
+    game_engine.apply_guess(state, guess, dollar)
+    return guess, dollar
+
+
+def game_events(path, game):
+    """The records of game number `game` of a log, read up to its game_end"""
+    events = []
+    for event in event_log.read_events(path):
+        if event.game == game:
+            events.append(event)
+            if event.kind == "game_end":
+                break
+    if not events:
+        raise ValueError(f"No game {game} in {path}")
+    return events
+
+
+def verify_log(path):
+    """
+    Rebuild every game of a log from its records; returns (games, [(game, error)]) for the
+    games whose replay does not end the way their game_end says
+    """
+    games = 0
+    failures = []
+    events = []
+    for event in event_log.read_events(path):
+        if event.kind == "game_start":
+            events = []
+        events.append(event)
+        if event.kind == "game_end" and events[0].kind == "game_start":
+            games += 1
+            try:
+                Replay.from_events(events)
+            except ValueError as error:
+                failures.append((event.game, str(error)))
+    return games, failures
+
+
+def show_turn(replay, turn):
+    """Print the board as `turn` began, whose turn it was and what they played"""
+    state = replay.state_at(turn)
+    output_sink.emit("game", "Turn", turn, "of", replay.turns, "-", state.game_type, "-", state.clue)
+    print_board(state.showing)
+    output_sink.emit("game", "Guessed:", " ".join(state.previous_guesses))
+    output_sink.emit("game", "Winnings:", state.winnings)
+    if turn < replay.turns:
+        guess, dollar = replay.moves[turn - replay.start]
+        output_sink.emit("turn", "Player", state.turn % 3, f"({state.player_type}) played", guess, dollar)
+    else:
+        output_sink.emit("game", "Player", state.winner, "won!" if state.winner is not None else "- unfinished")
+    output_sink.flush()
+
+
+def print_usage():
+    print("\nWheel of Fortune Replay")
+    print("=" * 50)
+    print("Usage: python game_replay.py seed SEED [player types ...] [--game=N] [--turn=T|--all]")
+    print("       python game_replay.py log FILE [--game=N] [--turn=T|--all]")
+    print("       python game_replay.py snapshot FILE [--turn=T|--all]   (a game_server checkpoint, played on)")
+    print("       python game_replay.py verify FILE   (every game of a log replays to its logged result)")
+    print("\n--turn shows the board as turn T began (default: the last turn), --all every turn")
+    print()
+
+
+if __name__ == '__main__':
+    import time
+
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    options = dict(arg[2:].split('=', 1) for arg in sys.argv[1:] if arg.startswith('--') and '=' in arg)
+    if len(args) < 2 or args[0] not in ("seed", "log", "snapshot", "verify"):
+        print_usage()
+        sys.exit(1)
+    if args[0] == "verify":
+        games, failures = verify_log(args[1])
+        for game, error in failures:
+            print(error)
+        print(f"{games - len(failures)} of {games} games replay to their logged result")
+        sys.exit(1 if failures else 0)
+
+    start_time = time.perf_counter()
+    game = int(options.get("game", 0))
+    if args[0] == "seed":
+        replay = Replay.from_seed(args[2:] or ["morse", "oxford", "smart"], int(args[1]), game)
+    elif args[0] == "log":
+        replay = Replay.from_events(game_events(args[1], game))
+    else:
+        replay = Replay.from_state(game_snapshot.load(args[1]))
+    if '--all' in sys.argv:
+        turns = range(replay.start, replay.turns + 1)
+    else:
+        turns = [int(options.get("turn", max(replay.turns - 1, replay.start)))]
+    for turn in turns:
+        show_turn(replay, turn)
+    print(f"Replayed {replay.turns - replay.start} turns in {(time.perf_counter() - start_time) * 1000:.1f}ms")
@@ -0,0 +1,526 @@
+"""
+Multi-table Wheel of Fortune server
+Hosts many games in one asyncio process over plain TCP (nc localhost 8765 or telnet work as clients).
+Clients take the human seats; computer strategies fill the rest. The rules are game_engine's.
+"""
+
+import asyncio
+import glob
+import itertools
+import os
+import random
+import sys
+
+import board_renderer
+import game_clock
+import game_engine
+import game_snapshot
+import letter_probability
+import ngram_model
+import output_sink
+import rollout_player
+import strategy_registry
+from wheel_of_fortune import WHEEL_VALUES, is_consonant, is_vowel
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_TABLES = 1000
+
+# Seconds between turns (on the game clock), and how long a human has for each move
+TURN_PAUSE = 2.0
+MOVE_TIMEOUT = 60.0
+
+# A watcher whose connection has this much unsent output is too slow and is dropped
+MAX_PENDING_OUTPUT = 1 << 20
+
+# Computer strategy that takes over the seat of a human who leaves mid-game
+STAND_IN = "oxford"
+
+VOWEL_COST = 250
+
+HELP = """Commands:
+  TABLES                       List the tables
+  NEW [type type type]         Open a table (default: human smart conservative) and sit at its first human seat
+  JOIN <table> [seat]          Take an open human seat
+  WATCH <table>                Follow a table without playing
+  LEAVE                        Leave your table
+  QUIT                         Disconnect
+On your turn:
+  SPIN, then a consonant       Spin the wheel and call a letter
+  VOWEL <letter>               Buy a vowel for $250
+  SOLVE <answer>               Solve the puzzle
+"""
+
+
+class Client:
+    """One connection: where it sits and the moves it has typed but the game has not read yet"""
+
+    __slots__ = ("writer", "name", "table", "seat", "moves", "waiting")
+
+    def __init__(self, writer, name):
+        self.writer = writer
+        self.name = name
+        self.table = None
+        self.seat = None
+        self.moves = asyncio.Queue()
+        # The game's wait for this client's next move, while there is one
+        self.waiting = None
+
+    def send(self, text):
+        if not self.writer.is_closing():
+            self.writer.write(text.encode())
+
+
+class TableOutput:
+    """Stream for a table's BufferedSink: each turn's output goes to every client at the table in one write"""
+
+    __slots__ = ("table",)
+
+    def __init__(self, table):
+        self.table = table
+
+    def write(self, text):
+        for client in list(self.table.watchers):
+            client.send(text)
+
+    def flush(self):
+        for client in list(self.table.watchers):
+            transport = client.writer.transport
+            if transport is not None and transport.get_write_buffer_size() > MAX_PENDING_OUTPUT:
+                client.writer.close()
+                self.table.watchers.discard(client)
+
+
+class Table:
+    """One game: the engine's GameState plus who is sitting and watching"""
+
+    __slots__ = ("number", "state", "seats", "watchers", "sink", "full", "task")
+
+    def __init__(self, number, state):
+        self.number = number
+        self.state = state
+        self.seats = [None] * 3 # The Client in each human seat
+        self.watchers = set()
+        self.sink = output_sink.BufferedSink(TableOutput(self))
+        self.full = asyncio.Event()
+        self.task = None
+        if not self.open_seats():
+            self.full.set()
+
+    def open_seats(self):
+        return [seat for seat, type_of_player in enumerate(self.state.type_of_players)
+                if type_of_player == "human" and self.seats[seat] is None]
+
+    def describe(self):
+        players = ", ".join(self.seats[seat].name if self.seats[seat] else type_of_player
+                            for seat, type_of_player in enumerate(self.state.type_of_players))
+        status = "waiting" if not self.full.is_set() else "playing"
+        return f"Table {self.number}: {players} ({status}, turn {self.state.turns_played})"
+
+    def say(self, *args):
+        self.sink.emit("game", *args)
+
+    def render(self, message=None):
+        state = self.state
+        lines = board_renderer.FrameRenderer().frame_lines(state.showing, state.clue, state.winnings,
+                                                           state.previous_guesses, message)
+        self.sink.write("board", "\n".join(lines) + "\n")
+
+
+class GameServer:
+    """Every table in the process, each played by its own task on one event loop"""
+
+    def __init__(self, seed=None, checkpoint_dir=None):
+        self.tables = {}
+        self.numbers = itertools.count(1)
+        self.names = itertools.count(1)
+        # Table n of a server started with `seed` always gets the same puzzle and spins
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        # Every table is saved there after each turn, and picked up again on restart
+        self.checkpoint_dir = checkpoint_dir
+
+    def open_table(self, type_of_players):
+        if len(self.tables) >= MAX_TABLES:
+            raise ValueError(f"The server is full ({MAX_TABLES} tables)")
+        for type_of_player in type_of_players:
+            if type_of_player != "human" and type_of_player not in game_engine.STRATEGIES:
+                raise ValueError(f"Unknown player type: {type_of_player}")
+        number = next(self.numbers)
+        return self.add_table(number, game_engine.new_game(type_of_players, rng=game_engine.game_rng(self.seed, number)))
+
+    def add_table(self, number, state):
+        # Moves of rollout players are time-budgeted so they never hold up the other tables
+        rollout_player.use_move_budget(state.players)
+        table = Table(number, state)
+        self.tables[number] = table
+        table.task = asyncio.create_task(self.run_table(table))
+        return table
+
+    def checkpoint_path(self, table):
+        return os.path.join(self.checkpoint_dir, f"table-{table.number}.wof")
+
+    def resume_tables(self):
+        """Reopen the tables saved in checkpoint_dir; their human seats wait for players to JOIN"""
+        numbers = [0]
+        for path in glob.glob(os.path.join(self.checkpoint_dir, "table-*.wof")):
+            number = int(os.path.basename(path)[len("table-"):-len(".wof")])
+            state = game_snapshot.load(path)
+            # Seats a computer took over stay with the computer
+            self.add_table(number, state)
+            numbers.append(number)
+        self.numbers = itertools.count(max(numbers) + 1)
+        return len(numbers) - 1
+
+    async def run_table(self, table):
+        try:
+            await table.full.wait()
+            await self.play(table)
+        finally:
+            table.sink.flush()
+            for client in list(table.watchers):
+                if client.table is table:
+                    client.table = client.seat = None
+                    client.send("Back in the lobby. TABLES, NEW or JOIN\n")
+            del self.tables[table.number]
+            state = table.state
+            if state.winner is not None or state.turns_played >= game_engine.MAX_TURNS:
+                self.forget(table) # Over; a table stopped by shutdown keeps its checkpoint
+
+    def forget(self, table):
+        if self.checkpoint_dir is not None:
+            try:
+                os.remove(self.checkpoint_path(table))
+            except FileNotFoundError:
+                pass
+
+    async def play(self, table):
+        """play_random_game for one table: never sleeps or blocks, output once per turn"""
+        state = table.state
+        table.say("Welcome to Wheel of Fortune, table", table.number)
+        table.say("You are playing a game of type:", state.game_type)
+        table.render()
+        table.sink.flush()
+
+        while state.winner is None and state.turns_played < game_engine.MAX_TURNS:
+            await game_clock.pause(TURN_PAUSE)
+            seat = state.seat
+            client = table.seats[seat]
+            table.say("It is player", seat, "'s turn")
+
+            if state.board.solved:
+                # Nothing left to call: the player whose turn it is gets the chance to solve
+                if client is not None:
+                    table.sink.flush()
+                    attempt = await self.human_solve(table, client)
+                else:
+                    attempt = state.showing
+                solved = game_engine.attempt_solve(state, attempt)
+                if not solved:
+                    table.render("Wrong ... next player")
+                table.sink.flush()
+                continue
+
+            if client is not None:
+                table.sink.flush()
+                guess, dollar = await self.human_move(table, client)
+            else:
+                guess, dollar = await self.computer_move(table)
+
+            correct = game_engine.apply_guess(state, guess, dollar)
+            message = None
+            if correct == game_engine.REPEATED:
+                message = "Sorry, that's already been guessed .... next player"
+            elif correct == 0 and len(guess) > 1:
+                message = "Wrong ... next player"
+            elif correct == 0 and guess != "_":
+                message = "Sorry, not in the puzzle ... next player"
+            table.render(message)
+            table.sink.flush() # Once per turn
+            if self.checkpoint_dir is not None:
+                # Taken on the loop, written on a worker thread so the file operations never block it
+                await asyncio.to_thread(game_snapshot.write, game_snapshot.dumps(state), self.checkpoint_path(table))
+
+        if state.winner is None:
+            table.say("No winner after", state.turns_played, "turns. The puzzle was:", state.puzzle)
+        else:
+            table.say("Player", state.winner, "won!")
+        table.say("Winnings:", state.winnings)
+
+    async def computer_move(self, table):
+        """
+        A computer's move, decided on a worker thread so a slow player (solver, trigram, rollout)
+        never holds up the other tables; what it announces is said on the loop once it has decided
+        """
+        state = table.state
+        player_type = state.player_type
+        if player_type == "human":
+            player_type = STAND_IN # The human left
+        player = state.players[state.seat]
+        if player is None:
+            player = state.players[state.seat] = game_engine.create_player(player_type, state.clue)
+            rollout_player.use_move_budget([player])
+        wheel_values = game_engine.STRATEGIES[player_type].wheel_values
+        choice = state.rng.choice
+        said = []
+        guess, dollar = await asyncio.to_thread(player.take_turn, state.showing, state.winnings,
+                                                state.previous_guesses, state.turn, lambda: choice(wheel_values),
+                                                lambda *args: said.append(args))
+        for args in said:
+            table.say(*args)
+        return guess, dollar
+
+    async def next_move(self, client):
+        """The next line the client types, or None when the time for the move is up or the client left"""
+        waiting = client.waiting = asyncio.ensure_future(client.moves.get())
+        try:
+            await asyncio.wait((waiting,), timeout=MOVE_TIMEOUT)
+        finally:
+            client.waiting = None
+            if not waiting.done():
+                waiting.cancel()
+        if waiting.cancelled() or not waiting.done():
+            return None
+        return waiting.result()
+
+    async def human_move(self, table, client):
+        """human_turn over the connection; returns (guess, dollar) like every turn function"""
+        state = table.state
+        seat = state.seat
+        client.send("Your turn: SPIN, VOWEL <letter> or SOLVE <answer>\n")
+        while True:
+            line = await self.next_move(client)
+            if line is None or table.seats[seat] is not client:
+                return self.missed_move(table, seat, client)
+            command, _, argument = line.partition(" ")
+            command = command.upper()
+            argument = argument.strip().upper()
+
+            if command == "SOLVE" and argument:
+                return argument, 0
+            if command == "VOWEL":
+                if state.winnings[seat] < VOWEL_COST:
+                    client.send("Sorry .... you don't have enough money. SPIN or SOLVE\n")
+                elif len(argument) != 1 or not is_vowel(argument):
+                    client.send("Not a vowel\n")
+                else:
+                    state.winnings[seat] -= VOWEL_COST
+                    table.say("Player", seat, "bought:", argument)
+                    return argument, 0
+                continue
+            if command != "SPIN":
+                client.send("SPIN, VOWEL <letter> or SOLVE <answer>\n")
+                continue
+
+            dollar = state.rng.choice(WHEEL_VALUES)
+            table.say("Player", seat, "spun ....", dollar, "dollars")
+            if dollar == 0:
+                table.say("Sorry! Lose a turn. Next player")
+                table.sink.flush()
+                return "_", dollar
+            if dollar == -1:
+                table.say("Oh No! Bankrupt!")
+                state.winnings[seat] = 0
+                table.sink.flush()
+                return "_", dollar
+            table.sink.flush()
+            client.send("Name a consonant ....\n")
+            while True:
+                letter = await self.next_move(client)
+                if letter is None or table.seats[seat] is not client:
+                    return self.missed_move(table, seat, client)
+                letter = letter.strip().upper()
+                if len(letter) == 1 and is_consonant(letter):
+                    table.say("Player", seat, "guessed:", letter)
+                    return letter, dollar
+                client.send("Name one consonant\n")
+
+    def missed_move(self, table, seat, client):
+        if table.seats[seat] is client:
+            table.say("Player", seat, "ran out of time")
+        return "_", 0
+
+    async def human_solve(self, table, client):
+        client.send("The board is full ... SOLVE <answer>\n")
+        line = await self.next_move(client)
+        if line is None:
+            return ""
+        command, _, argument = line.partition(" ")
+        return (argument if command.upper() == "SOLVE" else line).strip().upper()
+
+    def leave(self, client):
+        table = client.table
+        if table is None:
+            return
+        table.watchers.discard(client)
+        if client.seat is not None and table.seats[client.seat] is client:
+            table.seats[client.seat] = None
+            if table.full.is_set():
+                # Mid-game the seat goes to a computer; before the start it opens up again
+                table.state.type_of_players[client.seat] = STAND_IN
+                table.say(client.name, "left; a computer takes seat", client.seat)
+                if client.waiting is not None:
+                    client.waiting.cancel() # Stops the move being waited for
+            elif not any(table.seats):
+                table.task.cancel() # Nobody is waiting at this table any more
+                self.forget(table)
+        client.table = client.seat = None
+
+    def sit(self, client, table, seat=None):
+        open_seats = table.open_seats()
+        if not open_seats or (seat is not None and seat not in open_seats):
+            client.send(f"No open human seat at table {table.number}\n")
+            return
+        self.leave(client)
+        # Lines typed out of turn at the last table are not moves at this one
+        client.moves = asyncio.Queue()
+        seat = open_seats[0] if seat is None else seat
+        table.seats[seat] = client
+        table.watchers.add(client)
+        client.table, client.seat = table, seat
+        client.send(f"You are player {seat} at table {table.number}\n")
+        if not table.open_seats():
+            table.full.set()
+        else:
+            client.send("Waiting for more players ...\n")
+
+    def command(self, client, line):
+        """Lobby commands; anything else from a seated player is a move"""
+        command, _, argument = line.partition(" ")
+        command = command.upper()
+        arguments = argument.split()
+        if command == "HELP":
+            client.send(HELP)
+        elif command == "TABLES":
+            lines = [table.describe() for table in self.tables.values()]
+            client.send("\n".join(lines or ["No tables. NEW opens one"]) + "\n")
+        elif command == "NEW":
+            lineup = [name.lower() for name in arguments] or ["human", "smart", "conservative"]
+            if len(lineup) != 3:
+                client.send("A table has 3 players\n")
+                return
+            try:
+                table = self.open_table(lineup)
+            except ValueError as error:
+                client.send(f"{error}\n")
+                return
+            client.send(f"Opened table {table.number}\n")
+            if table.open_seats():
+                self.sit(client, table)
+            else:
+                self.watch(client, table)
+        elif command in ("JOIN", "WATCH"):
+            try:
+                table = self.tables[int(arguments[0])]
+                seat = int(arguments[1]) if command == "JOIN" and len(arguments) > 1 else None
+            except (IndexError, KeyError, ValueError):
+                client.send(f"Usage: {command} <table>{' [seat]' if command == 'JOIN' else ''} (see TABLES)\n")
+                return
+            if command == "JOIN":
+                self.sit(client, table, seat)
+            else:
+                self.watch(client, table)
+        elif command == "LEAVE":
+            self.leave(client)
+            client.send("Back in the lobby\n")
+        elif client.seat is not None:
+            client.moves.put_nowait(line)
+        else:
+            client.send("Unknown command. HELP lists them\n")
+
+    def watch(self, client, table):
+        self.leave(client)
+        table.watchers.add(client)
+        client.table = table
+        client.send(f"Watching table {table.number}\n")
+
+    async def handle_client(self, reader, writer):
+        client = Client(writer, f"guest{next(self.names)}")
+        client.send(f"Welcome to Wheel of Fortune, {client.name}\n{HELP}")
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                line = line.decode(errors="replace").strip()
+                if line.upper() == "QUIT":
+                    break
+                if line:
+                    self.command(client, line)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.leave(client)
+            writer.close()
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT, bot_tables=0):
+        load_shared_tables()
+        server = await asyncio.start_server(self.handle_client, host, port)
+        if self.checkpoint_dir is not None:
+            os.makedirs(self.checkpoint_dir, exist_ok=True)
+            resumed = self.resume_tables()
+            if resumed:
+                print("Resumed", resumed, "tables from", self.checkpoint_dir)
+        for _ in range(bot_tables):
+            # Only types that finish their games at a steady pace (not conservative or rollout)
+            self.open_table(random.choices(strategy_registry.default_strategies(), k=3))
+        print(f"Wheel of Fortune server on {host}:{port} (seed {self.seed}) ... nc {host} {port} to play")
+        async with server:
+            await server.serve_forever()
+
+
+def load_shared_tables():
+    """
+    Build what the computer players share (puzzles, n-grams, word index, puzzle shapes) before
+    the first table opens, rather than during some table's turn
+    """
+    ngram_model.get_model()
+    letter_probability.get_oracle()
+    rollout_player.get_shape_index()
+
+
+def print_usage():
+    print("\nWheel of Fortune Game Server")
+    print("=" * 50)
+    print("Usage: python game_server.py [options]")
+    print("\nOptions:")
+    print(f"  --host=HOST     Address to listen on (default {DEFAULT_HOST})")
+    print(f"  --port=N        Port to listen on (default {DEFAULT_PORT})")
+    print("  --bots=N        Open N computer-only tables to watch")
+    print("  --seed=N        Seed for every table's puzzle and spins")
+    print("  --checkpoints=DIR  Save every table after each turn and resume them on restart")
+    print(" ", game_clock.PACE_HELP)
+    print()
+
+
+if __name__ == '__main__':
+    host = DEFAULT_HOST
+    port = DEFAULT_PORT
+    bot_tables = 0
+    seed = None
+    checkpoint_dir = None
+    for arg in sys.argv[1:]:
+        if arg.startswith('--host='):
+            host = arg.split('=')[1]
+        elif arg.startswith('--port='):
+            port = int(arg.split('=')[1])
+        elif arg.startswith('--bots='):
+            bot_tables = int(arg.split('=')[1])
+        elif arg.startswith('--seed='):
+            seed = int(arg.split('=')[1])
+        elif arg.startswith('--checkpoints='):
+            checkpoint_dir = arg.split('=', 1)[1]
+        elif arg.startswith('--pace='):
+            game_clock.use_pace(arg.split('=')[1])
+        elif arg == '--help':
+            print_usage()
+            sys.exit()
+        else:
+            print("Unknown argument:", arg)
+            print_usage()
+            sys.exit(1)
+
+    try:
+        asyncio.run(GameServer(seed, checkpoint_dir).serve(host, port, bot_tables))
+    except KeyboardInterrupt:
+        pass
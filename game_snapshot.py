@@ -0,0 +1,132 @@
+"""
+Save and resume Wheel of Fortune games
+A GameState packs into a few kilobytes of binary (most of it the RNG state) in microseconds,
+so servers and long simulations can checkpoint every turn and pick up where they stopped
+"""
+
+import os
+import random
+import struct
+
+import game_engine
+
+MAGIC = b"WOF"
+VERSION = 1
+
+# Mersenne Twister state: 624 words plus the position in them
+_RNG_WORDS = struct.Struct("<625I")
+# winnings x3, turn, turns played, winner (-1: none yet)
+_NUMBERS = struct.Struct("<3qIIb")
+
+
+def _pack_text(parts, text, length_format="<H"):
+    data = text.encode("utf-8")
+    parts.append(struct.pack(length_format, len(data)))
+    parts.append(data)
+
+
+def dumps(state):
+    """
+    The game as bytes: puzzle row, player types, previous guesses, winnings, turn,
+    winner, each solver's tried solutions and the RNG state. showing is rebuilt from the
+    puzzle and the guesses on load.
+    """
+    parts = [MAGIC, bytes((VERSION,))]
+    for text in (state.puzzle, state.clue, state.date, state.game_type):
+        _pack_text(parts, text)
+    parts.append(bytes((len(state.type_of_players),)))
+    for type_of_player in state.type_of_players:
+        _pack_text(parts, type_of_player, "<B")
+    _pack_text(parts, "".join(state.previous_guesses))
+    parts.append(_NUMBERS.pack(*state.winnings, state.turn, state.turns_played,
+                               -1 if state.winner is None else state.winner))
+
+    # Solve attempts a player has already made (the solver never repeats one)
+    for player in state.players:
+        attempts = sorted(getattr(player, "attempts", ()))
+        parts.append(bytes((len(attempts),)))
+        for attempt in attempts:
+            _pack_text(parts, attempt)
+
+    version, words, gauss_next = state.rng.getstate()
+    parts.append(bytes((version,)))
+    parts.append(_RNG_WORDS.pack(*words))
+    parts.append(struct.pack("<?d", gauss_next is not None, gauss_next or 0.0))
+    return b"".join(parts)
+
+
+def loads(data):
+    """A GameState that plays on exactly as the saved one would have"""
+    if data[:3] != MAGIC:
+        raise ValueError("Not a Wheel of Fortune snapshot")
+    if data[3] != VERSION:
+        raise ValueError(f"Snapshot version {data[3]} is not supported (expected {VERSION})")
+    offset = 4
+
+    def text(length_format="<H"):
+        nonlocal offset
+        (length,) = struct.unpack_from(length_format, data, offset)
+        offset += struct.calcsize(length_format)
+        value = data[offset:offset + length].decode("utf-8")
+        offset += length
+        return value
+
+    puzzle, clue, date, game_type = text(), text(), text(), text()
+    count = data[offset]
+    offset += 1
+    type_of_players = [text("<B") for _ in range(count)]
+    previous_guesses = text()
+    *winnings, turn, turns_played, winner = _NUMBERS.unpack_from(data, offset)
+    offset += _NUMBERS.size
+
+    attempts = []
+    for _ in type_of_players:
+        count = data[offset]
+        offset += 1
+        attempts.append({text() for _ in range(count)})
+
+    version = data[offset]
+    offset += 1
+    words = _RNG_WORDS.unpack_from(data, offset)
+    offset += _RNG_WORDS.size
+    has_gauss, gauss_next = struct.unpack_from("<?d", data, offset)
+    rng = random.Random()
+    rng.setstate((version, words, gauss_next if has_gauss else None))
+
+    state = game_engine.GameState(type_of_players, puzzle, clue, date, game_type, rng)
+    for guess in previous_guesses:
+        state.previous_guesses.append(guess)
+        state.board.reveal(guess)
+    state.winnings = list(winnings)
+    state.turn = turn
+    state.turns_played = turns_played
+    if winner >= 0:
+        state.winner = winner
+        state.board.reveal_all()
+    for player, tried in zip(state.players, attempts):
+        if tried:
+            player.attempts = tried
+    return state
+
+
+def save(state, path):
+    """Write a snapshot; the old one stays whole until the new one is complete"""
+    write(dumps(state), path)
+
+
+def write(data, path):
+    """save() for a snapshot already taken with dumps; touches nothing but the file, so it can run on a thread"""
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(data)
+    os.replace(temporary, path)
+
+
+def load(path):
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def resume_game(data, max_turns=None):
+    """Finish a bot-only game from a snapshot; the result matches the uninterrupted game's"""
+    return game_engine.play_on(loads(data), game_engine.MAX_TURNS if max_turns is None else max_turns)
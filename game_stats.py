@@ -0,0 +1,261 @@
+"""
+Streaming statistics for Wheel of Fortune simulations
+Mean, variance and quantiles of winnings and game length, and bankrupts, lost turns and vowels
+bought per seat and strategy, in memory that does not grow with the number of games.
+Partial results from workers merge into the same totals one game at a time would give
+"""
+
+import math
+import sys
+
+import game_engine
+
+VOWELS = "AEIOU"
+
+# Quantiles come back within 1% of a value actually seen
+RELATIVE_ACCURACY = 0.01
+
+# Per-game counts kept for every seat
+COUNTS = ("bankrupts", "lost_turns", "vowels")
+
+
+class QuantileSketch:
+    """
+    Counts per logarithmic bucket (value within relative_accuracy of the bucket's middle).
+    The number of buckets depends on the range of the values, not on how many there are:
+    winnings up to $1,000,000 need under 700.
+    """
+
+    def __init__(self, relative_accuracy=RELATIVE_ACCURACY):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.positive = {}
+        self.negative = {}
+        self.zeros = 0
+        self.count = 0
+
+    def add(self, value):
+        self.count += 1
+        if value > 0:
+            key = math.ceil(math.log(value) / self.log_gamma)
+            self.positive[key] = self.positive.get(key, 0) + 1
+        elif value < 0:
+            key = math.ceil(math.log(-value) / self.log_gamma)
+            self.negative[key] = self.negative.get(key, 0) + 1
+        else:
+            self.zeros += 1
+
+    def merge(self, other):
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Only sketches with the same accuracy can be merged")
+        for buckets, others in ((self.positive, other.positive), (self.negative, other.negative)):
+            for key, count in others.items():
+                buckets[key] = buckets.get(key, 0) + count
+        self.zeros += other.zeros
+        self.count += other.count
+
+    def _value(self, key):
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+    def quantile(self, q):
+        """The value q (0 to 1) of the way through everything added; None if nothing was"""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self.zeros
+        if seen > rank:
+            return 0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self.positive))
+
+
+class RunningStats:
+    """Count, mean, variance (Welford), min, max and quantiles of a stream of numbers"""
+
+    def __init__(self, relative_accuracy=RELATIVE_ACCURACY):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0 # Sum of squared differences from the mean
+        self.min = None
+        self.max = None
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        self.sketch.add(value)
+
+    def merge(self, other):
+        """Fold in another worker's stats (Chan et al.'s pairwise update)"""
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+
+    @property
+    def variance(self):
+        """Sample variance"""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self):
+        return math.sqrt(self.variance)
+
+    def quantile(self, q):
+        return self.sketch.quantile(q)
+
+
+def new_tally():
+    """A game's running [bankrupts, lost turns, vowels] for each seat"""
+    return [[0, 0, 0] for _ in range(3)]
+
+
+def count_move(tally, seat, guess, dollar, paid):
+    """
+    Count one (guess, dollar) a turn function returned; paid is what the turn took off the
+    player's bank, so a vowel called for nothing is not counted as bought
+    """
+    if guess == "_":
+        if dollar == -1:
+            tally[seat][0] += 1
+        elif dollar == 0:
+            tally[seat][1] += 1
+    elif guess in VOWELS and paid > 0:
+        tally[seat][2] += 1
+
+
+class GameStats:
+    """
+    Totals over any number of games: game length and unfinished games overall, and for each
+    (seat, strategy) games, wins, winnings and per-game bankrupts, lost turns and vowels
+    """
+
+    def __init__(self, relative_accuracy=RELATIVE_ACCURACY):
+        self.relative_accuracy = relative_accuracy
+        self.games = 0
+        self.unfinished = 0
+        self.turns = RunningStats(relative_accuracy)
+        self.wins = {}
+        self.winnings = {}
+        self.counts = {}
+
+    def _seat(self, key):
+        if key not in self.winnings:
+            self.wins[key] = 0
+            self.winnings[key] = RunningStats(self.relative_accuracy)
+            self.counts[key] = [RunningStats(self.relative_accuracy) for _ in COUNTS]
+        return self.winnings[key], self.counts[key]
+
+    def add_game(self, type_of_players, winner, winnings, turns, tally=None):
+        """
+        One finished game, from what the game loop keeps: the winnings list and turns played
+        (winner None for a game stopped unsolved), and its tally if moves were counted
+        """
+        self.games += 1
+        self.turns.add(turns)
+        if winner is None:
+            self.unfinished += 1
+        for seat, strategy in enumerate(type_of_players):
+            key = (seat, strategy)
+            seat_winnings, seat_counts = self._seat(key)
+            seat_winnings.add(winnings[seat])
+            if winner == seat:
+                self.wins[key] += 1
+            if tally is not None:
+                for stats, count in zip(seat_counts, tally[seat]):
+                    stats.add(count)
+
+    def add_result(self, result, tally=None):
+        """A game_engine.GameResult"""
+        self.add_game(result.type_of_players, result.winner, result.winnings, result.turns, tally)
+
+    def merge(self, other):
+        self.games += other.games
+        self.unfinished += other.unfinished
+        self.turns.merge(other.turns)
+        for key in other.winnings:
+            self.merge_seat(key, other, key)
+
+    def by_strategy(self):
+        """The same totals with the seats of each strategy merged: strategy -> GameStats"""
+        strategies = {}
+        for (seat, strategy), winnings in self.winnings.items():
+            stats = strategies.setdefault(strategy, GameStats(self.relative_accuracy))
+            stats.games += winnings.count
+            stats.merge_seat(("all", strategy), self, (seat, strategy))
+        return strategies
+
+    def merge_seat(self, key, other, other_key):
+        # Fold another GameStats' (seat, strategy) totals into this one's key
+        seat_winnings, seat_counts = self._seat(key)
+        self.wins[key] += other.wins[other_key]
+        seat_winnings.merge(other.winnings[other_key])
+        for stats, others in zip(seat_counts, other.counts[other_key]):
+            stats.merge(others)
+
+    def print_summary(self, stream=None):
+        """Per strategy, then per seat: win rate, winnings spread and counts per game"""
+        stream = stream or sys.stdout
+        turns = self.turns
+        if turns.count:
+            stream.write(f"\n=== {self.games} games, {self.unfinished} unfinished; turns mean {turns.mean:.1f} "
+                         f"sd {turns.stdev:.1f} p50 {turns.quantile(0.5):.0f} p90 {turns.quantile(0.9):.0f} "
+                         f"p99 {turns.quantile(0.99):.0f} max {turns.max} ===\n")
+        stream.write(f"{'strategy':<14}{'seat':>5}{'games':>10}{'win rate':>9}{'mean $':>8}{'sd $':>7}"
+                     f"{'p10 $':>7}{'p50 $':>7}{'p90 $':>7}{'p99 $':>7}{'bankrupt':>9}{'lost':>6}{'vowels':>7}\n")
+        strategies = self.by_strategy()
+        keys = sorted(self.winnings, key=lambda key: (key[1], key[0]))
+        for strategy in sorted(strategies, key=lambda s: -strategies[s].wins[("all", s)] / strategies[s].games):
+            rows = [(strategies[strategy], ("all", strategy))]
+            rows += [(self, key) for key in keys if key[1] == strategy]
+            for stats, key in rows:
+                winnings = stats.winnings[key]
+                bankrupts, lost_turns, vowels = (f"{c.mean:.2f}" if c.count else "-" for c in stats.counts[key])
+                stream.write(f"{strategy if key[0] == 'all' else '':<14}{key[0]:>5}{winnings.count:>10}"
+                             f"{stats.wins[key] / winnings.count:>9.3f}{winnings.mean:>8.0f}{winnings.stdev:>7.0f}"
+                             f"{winnings.quantile(0.1):>7.0f}{winnings.quantile(0.5):>7.0f}"
+                             f"{winnings.quantile(0.9):>7.0f}{winnings.quantile(0.99):>7.0f}"
+                             f"{bankrupts:>9}{lost_turns:>6}{vowels:>7}\n")
+        stream.flush()
+
+
+def play_games(type_of_players, seed, first, games, stats, max_turns=game_engine.MAX_TURNS):
+    """
+    Play games first to first + games of a seeded run (the same games replay_game gives)
+    into stats, counting every move; yields each GameResult
+    """
+    for index in range(first, first + games):
+        state = game_engine.new_game(type_of_players, rng=game_engine.game_rng(seed, index))
+        seats = game_engine.bot_seats(state)
+        tally = new_tally()
+        while state.winner is None and state.turns_played < max_turns:
+            seat = state.turn % 3
+            bank = state.winnings[seat]
+            guess, dollar = game_engine.play_turn(state, seats)
+            # A vowel adds nothing to the bank, so for one bought this is its cost
+            count_move(tally, seat, guess, dollar, bank - state.winnings[seat])
+        stats.add_game(state.type_of_players, state.winner, state.winnings, state.turns_played, tally)
+        yield game_engine.GameResult(state.winner, list(state.winnings), state.turns_played, state.puzzle,
+                                     state.clue, state.game_type, tuple(state.type_of_players),
+                                     list(state.previous_guesses))
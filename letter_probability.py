@@ -0,0 +1,126 @@
+"""
+Letter probabilities for Wheel of Fortune boards
+For every letter not yet called: the chance it is in the puzzle and how many copies to expect
+"""
+
+import functools
+import os
+from collections import Counter, namedtuple
+from types import MappingProxyType
+
+import puzzle_corpus
+from board_state import ALPHABET, LETTER_BITS, GuessedLetters
+from word_index import WordIndex, letter_mask
+
+# Distinct boards (hidden words, called letters, category) remembered per oracle
+ESTIMATE_CACHE_SIZE = 16384
+
+# present / expected map each letter not yet called to P(in the puzzle) / expected copies
+LetterEstimate = namedtuple("LetterEstimate", ["present", "expected"])
+
+
+def board_key(showing):
+    """
+    Canonical form of a board: its hidden words, sorted. Fully revealed words and
+    word order do not change any letter's chances, so such boards share a cache entry.
+    """
+    return tuple(sorted(word for word in showing.split() if '_' in word))
+
+
+class LetterOracle:
+    """
+    Word-level evidence from the puzzle corpus, per clue category when the category
+    knows the word and from the whole corpus otherwise. Words no puzzle has used fall
+    back to how often each letter appears in the corpus.
+    """
+
+    def __init__(self, corpus):
+        category_words = {}
+        letter_counts = Counter()
+        for row in range(len(corpus)):
+            puzzle, clue = corpus[row][:2]
+            category_words.setdefault(clue, []).extend(puzzle.split())
+            letter_counts.update(puzzle)
+        self.index = WordIndex(word for words in category_words.values() for word in words)
+        self.category_words = category_words
+        self.category_indexes = {}
+        self.letter_counts = [letter_counts[letter] for letter in ALPHABET]
+        self._estimate = functools.lru_cache(maxsize=ESTIMATE_CACHE_SIZE)(self._compute)
+
+    def category_index(self, category):
+        """WordIndex of one clue category, built the first time it is asked for"""
+        index = self.category_indexes.get(category)
+        if index is None:
+            index = self.category_indexes[category] = WordIndex(self.category_words[category])
+        return index
+
+    def estimate(self, showing, guessed=(), category=None):
+        """LetterEstimate for a board; guessed is a GuessedLetters or any iterable of letters"""
+        guessed_mask = guessed.mask if isinstance(guessed, GuessedLetters) else letter_mask(guessed)
+        if category not in self.category_words:
+            category = None
+        return self._estimate(board_key(showing), guessed_mask, category)
+
+    def ranked(self, showing, guessed=(), category=None, order=ALPHABET):
+        """Letters not yet called, most expected copies first; ties keep their place in order"""
+        expected = self.estimate(showing, guessed, category).expected
+        return sorted((letter for letter in order if letter in expected), key=lambda letter: -expected[letter])
+
+    def cache_info(self):
+        return self._estimate.cache_info()
+
+    def _compute(self, hidden_words, guessed_mask, category):
+        absent = [1.0] * 26
+        expected = [0.0] * 26
+        unguessed = [0 if LETTER_BITS[letter] & guessed_mask else count
+                     for letter, count in zip(ALPHABET, self.letter_counts)]
+        unguessed_total = sum(unguessed) or 1
+
+        for pattern in hidden_words:
+            matches = None
+            if category is not None:
+                matches = self.category_index(category).lookup(pattern, guessed_mask)
+            if not matches or not matches.words:
+                matches = self.index.lookup(pattern, guessed_mask)
+            if matches.words:
+                for letter in range(26):
+                    absent[letter] *= 1.0 - matches.present[letter]
+                    expected[letter] += matches.expected[letter]
+            else:
+                # A word the corpus has never seen: each blank is drawn from the letters still uncalled
+                blanks = pattern.count('_')
+                for letter in range(26):
+                    chance = unguessed[letter] / unguessed_total
+                    absent[letter] *= (1.0 - chance) ** blanks
+                    expected[letter] += chance * blanks
+
+        present = {}
+        expected_copies = {}
+        for number, letter in enumerate(ALPHABET):
+            if not LETTER_BITS[letter] & guessed_mask:
+                present[letter] = 1.0 - absent[number]
+                expected_copies[letter] = expected[number]
+        # Shared by every caller through the cache, so read-only
+        return LetterEstimate(MappingProxyType(present), MappingProxyType(expected_copies))
+
+
+_oracles = {}
+
+
+def get_oracle(path=None):
+    """Shared oracle per puzzle file (default puzzle_corpus.PUZZLE_FILE), so every game reuses its cache"""
+    if path is None:
+        path = puzzle_corpus.PUZZLE_FILE
+    oracle = _oracles.get(path)
+    if oracle is None:
+        oracle = _oracles[path] = LetterOracle(puzzle_corpus.get_corpus(path))
+    return oracle
+
+
+def find_oracle(path=None):
+    """get_oracle, or None when there is no puzzle file (for players that can do without one)"""
+    if path is None:
+        path = puzzle_corpus.PUZZLE_FILE
+    if path not in _oracles and not os.path.exists(path):
+        return None
+    return get_oracle(path)
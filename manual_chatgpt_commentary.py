@@ -4,17 +4,18 @@ Copy prompts to ChatGPT and paste responses back
 """
 
 import pyperclip  # pip install pyperclip
-import time
+import game_clock
+import output_sink
 
 class ManualChatGPTCommentary:
     def __init__(self, commentary_style="dramatic"):
         self.commentary_style = commentary_style
-        print("🎙️ FREE ChatGPT Commentary Mode Activated!")
-        print("=" * 50)
-        print("📋 I'll give you prompts to copy to ChatGPT")
-        print("💬 You paste the responses back")
-        print("🆓 Completely FREE to use!")
-        print("=" * 50)
+        output_sink.emit("prompt", "🎙️ FREE ChatGPT Commentary Mode Activated!")
+        output_sink.emit("prompt", "=" * 50)
+        output_sink.emit("prompt", "📋 I'll give you prompts to copy to ChatGPT")
+        output_sink.emit("prompt", "💬 You paste the responses back")
+        output_sink.emit("prompt", "🆓 Completely FREE to use!")
+        output_sink.emit("prompt", "=" * 50)
         
         # Set up ChatGPT with your style
         self.setup_chatgpt_style()
@@ -36,37 +37,37 @@ Always keep responses to 1-2 sentences maximum.
 Just respond with "Ready for commentary!" to confirm you understand.
 """
         
-        print("\n🚀 STEP 1: Copy this setup prompt to ChatGPT:")
-        print("=" * 60)
-        print(setup_prompt)
-        print("=" * 60)
+        output_sink.emit("prompt", "\n🚀 STEP 1: Copy this setup prompt to ChatGPT:")
+        output_sink.emit("prompt", "=" * 60)
+        output_sink.emit("prompt", setup_prompt)
+        output_sink.emit("prompt", "=" * 60)
         
         # Copy to clipboard
         try:
             pyperclip.copy(setup_prompt)
-            print("✅ Setup prompt copied to clipboard!")
+            output_sink.emit("prompt", "✅ Setup prompt copied to clipboard!")
         except:
-            print("📋 Copy the text above manually")
+            output_sink.emit("prompt", "📋 Copy the text above manually")
         
-        input("\n⏳ Paste this in ChatGPT, wait for 'Ready for commentary!' response, then press Enter...")
-        print("🎮 Great! Now let's play with commentary!\n")
+        output_sink.ask("\n⏳ Paste this in ChatGPT, wait for 'Ready for commentary!' response, then press Enter...")
+        output_sink.emit("prompt", "🎮 Great! Now let's play with commentary!\n")
     
     def get_commentary(self, prompt):
         """Get commentary by showing prompt to copy to ChatGPT"""
-        print(f"\n📋 COPY THIS TO CHATGPT:")
-        print("-" * 40)
-        print(prompt)
-        print("-" * 40)
+        output_sink.emit("prompt", f"\n📋 COPY THIS TO CHATGPT:")
+        output_sink.emit("prompt", "-" * 40)
+        output_sink.emit("prompt", prompt)
+        output_sink.emit("prompt", "-" * 40)
         
         # Copy to clipboard automatically
         try:
             pyperclip.copy(prompt)
-            print("✅ Copied to clipboard! Paste it in ChatGPT")
+            output_sink.emit("prompt", "✅ Copied to clipboard! Paste it in ChatGPT")
         except:
-            print("📋 Copy the text above manually")
+            output_sink.emit("prompt", "📋 Copy the text above manually")
         
         # Wait for user to get response
-        response = input("💬 Paste ChatGPT's response here: ").strip()
+        response = output_sink.ask("💬 Paste ChatGPT's response here: ").strip()
         
         if not response:
             response = "🎡 The excitement continues!"
@@ -77,8 +78,8 @@ Just respond with "Ready for commentary!" to confirm you understand.
         """Commentary for game start"""
         prompt = f"Game starting! We have a {game_type} puzzle with the clue: '{puzzle_clue}'. Welcome the players and build excitement for the game ahead!"
         response = self.get_commentary(prompt)
-        print(f"\n🎙️ COMMENTARY: {response}\n")
-        time.sleep(1)
+        output_sink.commentary(response)
+        game_clock.sleep(1)
     
     def wheel_spin_commentary(self, spin_result, player_num, winnings):
         """Commentary for wheel spins"""
@@ -90,8 +91,8 @@ Just respond with "Ready for commentary!" to confirm you understand.
             prompt = f"Player {player_num} spun ${spin_result}! Comment on this spin result and build anticipation for their letter guess."
         
         response = self.get_commentary(prompt)
-        print(f"\n🎙️ COMMENTARY: {response}\n")
-        time.sleep(1)
+        output_sink.commentary(response)
+        game_clock.sleep(1)
     
     def guess_result_commentary(self, guess, correct_count, dollar_value, showing, clue, previous_guesses, player_num, winnings):
         """Commentary for letter guess results"""
@@ -102,15 +103,15 @@ Just respond with "Ready for commentary!" to confirm you understand.
             prompt = f"Player {player_num} guessed '{guess}' but it's not in the puzzle. The clue is '{clue}'. Provide encouraging commentary about this miss."
         
         response = self.get_commentary(prompt)
-        print(f"\n🎙️ COMMENTARY: {response}\n")
-        time.sleep(1)
+        output_sink.commentary(response)
+        game_clock.sleep(1)
     
     def vowel_purchase_commentary(self, vowel, player_num, winnings):
         """Commentary for vowel purchases"""
         prompt = f"Player {player_num} bought the vowel '{vowel}' for $250. They now have ${winnings[player_num]} remaining. Comment on this strategic move."
         response = self.get_commentary(prompt)
-        print(f"\n🎙️ COMMENTARY: {response}\n")
-        time.sleep(1)
+        output_sink.commentary(response)
+        game_clock.sleep(1)
     
     def solve_attempt_commentary(self, attempt, correct, puzzle, player_num, winnings):
         """Commentary for solve attempts"""
@@ -120,15 +121,15 @@ Just respond with "Ready for commentary!" to confirm you understand.
             prompt = f"Player {player_num} guessed '{attempt}' but the correct answer was '{puzzle}'. Provide encouraging commentary about this close attempt."
         
         response = self.get_commentary(prompt)
-        print(f"\n🎙️ COMMENTARY: {response}\n")
-        time.sleep(1)
+        output_sink.commentary(response)
+        game_clock.sleep(1)
     
     def player_turn_commentary(self, player_num, player_type, winnings):
         """Commentary for player turn transitions"""
         prompt = f"It's Player {player_num}'s turn! They are a {player_type} player with ${winnings[player_num]} in winnings. Build anticipation for their turn."
         response = self.get_commentary(prompt)
-        print(f"\n🎙️ COMMENTARY: {response}\n")
-        time.sleep(1)
+        output_sink.commentary(response)
+        game_clock.sleep(1)
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -0,0 +1,103 @@
+"""
+Preloaded n-gram tables for the trigram/bigram computer player
+Built once per process and indexed by prefix
+"""
+
+from types import MappingProxyType
+
+# Frewquencies from: http://mathcenter.oxford.emory.edu/site/math125/englishLetterFreqs/
+# Most common trigrams (in order)
+TRIGRAMS = ("THE", "AND", "THA", "ENT", "ING", "ION", "TIO", "FOR", "NDE", "HAS", "NCE", "EDT", "TIS", "OFT",
+            "STH", "MEN")
+
+# frequent bigrams from a file ... http://practicalcryptography.com/media/cryptanalysis/files/english_bigrams_1.txt
+BIGRAM_FILE = "bigrams.txt"
+BIGRAM_LIMIT = 128 # Arbitrary threshold to use
+
+# Used when bigrams.txt is not around
+FALLBACK_BIGRAMS = ("TH", "HE", "IN", "EN", "NT", "RE", "ER", "AN", "TI", "ES", "ON", "AT", "SE", "ND", "OR", "AR",
+                    "AL", "TE", "CO", "DE", "TO", "RA", "ET", "ED", "IT", "SA", "EM", "RO")
+
+VOWELS = frozenset("AEIOU")
+
+
+def load_bigrams(path=BIGRAM_FILE, limit=BIGRAM_LIMIT):
+    """The first `limit` bigrams of the frequency file, most common first"""
+    bigrams = []
+    try:
+        with open(path) as g:
+            for line in g:
+                bigrams.append(line.rstrip('\n').split(' ')[0].upper())
+                if len(bigrams) == limit:
+                    break
+    except FileNotFoundError:
+        return FALLBACK_BIGRAMS[:limit]
+    return tuple(bigrams)
+
+
+def _index_by_prefix(ngrams):
+    """prefix -> ((rank, next letter), ...) in frequency order"""
+    index = {}
+    for rank, ngram in enumerate(ngrams):
+        index.setdefault(ngram[:-1], []).append((rank, ngram[-1]))
+    return MappingProxyType({prefix: tuple(entries) for prefix, entries in index.items()})
+
+
+class NGramModel:
+    """Read-only trigram and bigram tables keyed by the letters before a blank"""
+
+    __slots__ = ("trigrams", "bigrams", "trigram_index", "bigram_index")
+
+    def __init__(self, trigrams=TRIGRAMS, bigrams=FALLBACK_BIGRAMS):
+        self.trigrams = tuple(trigrams)
+        self.bigrams = tuple(bigrams)
+        self.trigram_index = _index_by_prefix(self.trigrams)
+        self.bigram_index = _index_by_prefix(self.bigrams)
+
+    @staticmethod
+    def _prefixes(showing, length):
+        """Revealed runs of `length` letters inside a word that are followed by a blank"""
+        prefixes = set()
+        for end in range(length, len(showing)):
+            if showing[end] != "_":
+                continue
+            prefix = showing[end - length:end]
+            if "_" not in prefix and " " not in prefix:
+                prefixes.add(prefix)
+        return prefixes
+
+    def _best(self, index, length, showing, previous_guesses, allow_vowels):
+        best_rank = None
+        guess = None
+        for prefix in self._prefixes(showing, length):
+            for rank, candidate in index.get(prefix, ()):
+                if best_rank is not None and rank >= best_rank:
+                    break
+                if candidate in VOWELS and not allow_vowels:
+                    continue
+                if candidate in previous_guesses:
+                    continue
+                best_rank = rank
+                guess = candidate
+                break
+        return guess
+
+    def trigram_guess(self, showing, previous_guesses, allow_vowels):
+        """Letter completing the most common trigram on the board, or None"""
+        return self._best(self.trigram_index, 2, showing, previous_guesses, allow_vowels)
+
+    def bigram_guess(self, showing, previous_guesses, allow_vowels):
+        """Letter completing the most common bigram on the board, or None"""
+        return self._best(self.bigram_index, 1, showing, previous_guesses, allow_vowels)
+
+
+# Shared models by bigram limit
+_models = {}
+
+
+def get_model(bigram_limit=BIGRAM_LIMIT):
+    """Shared model, built from bigrams.txt the first time a bigram limit is needed"""
+    model = _models.get(bigram_limit)
+    if model is None:
+        model = _models[bigram_limit] = NGramModel(TRIGRAMS, load_bigrams(limit=bigram_limit))
+    return model
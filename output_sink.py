@@ -0,0 +1,206 @@
+"""
+Output sinks for Wheel of Fortune
+Game and commentary output goes to one sink: straight to stdout, buffered until the end of
+the turn, into a file, kept as structured events, or thrown away without being formatted
+"""
+
+import sys
+import threading
+
+import event_log
+
+# Kinds of output the games emit
+# game: seed, welcome, game type and result; turn: whose turn it is; spin: the wheel;
+# guess: what a computer did; prompt: replies to a human; board: turn frames; commentary: the host
+KINDS = ("game", "turn", "spin", "guess", "prompt", "board", "commentary")
+
+OUTPUT_HELP = "--output=stdout|buffered|null|FILE   Print as it happens, once per turn, not at all, or into FILE"
+
+
+def format_line(kind, args):
+    """The text print used to show for these arguments"""
+    if kind == "commentary":
+        return f"\n🎙️ COMMENTARY: {args[0]}\n\n"
+    return " ".join(map(str, args)) + "\n"
+
+
+class NullSink:
+    """Discards everything; nothing is formatted"""
+
+    # Lets callers skip building output (whole frames, drawings) nobody will see
+    discards = True
+
+    def emit(self, kind, *args):
+        """One line of output, given the way print takes it"""
+        pass
+
+    def write(self, kind, text):
+        """Text that is already formatted (board frames, the wheel)"""
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+    def terminal(self):
+        """The interactive terminal output ends up on, if any (for animations drawn in place)"""
+        return None
+
+
+class StreamSink(NullSink):
+    """Writes every line as it comes, like print did"""
+
+    discards = False
+
+    def __init__(self, stream=None):
+        """
+        Args:
+            stream: Where output goes (default: sys.stdout at the time of writing)
+        """
+        self.stream = stream
+
+    def emit(self, kind, *args):
+        self.write(kind, format_line(kind, args))
+
+    def write(self, kind, text):
+        (self.stream or sys.stdout).write(text)
+
+    def flush(self):
+        (self.stream or sys.stdout).flush()
+
+    def terminal(self):
+        stream = self.stream or sys.stdout
+        return stream if getattr(stream, "isatty", lambda: False)() else None
+
+
+class BufferedSink(StreamSink):
+    """Keeps a turn's output and hands it to the stream in a single write on flush"""
+
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        self.parts = []
+
+    def write(self, kind, text):
+        self.parts.append(text)
+
+    def flush(self):
+        if self.parts:
+            stream = self.stream or sys.stdout
+            stream.write("".join(self.parts))
+            self.parts.clear()
+            stream.flush()
+
+
+class FileSink(BufferedSink):
+    """Buffered output into a file (opened on creation, closed by close)"""
+
+    def __init__(self, path, mode="w"):
+        super().__init__(open(path, mode, encoding="utf-8"))
+
+    def close(self):
+        self.flush()
+        self.stream.close()
+
+
+class EventSink(NullSink):
+    """
+    Keeps events instead of text: (kind, args) for emitted lines, arguments stored as given
+    and only formatted if text() is asked for, and (kind, text) for written text.
+    handler, when given, is called with each event instead of keeping it.
+    """
+
+    discards = False
+
+    def __init__(self, handler=None):
+        self.events = []
+        self.handler = handler or self.events.append
+
+    def emit(self, kind, *args):
+        self.handler((kind, args))
+
+    def write(self, kind, text):
+        self.handler((kind, text))
+
+    def text(self):
+        """Everything kept so far, as a StreamSink would have shown it"""
+        return "".join(payload if isinstance(payload, str) else format_line(kind, payload)
+                       for kind, payload in self.events)
+
+
+# The sink every game and commentary line goes to
+_sink = StreamSink()
+
+
+def get_sink():
+    return _sink
+
+
+def set_sink(sink):
+    """Swap the sink all output goes to; returns the previous one"""
+    global _sink
+    previous, _sink = _sink, sink
+    return previous
+
+
+def use_output(text):
+    """Switch to the sink for an --output value; returns the previous one"""
+    if text == "stdout":
+        return set_sink(StreamSink())
+    if text == "buffered":
+        return set_sink(BufferedSink())
+    if text == "null":
+        return set_sink(NullSink())
+    return set_sink(FileSink(text))
+
+
+def emit(kind, *args):
+    _sink.emit(kind, *args)
+
+
+def write(kind, text):
+    _sink.write(kind, text)
+
+
+def flush():
+    _sink.flush()
+
+
+def announce(*args):
+    """What computer players report with (the announce argument of the turn functions)"""
+    _sink.emit("guess", *args)
+
+
+# Commentary lines kept per thread by capture_commentary, instead of being shown
+_captured = threading.local()
+
+
+def commentary(text):
+    """A line from the host; also kept in the event log when one is running"""
+    lines = getattr(_captured, "lines", None)
+    if lines is not None:
+        lines.append(text)
+        return
+    event_log.record("commentary", text)
+    _sink.emit("commentary", text)
+
+
+def capture_commentary(function, *args):
+    """
+    Call function, keeping the commentary lines it makes on this thread rather than showing
+    them, and return the lines: a worker thread's commentary can then be shown by the thread
+    that owns the output, in a fixed order
+    """
+    _captured.lines = lines = []
+    try:
+        function(*args)
+    finally:
+        _captured.lines = None
+    return lines
+
+
+def ask(prompt):
+    """input() for humans: whatever is buffered is shown first"""
+    _sink.flush()
+    return input(prompt)
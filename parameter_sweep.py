@@ -0,0 +1,253 @@
+"""
+Parameter sweep for Wheel of Fortune strategy thresholds
+Plays the same seeded games under a grid or a random sample of tuning constants on all cores
+and reports every configuration against the built-in values in one table
+"""
+
+import functools
+import itertools
+import os
+import random
+import sys
+import time
+from multiprocessing import Pool
+
+import game_engine
+import ngram_model
+from game_stats import RunningStats
+from smart_player import SMART_ORDER, SAFE_LETTERS, VOWEL_THRESHOLD, CONSERVATIVE_VOWEL_THRESHOLD, SOLVE_BLANKS
+from strategy_registry import FixedOrderPlayer, TurnFunctionPlayer
+from wheel_of_fortune import ALPHABET_ORDER, computer_turn_trigrams_bigrams
+
+# name: (built-in value, grid values, (low, high) for random search, what it tunes)
+PARAMETERS = {
+    "vowel": (VOWEL_THRESHOLD, (0, 250, 500, 1000), (0, 2000),
+              "money before buying a vowel (computer_turn, computer_turn_smart_aggressive)"),
+    "conservative": (CONSERVATIVE_VOWEL_THRESHOLD, (250, 500, 1000, 2000), (0, 3000),
+                     "money before buying a vowel (computer_turn_smart_conservative)"),
+    "bigrams": (ngram_model.BIGRAM_LIMIT, (8, 16, 32, 128), (1, 256),
+                "bigrams used by computer_turn_trigrams_bigrams"),
+    "solve": (SOLVE_BLANKS, (0, 1, 3, 5), (0, 8),
+              "blanks left when a correct letter makes the caller solve (EnhancedWheelOfFortune.ai_turn)"),
+}
+BASELINE = {name: value for name, (value, _, _, _) in PARAMETERS.items()}
+
+# One of each player the parameters tune, rotated through the seats
+DEFAULT_LINEUP = ("aggressive", "conservative", "trigram")
+DEFAULT_GAMES = 3000
+DEFAULT_SHARD_SIZE = 250
+
+
+def player_factories(config):
+    """Player type -> factory(clue) for the types a configuration changes"""
+    model = ngram_model.get_model(config["bigrams"])
+    return {
+        "alphabet": lambda clue: FixedOrderPlayer(ALPHABET_ORDER, config["vowel"]),
+        "aggressive": lambda clue: FixedOrderPlayer(SMART_ORDER, config["vowel"]),
+        "smart": lambda clue: FixedOrderPlayer(SMART_ORDER, config["vowel"]),
+        "conservative": lambda clue: FixedOrderPlayer(SAFE_LETTERS, config["conservative"]),
+        "trigram": lambda clue: TurnFunctionPlayer(functools.partial(computer_turn_trigrams_bigrams, model=model)),
+    }
+
+
+def seating(lineup, index):
+    """Game `index` rotates the line-up so every type plays every seat equally often"""
+    shift = index % len(lineup)
+    return lineup[shift:] + lineup[:shift]
+
+
+def play_config(lineup, config, seed, index, max_turns=game_engine.MAX_TURNS):
+    """
+    Game `index` of a seeded run under a configuration. Every configuration gets the same
+    puzzle and random stream for a given index (common random numbers), so differences
+    between them come from the parameters rather than the draws.
+    """
+    type_of_players = seating(lineup, index)
+    state = game_engine.new_game(type_of_players, rng=game_engine.game_rng(seed, index))
+    factories = player_factories(config)
+    state.players = [factories[type_of_player](state.clue) if type_of_player in factories else player
+                     for type_of_player, player in zip(type_of_players, state.players)]
+    seats = game_engine.bot_seats(state)
+    solve_blanks = config["solve"]
+    blanks = state.showing.count("_")
+    while state.winner is None and state.turns_played < max_turns:
+        game_engine.play_turn(state, seats)
+        left = state.showing.count("_")
+        if left < blanks and left <= solve_blanks and state.winner is None:
+            # The player who just turned letters over keeps the turn and solves
+            game_engine.attempt_solve(state, state.puzzle)
+        blanks = left
+    return type_of_players, state.winner, state.winnings, state.turns_played
+
+
+class ConfigTotals:
+    """A configuration's results per strategy, and paired with the baseline on the same games"""
+
+    def __init__(self, lineup):
+        self.turns = RunningStats()
+        self.wins = {strategy: RunningStats() for strategy in lineup}
+        self.winnings = {strategy: RunningStats() for strategy in lineup}
+        self.win_change = {strategy: RunningStats() for strategy in lineup}
+        self.winnings_change = {strategy: RunningStats() for strategy in lineup}
+
+    def add(self, result, baseline):
+        type_of_players, winner, winnings, turns = result
+        self.turns.add(turns)
+        for seat, strategy in enumerate(type_of_players):
+            won = 1 if winner == seat else 0
+            self.wins[strategy].add(won)
+            self.winnings[strategy].add(winnings[seat])
+            self.win_change[strategy].add(won - (1 if baseline[1] == seat else 0))
+            self.winnings_change[strategy].add(winnings[seat] - baseline[2][seat])
+
+    def merge(self, other):
+        self.turns.merge(other.turns)
+        for totals, others in ((self.wins, other.wins), (self.winnings, other.winnings),
+                               (self.win_change, other.win_change), (self.winnings_change, other.winnings_change)):
+            for strategy, stats in others.items():
+                totals[strategy].merge(stats)
+
+
+@functools.lru_cache(maxsize=64)
+def baseline_results(lineup, seed, first, games):
+    # The built-in configuration's games of a shard, played once per worker
+    return tuple(play_config(lineup, BASELINE, seed, index) for index in range(first, first + games))
+
+
+def play_shard(shard):
+    """Worker: one configuration over games first to first + games, against the baseline"""
+    number, config, lineup, seed, first, games = shard
+    totals = ConfigTotals(lineup)
+    for index, baseline in zip(range(first, first + games), baseline_results(lineup, seed, first, games)):
+        totals.add(play_config(lineup, config, seed, index), baseline)
+    return number, totals
+
+
+def grid_configs(names):
+    """Every combination of the grid values of the parameters in names (the rest at baseline)"""
+    configs = []
+    for values in itertools.product(*(PARAMETERS[name][1] for name in names)):
+        configs.append({**BASELINE, **dict(zip(names, values))})
+    return configs
+
+
+def random_configs(names, count, rng):
+    """count configurations drawn uniformly from the random search ranges"""
+    configs = []
+    for _ in range(count):
+        config = dict(BASELINE)
+        for name in names:
+            low, high = PARAMETERS[name][2]
+            config[name] = rng.randint(low, high)
+        configs.append(config)
+    return configs
+
+
+def run_sweep(configs, lineup=DEFAULT_LINEUP, games=DEFAULT_GAMES, seed=None, workers=None,
+              shard_size=DEFAULT_SHARD_SIZE):
+    """
+    Play every configuration (and the baseline) on the same games across a process pool.
+    Returns [(config, ConfigTotals)] in the order given.
+    """
+    if seed is None:
+        seed = random.randrange(2**32)
+    print("Sweep seed:", seed)
+    lineup = tuple(lineup)
+    if BASELINE not in configs:
+        configs = [BASELINE] + configs
+    shards = [(number, config, lineup, seed, first, min(shard_size, games - first))
+              for first in range(0, games, shard_size) for number, config in enumerate(configs)]
+    totals = [ConfigTotals(lineup) for _ in configs]
+    with Pool(processes=workers or os.cpu_count()) as pool:
+        for number, shard_totals in pool.imap_unordered(play_shard, shards):
+            totals[number].merge(shard_totals)
+    return list(zip(configs, totals))
+
+
+def print_table(results, lineup, elapsed, stream=None):
+    """
+    One row per configuration, best first by the first strategy's win rate change:
+    parameters, mean turns, then per strategy win rate and its change from the baseline
+    (± two standard errors of the paired difference)
+    """
+    stream = stream or sys.stdout
+    names = list(PARAMETERS)
+    games = results[0][1].turns.count
+    stream.write(f"\n=== {len(results)} configurations x {games} games in {elapsed:.1f}s; "
+                 f"line-up {', '.join(lineup)} rotated through the seats ===\n")
+    stream.write("".join(f"{name:>13}" for name in names) + f"{'turns':>7}"
+                 + "".join(f"{strategy[:12]:>13}{'change':>14}" for strategy in lineup) + "\n")
+    lead = lineup[0]
+    for config, totals in sorted(results, key=lambda result: -result[1].win_change[lead].mean):
+        cells = "".join(f"{config[name]:>12}{'*' if config[name] != BASELINE[name] else ' '}" for name in names)
+        cells += f"{totals.turns.mean:>7.1f}"
+        for strategy in lineup:
+            change = totals.win_change[strategy]
+            error = 2 * change.stdev / max(change.count, 1) ** 0.5
+            cells += f"{totals.wins[strategy].mean:>13.3f}{change.mean:>+8.3f}±{error:.3f}"
+        stream.write(cells + "\n")
+    stream.write("* differs from the built-in value\n")
+    stream.flush()
+
+
+def print_usage():
+    print("\nWheel of Fortune Parameter Sweep")
+    print("=" * 50)
+    print("Usage: python parameter_sweep.py [player types ...] [options]")
+    print("\nParameters (built-in value, grid):")
+    for name, (value, grid, _, description) in PARAMETERS.items():
+        print(f"  {name:<13}{value:>5}  {grid}  {description}")
+    print("\nOptions:")
+    print("  --vary=A,B      Parameters to sweep (default: all)")
+    print("  --random=N      N random configurations instead of the grid")
+    print("  --games=N       Games per configuration (default 3000)")
+    print("  --workers=N     Worker processes (default: all cores)")
+    print("  --seed=N        Seed of the games every configuration plays (default: random)")
+    print(f"\nPlayer types default to {' '.join(DEFAULT_LINEUP)}")
+    print()
+
+
+if __name__ == '__main__':
+    names = list(PARAMETERS)
+    samples = None
+    games = DEFAULT_GAMES
+    workers = None
+    seed = None
+    lineup = []
+
+    for arg in sys.argv[1:]:
+        if arg.startswith('--vary='):
+            names = arg.split('=')[1].split(',')
+            unknown = [name for name in names if name not in PARAMETERS]
+            if unknown:
+                print("Unknown parameters:", ", ".join(unknown))
+                sys.exit(1)
+        elif arg.startswith('--random='):
+            samples = int(arg.split('=')[1])
+        elif arg.startswith('--games='):
+            games = int(arg.split('=')[1])
+        elif arg.startswith('--workers='):
+            workers = int(arg.split('=')[1])
+        elif arg.startswith('--seed='):
+            seed = int(arg.split('=')[1])
+        elif arg == '--help':
+            print_usage()
+            sys.exit()
+        elif arg in game_engine.STRATEGIES:
+            lineup.append(arg)
+        else:
+            print("Unknown argument:", arg)
+            print_usage()
+            sys.exit(1)
+
+    lineup = tuple(lineup) or DEFAULT_LINEUP
+    if len(lineup) != 3:
+        print("A line-up is three player types")
+        sys.exit(1)
+    if samples is None:
+        configs = grid_configs(names)
+    else:
+        configs = random_configs(names, samples, random.Random(seed))
+    start = time.perf_counter()
+    results = run_sweep(configs, lineup, games, seed, workers)
+    print_table(results, lineup, time.perf_counter() - start)
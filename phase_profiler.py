@@ -0,0 +1,171 @@
+"""
+Per-phase profiling for the Wheel of Fortune game loops
+Times decision, spin, board update, rendering, commentary and pacing, with counts and latency histograms
+"""
+
+import signal
+import sys
+import time
+
+PHASES = ("decision", "spin", "board_update", "rendering", "commentary", "pacing")
+
+# Histogram bucket b holds latencies below 2**b microseconds (the last one holds everything slower)
+BUCKETS = 28
+
+
+class _Timing:
+    """Times one phase; nested phases are taken out of the enclosing phase's time"""
+
+    __slots__ = ("profiler", "name", "start", "inner")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.inner = 0.0
+        self.profiler._stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        stack = self.profiler._stack
+        stack.pop()
+        if stack:
+            stack[-1].inner += elapsed
+        self.profiler.record(self.name, elapsed - self.inner)
+        return False
+
+
+class _NoTiming:
+    """What phase() hands out while profiling is off: does nothing"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NO_TIMING = _NoTiming()
+
+
+class PhaseProfiler:
+    """Counts, total, worst case and a log2 latency histogram per phase"""
+
+    def __init__(self):
+        self.counts = {}
+        self.totals = {}
+        self.worst = {}
+        self.histograms = {}
+        self.started = time.perf_counter()
+        self._stack = []
+
+    def phase(self, name):
+        return _Timing(self, name)
+
+    def record(self, name, seconds):
+        if name not in self.counts:
+            self.counts[name] = 0
+            self.totals[name] = 0.0
+            self.worst[name] = 0.0
+            self.histograms[name] = [0] * BUCKETS
+        self.counts[name] += 1
+        self.totals[name] += seconds
+        if seconds > self.worst[name]:
+            self.worst[name] = seconds
+        self.histograms[name][min(int(seconds * 1e6).bit_length(), BUCKETS - 1)] += 1
+
+    def quantile(self, name, fraction):
+        """Upper bound of the histogram bucket holding the given fraction of a phase's calls, in seconds"""
+        target = fraction * self.counts[name]
+        seen = 0
+        for bucket, count in enumerate(self.histograms[name]):
+            seen += count
+            if seen >= target:
+                return min(2 ** bucket / 1e6, self.worst[name])
+        return self.worst[name]
+
+    def snapshot(self):
+        """Plain dict of everything recorded so far"""
+        return {name: {"count": self.counts[name], "total": self.totals[name], "worst": self.worst[name],
+                       "histogram": list(self.histograms[name])}
+                for name in self.counts}
+
+    def report(self):
+        """Table of the phases, in PHASES order then any others, as a string"""
+        wall = time.perf_counter() - self.started
+        names = [name for name in PHASES if name in self.counts]
+        names += sorted(name for name in self.counts if name not in PHASES)
+        lines = [f"=== Phase profile ({wall:.2f}s wall) ===",
+                 f"{'phase':<14}{'count':>8}{'total s':>10}{'share':>8}{'mean ms':>10}{'p50 ms':>10}"
+                 f"{'p99 ms':>10}{'max ms':>10}"]
+        for name in names:
+            count = self.counts[name]
+            total = self.totals[name]
+            lines.append(f"{name:<14}{count:>8}{total:>10.3f}{total / max(wall, 1e-9):>8.1%}"
+                         f"{total / count * 1e3:>10.3f}{self.quantile(name, 0.5) * 1e3:>10.3f}"
+                         f"{self.quantile(name, 0.99) * 1e3:>10.3f}{self.worst[name] * 1e3:>10.3f}")
+        for name in names:
+            histogram = self.histograms[name]
+            used = [bucket for bucket, count in enumerate(histogram) if count]
+            buckets = ", ".join(f"<{_format_micros(2 ** bucket)}: {histogram[bucket]}"
+                                for bucket in range(used[0], used[-1] + 1))
+            lines.append(f"{name:<14}{buckets}")
+        return "\n".join(lines)
+
+    def dump(self, file=None):
+        print(self.report(), file=file or sys.stdout)
+        (file or sys.stdout).flush()
+
+
+def _format_micros(micros):
+    if micros >= 1e6:
+        return f"{micros / 1e6:g}s"
+    if micros >= 1e3:
+        return f"{micros / 1e3:g}ms"
+    return f"{micros}us"
+
+
+# The profiler the game loops report to; None keeps phase() down to one global lookup
+_active = None
+
+
+def phase(name):
+    """Context manager timing one phase on the active profiler, a shared no-op when profiling is off"""
+    if _active is None:
+        return _NO_TIMING
+    return _active.phase(name)
+
+
+def start(profiler=None):
+    """Turn profiling on (with a fresh PhaseProfiler unless one is given) and return the profiler"""
+    global _active
+    _active = profiler if profiler is not None else PhaseProfiler()
+    return _active
+
+
+def stop():
+    """Turn profiling off and return the profiler that was active"""
+    global _active
+    profiler, _active = _active, None
+    return profiler
+
+
+def active():
+    return _active
+
+
+def dump(file=None):
+    """Print the active profile, if any"""
+    if _active is not None:
+        _active.dump(file)
+
+
+def dump_on_signal(signal_number=getattr(signal, "SIGUSR1", None)):
+    """Print the profile so far whenever the process gets signal_number (kill -USR1 <pid>)"""
+    if signal_number is not None:
+        signal.signal(signal_number, lambda number, frame: dump(sys.stderr))
@@ -0,0 +1,85 @@
+"""
+Puzzle corpus for Wheel of Fortune
+Loads valid.csv once and hands out uniformly random puzzles in O(1)
+"""
+
+import os
+import random
+from array import array
+
+PUZZLE_FILE = "../../data/puzzles/valid.csv"
+
+# Files bigger than this keep only a byte-offset index in memory and read rows on demand
+IN_MEMORY_LIMIT = 64 * 1024 * 1024
+
+
+def parse_row(line):
+    """Split a valid.csv line into (puzzle, clue, date, game_type)"""
+    puzzle, clue, date, game_type = line.rstrip('\r\n').split(',')
+    clue = clue.replace("&amp;", "&") # HTML Code
+    puzzle = puzzle.replace("&amp;", "&") # HTML Code
+    return puzzle, clue, date, game_type
+
+
+class PuzzleCorpus:
+    """All rows of a puzzle file, randomly accessible by row number"""
+
+    def __init__(self, path=PUZZLE_FILE, index_only=None):
+        """
+        Args:
+            path: CSV of puzzle,clue,date,game_type rows
+            index_only: Keep byte offsets instead of parsed rows (default: only for big files)
+        """
+        self.path = path
+        if index_only is None:
+            index_only = os.path.getsize(path) > IN_MEMORY_LIMIT
+        self.rows = None
+        self.offsets = None
+        self._file = None
+
+        if index_only:
+            self.offsets = array('q')
+            position = 0
+            with open(path, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        self.offsets.append(position)
+                    position += len(line)
+        else:
+            with open(path) as f:
+                self.rows = [parse_row(line) for line in f if line.strip()]
+
+    def __len__(self):
+        if self.rows is not None:
+            return len(self.rows)
+        return len(self.offsets)
+
+    def __getitem__(self, number):
+        if self.rows is not None:
+            return self.rows[number]
+        if self._file is None:
+            self._file = open(self.path, 'rb')
+        self._file.seek(self.offsets[number])
+        return parse_row(self._file.readline().decode())
+
+    def random_puzzle(self, rng=random):
+        """Any row with equal probability"""
+        return self[rng.randrange(len(self))]
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+_corpora = {}
+
+
+def get_corpus(path=None):
+    """Shared corpus per path (default PUZZLE_FILE) so the file is only read once per process"""
+    if path is None:
+        path = PUZZLE_FILE
+    corpus = _corpora.get(path)
+    if corpus is None:
+        corpus = _corpora[path] = PuzzleCorpus(path)
+    return corpus
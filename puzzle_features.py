@@ -0,0 +1,304 @@
+"""
+Puzzle feature index for Wheel of Fortune
+One offline pass over valid.csv works out each puzzle's length, words, distinct letters, vowel ratio,
+category and how many turns every computer player needs for it; the index file loads in milliseconds
+so games can draw puzzles by difficulty or category and results can be sliced by puzzle
+"""
+
+import array
+import json
+import os
+import struct
+import sys
+from collections import namedtuple
+
+import puzzle_corpus
+from board_state import LETTER_BITS
+
+MAGIC = b"WOFX"
+VERSION = 1
+# Next to the puzzle file: valid.csv -> valid.csv.features
+SUFFIX = ".features"
+
+# Seeded games per puzzle and strategy the expected turns are averaged over
+DEFAULT_GAMES = 4
+# Strategies the expected turns are measured for: ones that finish games and always play the same
+# game for a seed. Left out: conservative (every puzzle hits MAX_TURNS), aggressive (the same
+# player as smart) and rollout (looks its answers up in this corpus, and is slow)
+DEFAULT_STRATEGIES = ("alphabet", "morse", "oxford", "trigram", "solver", "smart")
+DEFAULT_SHARD_SIZE = 100
+
+VOWELS = "AEIOU"
+
+PuzzleFeatures = namedtuple("PuzzleFeatures", ["length", "words", "distinct", "vowel_ratio", "category", "game_type",
+                                               "turns", "difficulty"])
+
+# Columns as array typecodes: letters in the puzzle, words, distinct letters, vowels / letters,
+# category and game type as numbers into their name lists, and difficulty (0 easiest to 1 hardest)
+_COLUMNS = (("length", "H"), ("words", "B"), ("distinct", "B"), ("vowel_ratio", "f"), ("category", "H"),
+            ("game_type", "H"), ("difficulty", "f"))
+_HEADER = struct.Struct("<4sBII")
+
+
+def text_features(puzzle):
+    """(length, words, distinct letters, vowel ratio) of a puzzle; length counts letters only"""
+    letters = [character for character in puzzle if character in LETTER_BITS]
+    vowels = sum(1 for letter in letters if letter in VOWELS)
+    return len(letters), len(puzzle.split()), len(set(letters)), vowels / max(len(letters), 1)
+
+
+def expected_turns(puzzle_entry, strategies, games, seed, row):
+    """
+    Mean turns to solve a puzzle with each strategy in all three seats, over seeded games
+    (a game one strategy cannot finish counts as game_engine.MAX_TURNS)
+    """
+    import game_engine
+    turns = []
+    for strategy in strategies:
+        lineup = (strategy,) * 3
+        total = 0
+        for game in range(games):
+            rng = game_engine.game_rng(seed, f"{row}:{strategy}:{game}")
+            total += game_engine.play_game(lineup, puzzle_entry, rng=rng).turns
+        turns.append(total / games)
+    return turns
+
+
+def measure_shard(shard):
+    """Worker: expected turns for rows first to first + count"""
+    path, strategies, games, seed, first, count = shard
+    corpus = puzzle_corpus.get_corpus(path)
+    return first, [expected_turns(corpus[row], strategies, games, seed, row) for row in range(first, first + count)]
+
+
+def percentile_ranks(values):
+    """Where each value ranks from 0 (smallest) to 1 (largest); equal values share their mean rank"""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    scale = max(len(values) - 1, 1)
+    start = 0
+    while start < len(order):
+        end = start
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[start]]:
+            end += 1
+        for position in range(start, end + 1):
+            ranks[order[position]] = (start + end) / 2 / scale
+        start = end + 1
+    return ranks
+
+
+def _number(names, name):
+    # Column value of a category or game type name; None matches everything, -1 nothing
+    if name is None:
+        return None
+    return names.index(name) if name in names else -1
+
+
+class FeatureIndex:
+    """Per-puzzle features as columns (arrays) in corpus row order"""
+
+    def __init__(self, strategies, categories, game_types, columns, turns):
+        self.strategies = list(strategies)
+        self.categories = list(categories)
+        self.game_types = list(game_types)
+        self.columns = columns
+        # turns[strategy] is that strategy's expected turns for every row
+        self.turns = turns
+        self._selections = {}
+
+    def __len__(self):
+        return len(self.columns["length"])
+
+    def __getitem__(self, row):
+        columns = self.columns
+        return PuzzleFeatures(columns["length"][row], columns["words"][row], columns["distinct"][row],
+                              columns["vowel_ratio"][row], self.categories[columns["category"][row]],
+                              self.game_types[columns["game_type"][row]],
+                              {strategy: self.turns[strategy][row] for strategy in self.strategies},
+                              columns["difficulty"][row])
+
+    def rows(self, category=None, difficulty=None, game_type=None):
+        """
+        Row numbers of the puzzles in a category / game type with difficulty in [low, high].
+        Each selection is worked out once and kept.
+        """
+        key = (category, difficulty, game_type)
+        rows = self._selections.get(key)
+        if rows is None:
+            columns = self.columns
+            wanted_category = _number(self.categories, category)
+            wanted_type = _number(self.game_types, game_type)
+            low, high = difficulty if difficulty is not None else (0.0, 1.0)
+            rows = array.array("I", (row for row in range(len(self))
+                                     if (wanted_category is None or columns["category"][row] == wanted_category)
+                                     and (wanted_type is None or columns["game_type"][row] == wanted_type)
+                                     and low <= columns["difficulty"][row] <= high))
+            self._selections[key] = rows
+        return rows
+
+    def sample(self, rng, category=None, difficulty=None, game_type=None):
+        """A random row number among rows(...)"""
+        rows = self.rows(category, difficulty, game_type)
+        if not rows:
+            raise ValueError(f"No puzzle with category={category} difficulty={difficulty} game_type={game_type}")
+        return rows[rng.randrange(len(rows))]
+
+    def dumps(self):
+        names = json.dumps({"strategies": self.strategies, "categories": self.categories,
+                            "game_types": self.game_types}).encode("utf-8")
+        parts = [_HEADER.pack(MAGIC, VERSION, len(self), len(names)), names]
+        for name, _ in _COLUMNS:
+            parts.append(self.columns[name].tobytes())
+        for strategy in self.strategies:
+            parts.append(self.turns[strategy].tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def loads(cls, data):
+        magic, version, count, names_length = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not a puzzle feature index")
+        if version != VERSION:
+            raise ValueError(f"Feature index version {version} is not supported (expected {VERSION})")
+        offset = _HEADER.size
+        names = json.loads(data[offset:offset + names_length])
+        offset += names_length
+
+        def column(typecode):
+            nonlocal offset
+            values = array.array(typecode)
+            size = values.itemsize * count
+            values.frombytes(data[offset:offset + size])
+            offset += size
+            return values
+
+        columns = {name: column(typecode) for name, typecode in _COLUMNS}
+        turns = {strategy: column("f") for strategy in names["strategies"]}
+        return cls(names["strategies"], names["categories"], names["game_types"], columns, turns)
+
+
+def build_index(path=None, strategies=None, games=DEFAULT_GAMES, seed=0, workers=None,
+                shard_size=DEFAULT_SHARD_SIZE):
+    """
+    Work out every puzzle's features (the expected turns on a process pool).
+    Difficulty ranks puzzles by how they rank for each strategy, so a strategy that never
+    finishes (every puzzle at MAX_TURNS) or takes ten times as long does not drown out the others.
+    """
+    from multiprocessing import Pool
+
+    if path is None:
+        path = puzzle_corpus.PUZZLE_FILE
+    if strategies is None:
+        strategies = list(DEFAULT_STRATEGIES)
+    corpus = puzzle_corpus.get_corpus(path)
+    count = len(corpus)
+
+    categories, game_types = [], []
+    columns = {name: array.array(typecode) for name, typecode in _COLUMNS}
+    for row in range(count):
+        puzzle, clue, _, game_type = corpus[row]
+        length, words, distinct, vowel_ratio = text_features(puzzle)
+        if clue not in categories:
+            categories.append(clue)
+        if game_type not in game_types:
+            game_types.append(game_type)
+        columns["length"].append(length)
+        columns["words"].append(min(words, 255))
+        columns["distinct"].append(distinct)
+        columns["vowel_ratio"].append(vowel_ratio)
+        columns["category"].append(categories.index(clue))
+        columns["game_type"].append(game_types.index(game_type))
+
+    turns = {strategy: array.array("f", [0.0]) * count for strategy in strategies}
+    shards = [(path, strategies, games, seed, first, min(shard_size, count - first))
+              for first in range(0, count, shard_size)]
+    with Pool(processes=workers or os.cpu_count()) as pool:
+        for first, shard_turns in pool.imap_unordered(measure_shard, shards):
+            for row, row_turns in enumerate(shard_turns, first):
+                for strategy, value in zip(strategies, row_turns):
+                    turns[strategy][row] = value
+
+    strategy_ranks = [percentile_ranks(turns[strategy]) for strategy in strategies]
+    columns["difficulty"] = array.array("f", percentile_ranks([sum(ranks[row] for ranks in strategy_ranks)
+                                                               for row in range(count)]))
+    return FeatureIndex(strategies, categories, game_types, columns, turns)
+
+
+def index_path(path=None):
+    return (puzzle_corpus.PUZZLE_FILE if path is None else path) + SUFFIX
+
+
+def save(index, path):
+    """Write an index; the old one stays whole until the new one is complete"""
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(index.dumps())
+    os.replace(temporary, path)
+
+
+def load(path):
+    with open(path, "rb") as f:
+        return FeatureIndex.loads(f.read())
+
+
+_indexes = {}
+
+
+def get_features(path=None):
+    """
+    Shared feature index of a puzzle file (default puzzle_corpus.PUZZLE_FILE), loaded from
+    the file build_index wrote next to it (python puzzle_features.py build)
+    """
+    if path is None:
+        path = puzzle_corpus.PUZZLE_FILE
+    index = _indexes.get(path)
+    if index is None:
+        if not os.path.exists(index_path(path)):
+            raise FileNotFoundError(f"No feature index for {path}: run python puzzle_features.py build")
+        index = load(index_path(path))
+        if len(index) != len(puzzle_corpus.get_corpus(path)):
+            raise ValueError(f"{index_path(path)} is out of date with {path}: run python puzzle_features.py build")
+        _indexes[path] = index
+    return index
+
+
+def print_usage():
+    print("\nWheel of Fortune Puzzle Features")
+    print("=" * 50)
+    print("Usage: python puzzle_features.py build [--games=N] [--strategies=a,b] [--workers=N] [--seed=N]")
+    print("       python puzzle_features.py show [--category=C] [--difficulty=LOW,HIGH]")
+    print(f"\nThe index is written next to the puzzle file ({index_path()})")
+    print()
+
+
+if __name__ == '__main__':
+    import time
+
+    options = dict(arg[2:].split('=', 1) for arg in sys.argv[2:] if arg.startswith('--') and '=' in arg)
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    start = time.perf_counter()
+    if command == "build":
+        strategies = options["strategies"].split(",") if "strategies" in options else None
+        index = build_index(strategies=strategies, games=int(options.get("games", DEFAULT_GAMES)),
+                            seed=int(options.get("seed", 0)),
+                            workers=int(options["workers"]) if "workers" in options else None)
+        save(index, index_path())
+        print(f"Indexed {len(index)} puzzles for {', '.join(index.strategies)} in "
+              f"{time.perf_counter() - start:.1f}s -> {index_path()} ({os.path.getsize(index_path())} bytes)")
+    elif command == "show":
+        index = get_features()
+        loaded = time.perf_counter() - start
+        difficulty = tuple(map(float, options["difficulty"].split(","))) if "difficulty" in options else None
+        rows = index.rows(options.get("category"), difficulty)
+        print(f"{len(index)} puzzles loaded in {loaded * 1000:.1f}ms; {len(rows)} selected")
+        print(f"{'strategy':<14}{'mean turns':>12}")
+        for strategy in index.strategies:
+            turns = index.turns[strategy]
+            print(f"{strategy:<14}{sum(turns[row] for row in rows) / max(len(rows), 1):>12.1f}")
+        corpus = puzzle_corpus.get_corpus()
+        for row in sorted(rows, key=lambda row: index.columns["difficulty"][row])[:: max(len(rows) // 5, 1)]:
+            features = index[row]
+            print(f"  {features.difficulty:.2f} {features.category:<12} {corpus[row][0]}")
+    else:
+        print_usage()
+        sys.exit(1)
@@ -0,0 +1,309 @@
+"""
+Monte Carlo rollout player for Wheel of Fortune
+Each turn it draws puzzles from valid.csv that fit the board, plays the rest of the game out from
+every candidate move with a stripped-down integer loop, and makes the move that won most often.
+Headless and seeded games stop at a fixed number of rollouts so they replay exactly; live games
+(use_move_budget) stop when a per-move time budget is spent instead
+"""
+
+import random
+import time
+
+import output_sink
+import puzzle_corpus
+from board_state import ALPHABET, LETTER_BITS, GuessedLetters
+from smart_player import SMART_ORDER, SOLVE_BLANKS
+from wheel_of_fortune import WHEEL_VALUES
+
+VOWEL_COST = 250
+VOWEL_BITS = sum(LETTER_BITS[vowel] for vowel in "AEIOU")
+
+# Seconds a move may spend on rollouts in live play, and the rollouts per candidate move it stops at
+# regardless (headless moves always play all of them: about the work the live budget allows)
+MOVE_BUDGET = 0.005
+MAX_ROLLOUTS = 100
+
+# Candidate moves weighed each turn: the likeliest consonants and vowels, and the likeliest solution
+CONSONANT_CANDIDATES = 3
+VOWEL_CANDIDATES = 2
+# Turns a rollout plays before counting the game as lost
+ROLLOUT_TURNS = 60
+# Wheel draws shared by every candidate move of one rollout (common random numbers)
+DRAWS = 32
+
+# First move of a rollout other than calling a letter
+SOLVE_WRONG = -1
+
+# Everyone in a rollout calls letters in this order, buying vowels once they can afford one
+_ORDER = tuple(ALPHABET.index(letter) for letter in SMART_ORDER)
+_WHEEL = tuple(WHEEL_VALUES)
+
+
+def puzzle_shape(text):
+    """A puzzle or board with every letter (or blank) as "_": puzzles that fit a board share its shape"""
+    return "".join("_" if character == "_" or character in LETTER_BITS else character for character in text)
+
+
+class ShapeIndex:
+    """Every puzzle of a corpus by shape; repeats stay in, so likelier puzzles are drawn more often"""
+
+    def __init__(self, corpus):
+        self.by_shape = {}
+        for row in range(len(corpus)):
+            puzzle = corpus[row][0]
+            self.by_shape.setdefault(puzzle_shape(puzzle), []).append(puzzle)
+
+    def candidates(self, showing, guessed_mask, within=None):
+        """
+        Puzzles that show exactly `showing` once the guessed letters are called: the same
+        letters where the board has them, and no called letter under a blank.
+        within narrows an earlier answer (boards only ever fill in).
+        """
+        pool = self.by_shape.get(puzzle_shape(showing), ()) if within is None else within
+        revealed = [(position, character) for position, character in enumerate(showing) if character in LETTER_BITS]
+        revealed_mask = _mask(showing)
+        matches = []
+        for puzzle in pool:
+            if _mask(puzzle) & guessed_mask != revealed_mask:
+                continue
+            for position, character in revealed:
+                if puzzle[position] != character:
+                    break
+            else:
+                matches.append(puzzle)
+        return matches
+
+
+def _mask(text):
+    mask = 0
+    for character in text:
+        mask |= LETTER_BITS.get(character, 0)
+    return mask
+
+
+def _letter_counts(puzzle, guessed_mask):
+    # Copies of each uncalled letter in a candidate puzzle, by ALPHABET index
+    counts = [0] * 26
+    for character in puzzle:
+        bit = LETTER_BITS.get(character)
+        if bit is not None and not bit & guessed_mask:
+            counts[ALPHABET.index(character)] += 1
+    return counts
+
+
+def rollout(counts, hidden, guessed_mask, winnings, seat, first, draws):
+    """
+    Play a game out from seat's move `first` (a letter index, or SOLVE_WRONG for a failed
+    solve) with nothing but integers: counts[i] copies of ALPHABET[i] are hidden, hidden in
+    all. Everyone then calls letters in SMART_ORDER, buying vowels once they can afford them,
+    and solves as soon as a letter they call leaves SOLVE_BLANKS or fewer blanks.
+    Returns True when seat wins.
+    """
+    bank0, bank1, bank2 = winnings
+    player = seat
+    draw = 0
+    wheel = _WHEEL
+    spins = len(wheel)
+    for _ in range(ROLLOUT_TURNS):
+        if first is not None:
+            letter = first
+            first = None
+            if letter == SOLVE_WRONG:
+                player = (player + 1) % 3
+                continue
+        else:
+            bank = bank0 if player == 0 else bank1 if player == 1 else bank2
+            letter = -1
+            for candidate in _ORDER:
+                bit = 1 << candidate
+                if guessed_mask & bit or (bit & VOWEL_BITS and bank < VOWEL_COST):
+                    continue
+                letter = candidate
+                break
+            if letter < 0:
+                return False # Nothing left to call
+        bit = 1 << letter
+        if bit & VOWEL_BITS:
+            dollar = 0
+            if player == 0:
+                bank0 -= VOWEL_COST
+            elif player == 1:
+                bank1 -= VOWEL_COST
+            else:
+                bank2 -= VOWEL_COST
+        else:
+            dollar = wheel[int(draws[draw] * spins)]
+            draw = (draw + 1) % DRAWS
+            if dollar <= 0:
+                if dollar < 0: # Bankrupt
+                    if player == 0:
+                        bank0 = 0
+                    elif player == 1:
+                        bank1 = 0
+                    else:
+                        bank2 = 0
+                player = (player + 1) % 3
+                continue
+        guessed_mask |= bit
+        copies = counts[letter]
+        if not copies:
+            player = (player + 1) % 3
+            continue
+        hidden -= copies
+        if player == 0:
+            bank0 += dollar * copies
+        elif player == 1:
+            bank1 += dollar * copies
+        else:
+            bank2 += dollar * copies
+        if hidden <= SOLVE_BLANKS:
+            return player == seat
+    return False
+
+
+class RolloutPlayer:
+    """
+    Weighs spinning for its likeliest consonants, buying its likeliest vowels and solving
+    with its likeliest puzzle by playing each out against puzzles drawn from the corpus.
+    With budget None (the default) max_rollouts is what stops a move, so moves are reproducible
+    for a board; a time budget makes them depend on how fast the machine is.
+    """
+
+    __slots__ = ("clue", "budget", "max_rollouts", "index", "rng", "candidates", "attempts")
+
+    def __init__(self, clue=None, budget=None, max_rollouts=MAX_ROLLOUTS, index=None):
+        self.clue = clue
+        self.budget = budget
+        self.max_rollouts = max_rollouts
+        self.index = index
+        self.rng = random.Random()
+        self.candidates = None # Puzzles that fit the board last turn
+        self.attempts = set()
+
+    def choose_move(self, showing, winnings, guessed_mask, turn):
+        """
+        ("solve", puzzle), ("vowel", letter) or ("spin", consonant), or None when no
+        puzzle fits the board
+        """
+        if self.index is None:
+            self.index = get_shape_index()
+        self.candidates = self.index.candidates(showing, guessed_mask, self.candidates)
+        if not self.candidates:
+            return None
+        # The same board always gets the same rollouts
+        self.rng.seed(f"{showing}|{guessed_mask}|{winnings}|{turn % 3}")
+        seat = turn % 3
+
+        samples = {}
+        for puzzle in self.candidates:
+            samples[puzzle] = samples.get(puzzle, 0) + 1
+        expected = [0.0] * 26
+        counts = {}
+        for puzzle, weight in samples.items():
+            counts[puzzle] = _letter_counts(puzzle, guessed_mask)
+            for letter, copies in enumerate(counts[puzzle]):
+                expected[letter] += weight * copies
+
+        moves = []
+        solutions = [puzzle for puzzle in sorted(samples, key=lambda p: -samples[p]) if puzzle not in self.attempts]
+        if solutions:
+            moves.append(("solve", solutions[0]))
+        uncalled = [letter for letter in range(26) if not guessed_mask & (1 << letter) and expected[letter] > 0]
+        uncalled.sort(key=lambda letter: -expected[letter])
+        consonants = [letter for letter in uncalled if not (1 << letter) & VOWEL_BITS]
+        moves += [("spin", letter) for letter in consonants[:CONSONANT_CANDIDATES]]
+        if winnings[seat] >= VOWEL_COST:
+            vowels = [letter for letter in uncalled if (1 << letter) & VOWEL_BITS]
+            moves += [("vowel", letter) for letter in vowels[:VOWEL_CANDIDATES]]
+        if len(moves) == 1:
+            return moves[0] if moves[0][0] == "solve" else (moves[0][0], ALPHABET[moves[0][1]])
+        if not moves:
+            return None
+
+        hidden = showing.count("_")
+        bank = tuple(winnings)
+        wins = [0] * len(moves)
+        random_number = self.rng.random
+        population = self.candidates
+        deadline = None if self.budget is None else time.perf_counter() + self.budget
+        for _ in range(self.max_rollouts):
+            puzzle = population[int(random_number() * len(population))]
+            puzzle_counts = counts[puzzle]
+            draws = [random_number() for _ in range(DRAWS)]
+            for number, (kind, move) in enumerate(moves):
+                if kind == "solve":
+                    if move == puzzle:
+                        wins[number] += 1
+                    elif rollout(puzzle_counts, hidden, guessed_mask, bank, seat, SOLVE_WRONG, draws):
+                        wins[number] += 1
+                elif rollout(puzzle_counts, hidden, guessed_mask, bank, seat, move, draws):
+                    wins[number] += 1
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+
+        kind, move = moves[max(range(len(moves)), key=wins.__getitem__)]
+        return (kind, move) if kind == "solve" else (kind, ALPHABET[move])
+
+    def take_turn(self, showing, winnings, previous_guesses, turn, spin, announce=output_sink.announce):
+        """Same contract as the computer_turn_* functions: returns (guess, dollar)"""
+        if not isinstance(previous_guesses, GuessedLetters):
+            previous_guesses = GuessedLetters(previous_guesses)
+        move = self.choose_move(showing, winnings, previous_guesses.mask, turn)
+        if move is None:
+            move = self.fallback(winnings, previous_guesses, turn)
+        kind, guess = move
+        if kind == "solve":
+            self.attempts.add(guess)
+            announce("Computer solves:", guess)
+            return guess, 0
+        if kind == "vowel":
+            announce("Computer bought:", guess)
+            winnings[(turn % 3)] = winnings[(turn % 3)] - VOWEL_COST
+            return guess, 0
+
+        dollar = spin()
+        if dollar == 0:
+            announce("Computer lost a turn")
+            return "_", dollar
+        elif dollar == -1:
+            announce("Computer went bankrupt")
+            winnings[(turn % 3)] = 0
+            return "_", dollar
+        announce("Computer guessed:", guess)
+        return guess, dollar
+
+    @staticmethod
+    def fallback(winnings, previous_guesses, turn):
+        # A board no corpus puzzle fits: call letters in SMART_ORDER like the smart player
+        for letter in SMART_ORDER:
+            if letter in previous_guesses:
+                continue
+            if letter in "AEIOU":
+                if winnings[turn % 3] >= VOWEL_COST:
+                    return "vowel", letter
+                continue
+            return "spin", letter
+        return "spin", SMART_ORDER[-1]
+
+
+def use_move_budget(players, budget=MOVE_BUDGET):
+    """
+    Time-budget the rollout players among a game's players. Only for games people are
+    waiting on: budgeted moves depend on machine speed, so the game no longer replays from its seed.
+    """
+    for player in players:
+        if isinstance(player, RolloutPlayer):
+            player.budget = budget
+
+
+_indexes = {}
+
+
+def get_shape_index(path=None):
+    """Shared shape index per puzzle file (default puzzle_corpus.PUZZLE_FILE), built on first use"""
+    if path is None:
+        path = puzzle_corpus.PUZZLE_FILE
+    index = _indexes.get(path)
+    if index is None:
+        index = _indexes[path] = ShapeIndex(puzzle_corpus.get_corpus(path))
+    return index
@@ -5,104 +5,118 @@ Mock implementations for testing
 
 import random
 
-def computer_turn_smart(showing, winnings, previous_guesses, turn):
+import output_sink
+
+SIMPLE_WHEEL_VALUES = [0, -1, 500, 550, 600, 650, 700, 750, 800, 850, 900]
+
+# Letter orders the smart players call in
+SMART_ORDER = "ETAOINSHRDLUCMFWYGPBVKQJXZ"
+SAFE_LETTERS = "RSTLNE"  # Wheel of Fortune bonus round letters
+
+# Money a player must have before buying a vowel (a vowel costs 250)
+VOWEL_THRESHOLD = 250
+CONSERVATIVE_VOWEL_THRESHOLD = 500
+
+# Computer players go for the solve once a letter they call leaves this many blanks or fewer
+SOLVE_BLANKS = 3
+
+def spin_wheel_simple(rng=random):
+    """Simplified wheel spin for smart players"""
+    return rng.choice(SIMPLE_WHEEL_VALUES)
+
+def computer_turn_smart(showing, winnings, previous_guesses, turn, spin=spin_wheel_simple, announce=output_sink.announce):
     """Smart computer player strategy"""
     # Simple implementation - prioritize common letters
     common_letters = "RSTLNE"  # Wheel of Fortune bonus round letters
-    alphabet = "ETAOINSHRDLUCMFWYGPBVKQJXZ"
+    alphabet = SMART_ORDER
     
     dollar = 0
     for character in alphabet:
         if character in previous_guesses:
             continue
         if character in "AEIOU":  # Vowel
-            if winnings[(turn % 3)] < 250:
+            if winnings[(turn % 3)] < VOWEL_THRESHOLD:
                 continue
             else:
-                print("Computer bought:", character)
+                announce("Computer bought:", character)
                 winnings[(turn % 3)] = winnings[(turn % 3)] - 250
                 break
         # Consonant
-        dollar = spin_wheel_simple()
+        dollar = spin()
         if dollar == 0:
-            print("Computer lost a turn")
+            announce("Computer lost a turn")
             character = "_"
             break
         elif dollar == -1:
-            print("Computer went bankrupt")
+            announce("Computer went bankrupt")
             winnings[(turn % 3)] = 0
             character = "_"
             break
         else:
-            print("Computer guessed:", character)
+            announce("Computer guessed:", character)
             break
     return character, dollar
 
-def computer_turn_smart_conservative(showing, winnings, previous_guesses, turn):
+def computer_turn_smart_conservative(showing, winnings, previous_guesses, turn, spin=spin_wheel_simple, announce=output_sink.announce):
     """Conservative smart computer player"""
     # More cautious approach - focus on safe, common letters
-    safe_letters = "RSTLNE"
+    safe_letters = SAFE_LETTERS
     
     dollar = 0
     for character in safe_letters:
         if character in previous_guesses:
             continue
         if character in "AEIOU":
-            if winnings[(turn % 3)] < 500:  # More conservative with vowels
+            if winnings[(turn % 3)] < CONSERVATIVE_VOWEL_THRESHOLD:  # More conservative with vowels
                 continue
             else:
-                print("Computer bought:", character)
+                announce("Computer bought:", character)
                 winnings[(turn % 3)] = winnings[(turn % 3)] - 250
                 break
         # Consonant
-        dollar = spin_wheel_simple()
+        dollar = spin()
         if dollar == 0:
-            print("Computer lost a turn")
+            announce("Computer lost a turn")
             character = "_"
             break
         elif dollar == -1:
-            print("Computer went bankrupt")
+            announce("Computer went bankrupt")
             winnings[(turn % 3)] = 0
             character = "_"
             break
         else:
-            print("Computer guessed:", character)
+            announce("Computer guessed:", character)
             break
     return character, dollar
 
-def computer_turn_smart_aggressive(showing, winnings, previous_guesses, turn):
+def computer_turn_smart_aggressive(showing, winnings, previous_guesses, turn, spin=spin_wheel_simple, announce=output_sink.announce):
     """Aggressive smart computer player"""
     # More aggressive - willing to take risks
-    alphabet = "ETAOINSHRDLUCMFWYGPBVKQJXZ"
+    alphabet = SMART_ORDER
     
     dollar = 0
     for character in alphabet:
         if character in previous_guesses:
             continue
         if character in "AEIOU":
-            if winnings[(turn % 3)] < 250:  # Will buy vowels with minimum money
+            if winnings[(turn % 3)] < VOWEL_THRESHOLD:  # Will buy vowels with minimum money
                 continue
             else:
-                print("Computer bought:", character)
+                announce("Computer bought:", character)
                 winnings[(turn % 3)] = winnings[(turn % 3)] - 250
                 break
         # Consonant
-        dollar = spin_wheel_simple()
+        dollar = spin()
         if dollar == 0:
-            print("Computer lost a turn")
+            announce("Computer lost a turn")
             character = "_"
             break
         elif dollar == -1:
-            print("Computer went bankrupt")
+            announce("Computer went bankrupt")
             winnings[(turn % 3)] = 0
             character = "_"
             break
         else:
-            print("Computer guessed:", character)
+            announce("Computer guessed:", character)
             break
     return character, dollar
-
-def spin_wheel_simple():
-    """Simplified wheel spin for smart players"""
-    wheel_values = [0, -1, 500, 550, 600, 650, 700, 750, 800, 850, 900]
-    return random.choice(wheel_values)
@@ -0,0 +1,195 @@
+"""
+Strategy registry for Wheel of Fortune computer players
+Player types map to player objects built once per game, so the game loop never dispatches on names
+"""
+
+from collections import namedtuple
+
+import output_sink
+from board_state import LETTER_BITS, GuessedLetters
+from smart_player import (SIMPLE_WHEEL_VALUES, SMART_ORDER, SAFE_LETTERS, CONSERVATIVE_VOWEL_THRESHOLD,
+                          spin_wheel_simple)
+from wheel_of_fortune import (WHEEL_VALUES, ALPHABET_ORDER, MORSE_ORDER, OXFORD_ORDER, spin_wheel,
+                              computer_turn_trigrams_bigrams)
+from letter_probability import get_oracle
+from rollout_player import RolloutPlayer
+
+VOWELS = "AEIOU"
+VOWEL_COST = 250
+
+# factory(clue) builds a fresh player for one game; wheel_values is the wheel headless games draw from
+# and spin_function(rng) the interactive spin used when people are watching. by_default is False for
+# types that only play when named (they never finish, or are far slower than the rest)
+Strategy = namedtuple("Strategy", ["name", "factory", "wheel_values", "spin_function", "by_default"])
+
+STRATEGIES = {}
+
+
+def register(name, factory, wheel_values=WHEEL_VALUES, spin_function=spin_wheel, by_default=True):
+    """Make a player type available to play_random_game, the engine and the tournament"""
+    STRATEGIES[name] = Strategy(name, factory, wheel_values, spin_function, by_default)
+
+
+def default_strategies():
+    """Player types used when none are named (tournaments, the server's bot tables)"""
+    return [name for name, strategy in STRATEGIES.items() if strategy.by_default]
+
+
+def create_player(name, clue=None):
+    """A new player object of the given type, with its own per-game state"""
+    strategy = STRATEGIES.get(name)
+    if strategy is None:
+        raise ValueError(f"Unknown player type: {name}. Available: human, {', '.join(STRATEGIES)}")
+    return strategy.factory(clue)
+
+
+class FixedOrderPlayer:
+    """
+    Calls letters in a fixed order, buying vowels once it has vowel_threshold.
+    Guessed letters are only ever added during a game, so two cursors (next letter,
+    next consonant) only move forward and choosing a letter is amortized O(1).
+    """
+
+    __slots__ = ("order", "consonants", "order_bits", "consonant_bits", "vowel_threshold", "cursor",
+                 "consonant_cursor")
+
+    def __init__(self, order, vowel_threshold=VOWEL_COST):
+        self.order = order
+        self.consonants = ''.join(c for c in order if c not in VOWELS)
+        self.order_bits = tuple(LETTER_BITS[c] for c in self.order)
+        self.consonant_bits = tuple(LETTER_BITS[c] for c in self.consonants)
+        self.vowel_threshold = vowel_threshold
+        self.cursor = 0
+        self.consonant_cursor = 0
+
+    def choose_letter(self, winnings, previous_guesses, turn):
+        """Next letter to call, or None when every callable letter is gone"""
+        if not isinstance(previous_guesses, GuessedLetters):
+            previous_guesses = GuessedLetters(previous_guesses)
+        mask = previous_guesses.mask
+
+        order = self.order
+        order_bits = self.order_bits
+        cursor = self.cursor
+        while cursor < len(order) and mask & order_bits[cursor]:
+            cursor += 1
+        self.cursor = cursor
+
+        consonants = self.consonants
+        consonant_bits = self.consonant_bits
+        consonant_cursor = self.consonant_cursor
+        while consonant_cursor < len(consonants) and mask & consonant_bits[consonant_cursor]:
+            consonant_cursor += 1
+        self.consonant_cursor = consonant_cursor
+
+        if cursor < len(order) and order[cursor] in VOWELS and winnings[turn % 3] >= self.vowel_threshold:
+            return order[cursor]
+        if consonant_cursor < len(consonants):
+            return consonants[consonant_cursor]
+        return None
+
+    def take_turn(self, showing, winnings, previous_guesses, turn, spin, announce=output_sink.announce):
+        """Same contract as the computer_turn_* functions: returns (guess, dollar)"""
+        character = self.choose_letter(winnings, previous_guesses, turn)
+        if character is None:
+            # Like the turn functions, running out of letters leaves the last one in the order
+            return self.order[-1], 0
+        if character in VOWELS:
+            announce("Computer bought:", character)
+            winnings[(turn % 3)] = winnings[(turn % 3)] - VOWEL_COST
+            return character, 0
+
+        # Want to choose a consonant ... so spins wheel
+        dollar = spin()
+        if dollar == 0:
+            announce("Computer lost a turn")
+            return "_", dollar
+        elif dollar == -1:
+            announce("Computer went bankrupt")
+            winnings[(turn % 3)] = 0
+            return "_", dollar
+        announce("Computer guessed:", character)
+        return character, dollar
+
+
+class PatternSolverPlayer(FixedOrderPlayer):
+    """
+    Reads the board against the corpus: calls the letter with the most expected
+    copies for its clue category and solves as soon as every hidden word has one
+    candidate left. Falls back to its letter order when nothing is expected.
+    """
+
+    __slots__ = ("clue", "oracle", "expected", "attempts")
+
+    def __init__(self, order, vowel_threshold=VOWEL_COST, clue=None, oracle=None):
+        FixedOrderPlayer.__init__(self, order, vowel_threshold)
+        self.clue = clue
+        self.oracle = oracle
+        self.expected = None
+        self.attempts = set()
+
+    def choose_letter(self, winnings, previous_guesses, turn):
+        fallback = FixedOrderPlayer.choose_letter(self, winnings, previous_guesses, turn)
+        expected = self.expected
+        if expected is None:
+            return fallback
+
+        best_consonant = None
+        for consonant in self.consonants[self.consonant_cursor:]:
+            if consonant in expected and (best_consonant is None or expected[consonant] > expected[best_consonant]):
+                best_consonant = consonant
+        best_vowel = None
+        if winnings[turn % 3] >= VOWEL_COST:
+            for vowel in VOWELS:
+                if vowel in expected and (best_vowel is None or expected[vowel] > expected[best_vowel]):
+                    best_vowel = vowel
+
+        consonant_hits = expected[best_consonant] if best_consonant else 0.0
+        vowel_hits = expected[best_vowel] if best_vowel else 0.0
+        if vowel_hits > consonant_hits:
+            return best_vowel
+        if consonant_hits > 0:
+            return best_consonant
+        return fallback
+
+    def take_turn(self, showing, winnings, previous_guesses, turn, spin, announce=output_sink.announce):
+        if not isinstance(previous_guesses, GuessedLetters):
+            previous_guesses = GuessedLetters(previous_guesses)
+        if self.oracle is None:
+            self.oracle = get_oracle()
+        solution, _ = self.oracle.index.analyse(showing, previous_guesses.mask)
+        # A wrong solve passes the turn, so each reading of the board is only tried once
+        if solution is not None and solution not in self.attempts:
+            self.attempts.add(solution)
+            announce("Computer solves:", solution)
+            return solution, 0
+        self.expected = self.oracle.estimate(showing, previous_guesses, self.clue).expected
+        return FixedOrderPlayer.take_turn(self, showing, winnings, previous_guesses, turn, spin, announce)
+
+
+class TurnFunctionPlayer:
+    """Wraps a computer_turn_* style function as a player object"""
+
+    __slots__ = ("turn_function",)
+
+    def __init__(self, turn_function):
+        self.turn_function = turn_function
+
+    def take_turn(self, showing, winnings, previous_guesses, turn, spin, announce=output_sink.announce):
+        return self.turn_function(showing, winnings, previous_guesses, turn, spin, announce)
+
+
+# Built-in player types (computer_turn, computer_turn_morse, ... as player objects)
+register("alphabet", lambda clue: FixedOrderPlayer(ALPHABET_ORDER))
+register("morse", lambda clue: FixedOrderPlayer(MORSE_ORDER))
+register("oxford", lambda clue: FixedOrderPlayer(OXFORD_ORDER))
+register("trigram", lambda clue: TurnFunctionPlayer(computer_turn_trigrams_bigrams))
+register("solver", lambda clue: PatternSolverPlayer(OXFORD_ORDER, clue=clue))
+register("smart", lambda clue: FixedOrderPlayer(SMART_ORDER), SIMPLE_WHEEL_VALUES, spin_wheel_simple)
+# Only knows RSTLNE, so games of conservatives alone run to MAX_TURNS
+register("conservative", lambda clue: FixedOrderPlayer(SAFE_LETTERS, CONSERVATIVE_VOWEL_THRESHOLD), SIMPLE_WHEEL_VALUES, spin_wheel_simple,
+         by_default=False)
+register("aggressive", lambda clue: FixedOrderPlayer(SMART_ORDER), SIMPLE_WHEEL_VALUES, spin_wheel_simple)
+# No time budget: moves stop at max_rollouts so seeded games replay (live loops call use_move_budget)
+# About 30 games/s against thousands for the others
+register("rollout", lambda clue: RolloutPlayer(clue), by_default=False)
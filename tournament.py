@@ -0,0 +1,224 @@
+"""
+Tournament runner for Wheel of Fortune strategies
+Plays bot-only games for every line-up of computer players across all cores
+"""
+
+import itertools
+import os
+import random
+import sys
+import time
+from multiprocessing import Pool
+
+import game_engine
+import game_stats
+import strategy_registry
+
+DEFAULT_GAMES = 1000000
+DEFAULT_SHARD_SIZE = 2000
+
+
+def all_lineups(player_types=None):
+    """Every seating of three computer players, seat order included (default: the by_default types)"""
+    if player_types is None:
+        player_types = strategy_registry.default_strategies()
+    return list(itertools.product(player_types, repeat=3))
+
+
+def lineup_ranges(lineups, games):
+    """
+    Split the games evenly over the line-ups as (lineup, first game index, games).
+    Game indexes only depend on the line-ups and the total, not on sharding.
+    """
+    per_lineup, extra = divmod(games, len(lineups))
+    ranges = []
+    first = 0
+    for number, lineup in enumerate(lineups):
+        count = per_lineup + (1 if number < extra else 0)
+        ranges.append((lineup, first, count))
+        first += count
+    return ranges
+
+
+def make_shards(lineups, games, seed, shard_size=DEFAULT_SHARD_SIZE):
+    """Work units of at most shard_size games: (lineup, seed, first game index, games)"""
+    shards = []
+    for lineup, first, count in lineup_ranges(lineups, games):
+        for start in range(first, first + count, shard_size):
+            shards.append((lineup, seed, start, min(shard_size, first + count - start)))
+    return shards
+
+
+def lineup_for_game(index, lineups, games):
+    """Which line-up played game `index` of a run"""
+    for lineup, first, count in lineup_ranges(lineups, games):
+        if first <= index < first + count:
+            return lineup
+    raise ValueError(f"Game {index} is not part of a {games} game run")
+
+
+def play_shard(shard):
+    """
+    Worker: play one shard and return its partial totals.
+    Totals map (seat, strategy) to [games, wins, winnings].
+    """
+    lineup, seed, first, games = shard
+    results = (game_engine.replay_game(lineup, seed, index) for index in range(first, first + games))
+    return (games, *count_results(lineup, results))
+
+
+def play_shard_with_stats(shard):
+    """play_shard, also returning the shard's game_stats.GameStats (every move counted)"""
+    lineup, seed, first, games = shard
+    stats = game_stats.GameStats()
+    return (games, *count_results(lineup, game_stats.play_games(lineup, seed, first, games, stats)), stats)
+
+
+def count_results(lineup, results):
+    # Unfinished games and (seat, strategy) totals of a shard's results
+    totals = {(seat, strategy): [0, 0, 0] for seat, strategy in enumerate(lineup)}
+    unfinished = 0
+    for result in results:
+        if result.winner is None:
+            unfinished += 1
+        for seat, strategy in enumerate(lineup):
+            total = totals[(seat, strategy)]
+            total[0] += 1
+            total[2] += result.winnings[seat]
+            if result.winner == seat:
+                total[1] += 1
+    return unfinished, totals
+
+
+def merge_totals(into, totals):
+    for key, (games, wins, winnings) in totals.items():
+        total = into.setdefault(key, [0, 0, 0])
+        total[0] += games
+        total[1] += wins
+        total[2] += winnings
+
+
+def print_standings(totals, games_played, unfinished, elapsed):
+    """Win rate and mean winnings per strategy, then per seat and strategy"""
+    by_strategy = {}
+    for (seat, strategy), total in totals.items():
+        merge_totals(by_strategy, {strategy: total})
+
+    print(f"\n=== {games_played} games in {elapsed:.1f}s "
+          f"({games_played / max(elapsed, 1e-9):.0f} games/s, {unfinished} unfinished) ===")
+    print(f"{'strategy':<14}{'seat':>6}{'games':>12}{'win rate':>10}{'mean $':>10}")
+    for strategy in sorted(by_strategy, key=lambda s: -by_strategy[s][1] / by_strategy[s][0]):
+        games, wins, winnings = by_strategy[strategy]
+        print(f"{strategy:<14}{'all':>6}{games:>12}{wins / games:>10.3f}{winnings / games:>10.0f}")
+        for seat in range(3):
+            if (seat, strategy) in totals:
+                games, wins, winnings = totals[(seat, strategy)]
+                print(f"{'':<14}{seat:>6}{games:>12}{wins / games:>10.3f}{winnings / games:>10.0f}")
+    sys.stdout.flush()
+
+
+def run_tournament(games=DEFAULT_GAMES, player_types=None, workers=None, shard_size=DEFAULT_SHARD_SIZE,
+                   report_every=10.0, seed=None, stats=False):
+    """
+    Play games spread over every line-up on a process pool.
+    Standings are printed every report_every seconds while shards stream in.
+    With stats, every worker also keeps a game_stats.GameStats; they are merged as shards
+    arrive and the summary is printed at the end.
+    Game i of the run can be replayed with game_engine.replay_game(lineup, seed, i).
+    """
+    if seed is None:
+        seed = random.randrange(2**32)
+    print("Tournament seed:", seed)
+    shards = make_shards(all_lineups(player_types), games, seed, shard_size)
+    totals = {}
+    run_stats = game_stats.GameStats() if stats else None
+    games_played = 0
+    unfinished = 0
+    start = time.perf_counter()
+    last_report = start
+
+    with Pool(processes=workers or os.cpu_count()) as pool:
+        try:
+            worker = play_shard_with_stats if stats else play_shard
+            for shard_games, shard_unfinished, shard_totals, *shard_stats in pool.imap_unordered(worker, shards):
+                if shard_stats:
+                    run_stats.merge(shard_stats[0])
+                games_played += shard_games
+                unfinished += shard_unfinished
+                merge_totals(totals, shard_totals)
+                now = time.perf_counter()
+                if now - last_report >= report_every:
+                    print_standings(totals, games_played, unfinished, now - start)
+                    last_report = now
+        except KeyboardInterrupt:
+            pool.terminate()
+            print("\nInterrupted ... standings so far")
+
+    print_standings(totals, games_played, unfinished, time.perf_counter() - start)
+    if run_stats is not None:
+        run_stats.print_summary()
+    return totals
+
+
+def print_usage():
+    print("\nWheel of Fortune Strategy Tournament")
+    print("=" * 50)
+    print("Usage: python tournament.py [player types ...] [options]")
+    print("\nPlayer types default to:", ", ".join(strategy_registry.default_strategies()))
+    print("Only played when named:", ", ".join(name for name in game_engine.STRATEGIES
+                                                if name not in strategy_registry.default_strategies()))
+    print("\nOptions:")
+    print("  --games=N       Total games to play (default 1000000)")
+    print("  --workers=N     Worker processes (default: all cores)")
+    print("  --shard=N       Games per work unit (default 2000)")
+    print("  --report=SECS   Seconds between standings updates (default 10)")
+    print("  --seed=N        Master seed (default: random, printed at start)")
+    print("  --stats         Also report spreads, quantiles, bankrupts, lost turns and vowels")
+    print("  --replay=I      Replay game I of the run given by --seed, --games and the player types")
+    print()
+
+
+if __name__ == '__main__':
+    games = DEFAULT_GAMES
+    workers = None
+    shard_size = DEFAULT_SHARD_SIZE
+    report_every = 10.0
+    seed = None
+    replay = None
+    stats = False
+    player_types = []
+
+    for arg in sys.argv[1:]:
+        if arg.startswith('--games='):
+            games = int(arg.split('=')[1])
+        elif arg.startswith('--workers='):
+            workers = int(arg.split('=')[1])
+        elif arg.startswith('--shard='):
+            shard_size = int(arg.split('=')[1])
+        elif arg.startswith('--report='):
+            report_every = float(arg.split('=')[1])
+        elif arg.startswith('--seed='):
+            seed = int(arg.split('=')[1])
+        elif arg.startswith('--replay='):
+            replay = int(arg.split('=')[1])
+        elif arg == '--stats':
+            stats = True
+        elif arg == '--help':
+            print_usage()
+            sys.exit()
+        elif arg in game_engine.STRATEGIES:
+            player_types.append(arg)
+        else:
+            print("Unknown argument:", arg)
+            print_usage()
+            sys.exit(1)
+
+    if replay is not None:
+        if seed is None:
+            print("--replay needs the --seed of the run")
+            sys.exit(1)
+        lineup = lineup_for_game(replay, all_lineups(player_types or None), games)
+        print(game_engine.replay_game(lineup, seed, replay))
+        sys.exit()
+
+    run_tournament(games, player_types or None, workers, shard_size, report_every, seed, stats)
@@ -1,13 +1,31 @@
 import random
-import re
 import sys
-import time
 import ascii_wheel
+import board_renderer
+import event_log
+import game_clock
+import letter_probability
+import ngram_model
+import output_sink
+import phase_profiler
+import puzzle_corpus
+import puzzle_features
 from smart_player import computer_turn_smart, computer_turn_smart_conservative, computer_turn_smart_aggressive
 
-def computer_turn(showing, winnings, previous_guesses, turn):
+WHEEL_VALUES = [0,-1,500,550,600,650,700,750,800,850,900,-1,500,550,600,650,700,750,800,850,900,500,550,600]
+# Note that the wheel changes over time ... free play now an 850. Different rounds, etc.
+
+# Letter orders the computer players call in
+ALPHABET_ORDER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+MORSE_ORDER = "ETAINOSHRDLUCMFWYGPBVKQJXZ"
+OXFORD_ORDER = "EARIOTNSLCUDPMHGBFYWKVXZJQ"
+
+def computer_turn(showing, winnings, previous_guesses, turn, spin=None, announce=output_sink.announce):
+  # spin/announce default to the interactive wheel and stdout
+  if spin is None:
+    spin = spin_wheel
   # Guess in the order of the alphabet
-  alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+  alphabet = ALPHABET_ORDER
   dollar = 0
   for character in alphabet:
     if character in previous_guesses:
@@ -16,28 +34,30 @@ def computer_turn(showing, winnings, previous_guesses, turn):
       if winnings[(turn % 3)] < 250:
         continue
       else:
-        print("Computer bought:", character)
+        announce("Computer bought:", character)
         winnings[(turn % 3)] = winnings[(turn % 3)] - 250
         break
     # Want to choose a consonant ... so spins wheel
-    dollar = spin_wheel()
+    dollar = spin()
     if dollar == 0:
-      print("Computer lost a turn")
+      announce("Computer lost a turn")
       character = "_"
       break
     elif dollar == -1:
-      print("Computer went backrupt")
+      announce("Computer went backrupt")
       winnings[(turn % 3)] = 0
       character = "_"
       break
     else:
-      print("Computer guessed:", character)
+      announce("Computer guessed:", character)
       break
   return character, dollar
 
-def computer_turn_morse(showing, winnings, previous_guesses, turn):
+def computer_turn_morse(showing, winnings, previous_guesses, turn, spin=None, announce=output_sink.announce):
+  if spin is None:
+    spin = spin_wheel
   # Guess in the order that Samuel Morse identified for his code
-  alphabet = "ETAINOSHRDLUCMFWYGPBVKQJXZ"
+  alphabet = MORSE_ORDER
   dollar = 0
   for character in alphabet:
     if character in previous_guesses:
@@ -46,31 +66,33 @@ def computer_turn_morse(showing, winnings, previous_guesses, turn):
       if winnings[(turn % 3)] < 250:
         continue
       else:
-        print("Computer bought:", character)
+        announce("Computer bought:", character)
         winnings[(turn % 3)] = winnings[(turn % 3)] - 250
         break
     # Want to choose a consonant ... so spins wheel
-    dollar = spin_wheel()
+    dollar = spin()
     if dollar == 0:
-      print("Computer lost a turn")
+      announce("Computer lost a turn")
       character = "_"
       break
     elif dollar == -1:
-      print("Computer went backrupt")
+      announce("Computer went backrupt")
       winnings[(turn % 3)] = 0
       character = "_"
       break
     else:
-      print("Computer guessed:", character)
+      announce("Computer guessed:", character)
       break
   return character, dollar
 
-def computer_turn_oxford(showing, winnings, previous_guesses, turn):
+def computer_turn_oxford(showing, winnings, previous_guesses, turn, spin=None, announce=output_sink.announce):
+  if spin is None:
+    spin = spin_wheel
   # From dictionary ... that's game optimized word not occurance of words
   # Concise Oxford Dictionary (9th edition, 1995) 
   # https://www3.nd.edu/~busiforc/handouts/cryptography/letterfrequencies.html
 
-  alphabet = "EARIOTNSLCUDPMHGBFYWKVXZJQ"
+  alphabet = OXFORD_ORDER
   dollar = 0
   for character in alphabet:
     if character in previous_guesses:
@@ -79,148 +101,91 @@ def computer_turn_oxford(showing, winnings, previous_guesses, turn):
       if winnings[(turn % 3)] < 250:
         continue
       else:
-        print("Computer bought:", character)
+        announce("Computer bought:", character)
         winnings[(turn % 3)] = winnings[(turn % 3)] - 250
         break
     # Want to choose a consonant ... so spins wheel
-    dollar = spin_wheel()
+    dollar = spin()
     if dollar == 0:
-      print("Computer lost a turn")
+      announce("Computer lost a turn")
       character = "_"
       break
     elif dollar == -1:
-      print("Computer went backrupt")
+      announce("Computer went backrupt")
       winnings[(turn % 3)] = 0
       character = "_"
       break
     else:
-      print("Computer guessed:", character)
+      announce("Computer guessed:", character)
       break
   return character, dollar
 
-def computer_turn_trigrams_bigrams(showing, winnings, previous_guesses, turn):
+def computer_turn_trigrams_bigrams(showing, winnings, previous_guesses, turn, spin=None, announce=output_sink.announce,
+                                   model=None):
+  if spin is None:
+    spin = spin_wheel
 
   allow_vowels = False
   if winnings[(turn % 3)] >= 250:
     allow_vowels = True
 
-  candidate_trigrams = [] 
-  showing_words = showing.split(' ')
-  for word in showing_words:
-    index = 0
-    while index < (len(word) - 2):
-      trigram = word[index:index+3]
-      #print(trigram)
-      if trigram[2] == "_" and "_" != trigram[0] and "_" != trigram[1]:
-        candidate_trigrams.append(trigram)
-      index = index + 1
-
-  candidate_bigrams = [] 
-  for word in showing_words:
-    index = 0
-    while index < (len(word) - 1):
-      bigram = word[index:index+2]
-      #print(bigram)
-      if "_" != bigram[0] and bigram[1] == "_":
-        candidate_bigrams.append(bigram)
-      index = index + 1
-
-  #print(candidate_trigrams)
-  #print(candidate_bigrams)
+  # Trigram and bigram tables are loaded once and indexed by prefix
+  if model is None:
+    model = ngram_model.get_model()
 
   dollar = 0
-  guess = "_"
-
-  # Frewquencies from: http://mathcenter.oxford.emory.edu/site/math125/englishLetterFreqs/#:~:text=Most%20common%20bigrams%20(in%20order,%2C%20sa%2C%20em%2C%20ro.
 
   #Most common trigrams (in order)
-  trigrams = ["THE", "AND", "THA", "ENT", "ING", "ION", "TIO", "FOR", "NDE", "HAS", "NCE", "EDT", "TIS", "OFT", "STH", "MEN"]
-  for trigram in trigrams:
-    to_match = trigram[0:2] + "_"
-    #print("TOMatch", to_match)
-    if to_match in candidate_trigrams:
-      candidate = trigram[2]
-      #print("CANDIDATE", candidate)
-      if is_vowel(candidate) and allow_vowels == False:
-        #print("can't vowel")
-        continue
-      elif candidate in previous_guesses:
-        #print("already guessed")
-        continue
-      else:
-        guess = candidate
-        #print("Actual CANDIDATE", candidate)
-        break
-  if guess != "_":
+  guess = model.trigram_guess(showing, previous_guesses, allow_vowels)
+  if guess is not None:
     if is_vowel(guess):
-      print("Computer bought:", guess)
+      announce("Computer bought:", guess)
       winnings[(turn % 3)] = winnings[(turn % 3)] - 250
       return guess, dollar # Should be a vowel and 0 since we've already subtraced
     else:
-      dollar = spin_wheel()
+      dollar = spin()
       if dollar == 0:
-        print("Computer lost a turn")
+        announce("Computer lost a turn")
         guess = "_"
       elif dollar == -1:
-        print("Computer went backrupt")
+        announce("Computer went backrupt")
         winnings[(turn % 3)] = 0
         guess = "_"
       else:
-        print("Computer guessed:", guess)
+        announce("Computer guessed:", guess)
       return guess, dollar
 
   #print("No trigrams ... backing off to bigrams")
 
-  #Most common bigrams (in order)
-  #frequent bigrams from a file ... http://practicalcryptography.com/media/cryptanalysis/files/english_bigrams_1.txt Only want first 128
-  #bigrams = ["TH", "HE", "IN", "EN", "NT", "RE", "ER", "AN", "TI", "ES", "ON", "AT", "SE", "ND", "OR", "AR", "AL", "TE", "CO", "DE", "TO", "RA", "ET", "ED", "IT", "SA", "EM", "RO"]
-  bigrams = []
-  with open("bigrams.txt") as g:
-    for line in g:
-      line = line.rstrip('\n')
-      bigram = line.split(' ')[0].upper()
-      bigrams.append(bigram)
-      if len(bigrams) == 128:
-        break # Arbitrary threshold to use
-  #print(bigrams)
-  for bigram in bigrams:
-    to_match = bigram[0] + "_"
-    #print(to_match)
-    if to_match in candidate_bigrams:
-      candidate = bigram[1]
-      #print("CANDIDATE", candidate)
-      if is_vowel(candidate) and allow_vowels == False:
-        #print("can't vowel")
-        continue
-      elif candidate in previous_guesses:
-        #print("already guessed")
-        continue
-      else:
-        guess = candidate
-        #print("Actual CANDIDATE", candidate)
-        break
-  if guess != "_":
+  #Most common bigrams (in order), first 128 of bigrams.txt
+  guess = model.bigram_guess(showing, previous_guesses, allow_vowels)
+  if guess is not None:
     if is_vowel(guess):
-      print("Computer bought:", guess)
+      announce("Computer bought:", guess)
       winnings[(turn % 3)] = winnings[(turn % 3)] - 250
       return guess, dollar # Should be a vowel and 0 since we've already subtraced
     else:
-      dollar = spin_wheel()
+      dollar = spin()
       if dollar == 0:
-        print("Computer lost a turn")
+        announce("Computer lost a turn")
         guess = "_"
       elif dollar == -1:
-        print("Computer went backrupt")
+        announce("Computer went backrupt")
         winnings[(turn % 3)] = 0
         guess = "_"
       else:
-        print("Computer guessed:", guess)
+        announce("Computer guessed:", guess)
       return guess, dollar
 
   #print("No bigrams ... backing off to unigrams")
 
-  # Unigrams are from the oxford strategy above
-  alphabet = "EARIOTNSLCUDPMHGBFYWKVXZJQ"
+  # Unigrams: the letters most expected on this board, in oxford order when nothing is known
+  # (or there is no puzzle file to know it from)
+  oracle = letter_probability.find_oracle()
+  if oracle is None:
+    alphabet = OXFORD_ORDER
+  else:
+    alphabet = oracle.ranked(showing, previous_guesses, order=OXFORD_ORDER)
 
 
   for character in alphabet:
@@ -230,66 +195,60 @@ def computer_turn_trigrams_bigrams(showing, winnings, previous_guesses, turn):
       if winnings[(turn % 3)] < 250:
         continue
       else:
-        print("Computer bought:", character)
+        announce("Computer bought:", character)
         winnings[(turn % 3)] = winnings[(turn % 3)] - 250
         break
     # Want to choose a consonant ... so spins wheel
-    dollar = spin_wheel()
+    dollar = spin()
     if dollar == 0:
-      print("Computer lost a turn")
+      announce("Computer lost a turn")
       character = "_"
       break
     elif dollar == -1:
-      print("Computer went backrupt")
+      announce("Computer went backrupt")
       winnings[(turn % 3)] = 0
       character = "_"
       break
     else:
-      print("Computer guessed:", character)
+      announce("Computer guessed:", character)
       break
+  else:
+    # Nothing it can call: like the full oxford order, it ends on a letter already called and loses the turn
+    character = OXFORD_ORDER[-1]
   return character, dollar
 
-def get_random_puzzle():
-  random_int = random.randint(0,900) # Roughly size of num puzzles in valid
-  number = 0
-  with open("../../data/puzzles/valid.csv") as f:
-    for line in f:
-      line = line.rstrip('\n')
-      puzzle, clue, date, game_type = line.split(',')
-      if number == random_int:
-        #print(line)
-        clue = clue.replace("&amp;", "&") # HTML Code
-        puzzle = puzzle.replace("&amp;", "&") # HTML Code
-        return(puzzle, clue, date, game_type)
-      number = number + 1
-
-def human_turn(showing, winnings, previous_guesses, turn, puzzle):
+def get_random_puzzle(rng=random, category=None, difficulty=None):
+  # Loaded once and indexed by puzzle_corpus, so every row is equally likely
+  if category is None and difficulty is None:
+    return puzzle_corpus.get_corpus().random_puzzle(rng)
+  # Only among the puzzles of a clue category and/or a (low, high) difficulty from 0 (easiest) to 1
+  return puzzle_corpus.get_corpus()[puzzle_features.get_features().sample(rng, category, difficulty)]
+
+def human_turn(showing, winnings, previous_guesses, turn, puzzle, rng=random):
 
   # Make sure human chooses a valid action
   deciding = False
   while not deciding:
-    decision = input("1: Spin, 2: Buy Vowel, 3: Solve ....  ")
+    decision = output_sink.ask("1: Spin, 2: Buy Vowel, 3: Solve ....  ")
     if decision == "1" or decision == "2" or decision == "3":
       deciding = True
       if decision == "2" and winnings[(turn % 3)] < 250: # Minimum cost of a vowel
-        print("Sorry .... you don't have enough money. Select 1 or 3")
+        output_sink.emit("prompt", "Sorry .... you don't have enough money. Select 1 or 3")
         deciding = False
     else:
-      print("Please choose 1, 2, or 3")
+      output_sink.emit("prompt", "Please choose 1, 2, or 3")
 
   # Player decisions
   if decision == "3":
     deciding = True
-    solve = input("Your guess to solve: ...... ").upper() # TODO: clean
+    solve = output_sink.ask("Your guess to solve: ...... ").upper() # TODO: clean
     if solve == puzzle:
-      print("YOU WIN!")
-      print("Player", turn % 3, "won!")
-      print("Winnings:", winnings)
-      is_solved = True
-      exit()
-      #break #TODO: not just exit here
+      output_sink.emit("prompt", "YOU WIN!")
+      # The game loop sees a full-length guess as a solve and ends the game
+      return solve, 0
     else:
-      print("Wrong ... next player")
+      output_sink.emit("prompt", "Wrong ... next player")
+      event_log.record("solve", solve, False)
       #turn = turn + 1
       #print("The clue is:", clue)
       #print_board(showing)
@@ -300,27 +259,29 @@ def human_turn(showing, winnings, previous_guesses, turn, puzzle):
     winnings[(turn % 3)] = winnings[(turn % 3)] - 250
     is_one_vowel = False
     while is_one_vowel != True:
-      vowel = input("Guess a vowel: ").upper()
+      vowel = output_sink.ask("Guess a vowel: ").upper()
       if len(vowel) != 1:
-        print("Guess only one letter")
+        output_sink.emit("prompt", "Guess only one letter")
       else:
         is_one_vowel = is_vowel(vowel)
 
       if not is_one_vowel:
-        print("Not a vowel")
+        output_sink.emit("prompt", "Not a vowel")
     guess = vowel
     dollar = 0
   elif decision == "1":
     # Spin wheel
-    dollar = spin_wheel()
+    with phase_profiler.phase("spin"):
+      dollar = spin_wheel(rng)
+    event_log.record("spin", dollar)
     guess = ""
     if dollar == 0:
-      print("Sorry! Lose a turn. Next player")
+      output_sink.emit("prompt", "Sorry! Lose a turn. Next player")
       #turn = turn + 1
       #continue
       guess = "_"
     elif dollar == -1:
-      print("Oh No! Bankrupt!")
+      output_sink.emit("prompt", "Oh No! Bankrupt!")
       winnings[(turn % 3)] = 0
       #turn = turn + 1
       #continue
@@ -329,14 +290,14 @@ def human_turn(showing, winnings, previous_guesses, turn, puzzle):
     if guess == "_":
       is_one_consonant = True # Hacky way
     while is_one_consonant != True:
-      guess = input("Name a consonant .... ").upper()
+      guess = output_sink.ask("Name a consonant .... ").upper()
       if len(guess) != 1: 
-        print("Guess only one letter")
+        output_sink.emit("prompt", "Guess only one letter")
       else:
         is_one_consonant = is_consonant(guess)
 
       if not is_one_consonant:
-        print("Not a consonant")
+        output_sink.emit("prompt", "Not a consonant")
   return guess, dollar
 
 def is_consonant(guess):
@@ -354,135 +315,153 @@ def is_vowel(guess):
     return False
 
 def print_board(showing):
-  words = showing.split(" ")
-  to_print = ""
-  for word in words:
-    for character in word:
-      to_print = to_print + character + " "
-    to_print = to_print + "\n"
-  print(to_print)
-
-def spin_wheel():
-  wheel_values = [0,-1,500,550,600,650,700,750,800,850,900,-1,500,550,600,650,700,750,800,850,900,500,550,600]
-  # Note that the wheel changes over time ... free play now an 850. Different rounds, etc.
-  print("Wheel is spinning ....")
-  print("It landed on ....")
-  time.sleep(2) # Drama!
-  ascii_wheel.draw_ascii_wheel(wheel_values, radius=18, label_style="long")
-  dollar = random.choice(wheel_values)
-  print("....", dollar, "dollars")
+  # Formatted in one pass and written at once
+  output_sink.write("board", board_renderer.format_board(showing) + "\n")
+
+def spin_wheel(rng=random):
+  wheel_values = WHEEL_VALUES
+  output_sink.emit("spin", "Wheel is spinning ....")
+  output_sink.emit("spin", "It landed on ....")
+  landing = rng.randrange(len(wheel_values)) # Same draw as rng.choice, so seeded games are unchanged
+  with phase_profiler.phase("rendering"):
+    if ascii_wheel.ANIMATE:
+      ascii_wheel.animate_spin(wheel_values, landing, radius=18, label_style="long")
+    else:
+      game_clock.sleep(2) # Drama!
+      ascii_wheel.draw_ascii_wheel(wheel_values, radius=18, label_style="long")
+  dollar = wheel_values[landing]
+  output_sink.emit("spin", "....", dollar, "dollars")
   return dollar
 
 
-def play_random_game(type_of_players):
-
-  # Play the game
-  puzzle, clue, date, game_type = get_random_puzzle()
-  print("Welcome to Wheel of Fortune")
-  print("You are playing a game of type:", game_type)
-  print("The clue is:", clue)
-
-  # Mask out word
-  showing = puzzle
-  showing = re.sub(r"[A-Z]","_",showing)
-  print_board(showing)
-
-  # Play the game
-  guess = ""
-  previous_guesses = []
-  turn = 0
-
-  winnings = [0,0,0]
-  dollar = 0
-  is_solved = False
+def spin(spin_function, rng):
+  # A computer's spin, timed apart from its decision when profiling
+  with phase_profiler.phase("spin"):
+    dollar = spin_function(rng)
+  event_log.record("spin", dollar)
+  return dollar
 
-  while showing != puzzle:
-    time.sleep(2) # Let humans see what is going on
+def play_random_game(type_of_players, seed=None, renderer=None):
+  # The rules live in game_engine; this loop only adds the humans, pacing and printing
+  import game_engine
+  import rollout_player
+
+  # Play the game (the same seed and moves replay the same puzzle and spins)
+  if renderer is None:
+    renderer = board_renderer.FrameRenderer()
+  if seed is None:
+    seed = random.randrange(2**32)
+  output_sink.emit("game", "Game seed:", seed)
+  state = game_engine.new_game(type_of_players, rng=game_engine.game_rng(seed))
+  state.seed = (seed, 0)
+  # People are waiting on the moves, so rollout players get their time budget
+  rollout_player.use_move_budget(state.players)
+  event_log.record("game_start", state.seed, state.puzzle, state.clue, state.game_type, state.type_of_players)
+  output_sink.emit("game", "Welcome to Wheel of Fortune")
+  output_sink.emit("game", "You are playing a game of type:", state.game_type)
+  renderer.render(state.showing, state.clue)
+  output_sink.flush()
+
+  while not state.board.solved and state.winner is None:
+    game_clock.sleep(2) # Let humans see what is going on
     # Ends wierd if last letter is guessed and not solved.# TODO
-    print("It is player", turn % 3, "'s turn")
+    output_sink.emit("turn", "It is player", state.turn % 3, "'s turn")
 
     # Type of player
-    type_of_player = type_of_players[turn % 3]
-    print("This player is:", type_of_player)
-
-    if type_of_player == "human":
-      guess, dollar = human_turn(showing, winnings, previous_guesses, turn, puzzle)
-    elif type_of_player == "morse":
-      guess, dollar = computer_turn_morse(showing, winnings, previous_guesses, turn)
-    elif type_of_player == "oxford":
-      guess, dollar = computer_turn_oxford(showing, winnings, previous_guesses, turn)
-    elif type_of_player == "trigram":
-      guess, dollar = computer_turn_trigrams_bigrams(showing, winnings, previous_guesses, turn)
-    elif type_of_player == "smart":
-      guess, dollar = computer_turn_smart(showing, winnings, previous_guesses, turn)
-    elif type_of_player == "conservative":
-      guess, dollar = computer_turn_smart_conservative(showing, winnings, previous_guesses, turn)
-    elif type_of_player == "aggressive":
-      guess, dollar = computer_turn_smart_aggressive(showing, winnings, previous_guesses, turn)
-
-    ## Human playing
-    #if turn % 3 == 0:
-    #  guess, dollar = human_turn(showing, winnings, previous_guesses, turn, puzzle)
-    #
-    ## Computer playing
-    #elif turn % 3 == 1:
-    #  guess, dollar = computer_turn_oxford(showing, winnings, previous_guesses, turn)
-    #elif turn % 3 == 2:
-    #  guess, dollar = computer_turn_morse(showing, winnings, previous_guesses, turn)
-
-
-    # Double check that guess has not already been said (I've seen it on TV before)
-    if guess in previous_guesses and guess != "_":
-      print("Sorry, that's already been guessed .... next player")
-      turn = turn + 1
-    else:
-      # Update board
-      previous_guesses.append(guess)
-      correct_places = []
-      for pos,char in enumerate(puzzle):
-        if(char == guess):
-            correct_places.append(pos)
-      #print(correct_places)
-      if guess == "_": # Hacky way to say the comp got it wrong or bankrupt, etc.
-        turn = turn + 1
-      elif len(correct_places) < 1:
-        print("Sorry, not in the puzzle ... next player")
-        turn = turn + 1
-    winnings[(turn % 3)] = winnings[(turn % 3)] + (dollar * len(correct_places))
-    for correct_letter in correct_places:
-      showing = showing[:correct_letter] + guess + showing[correct_letter + 1:]
-    print("Winnings:", winnings)
-    print("Previous guesses:", previous_guesses)
-    print("The clue is:", clue)
-    print_board(showing)
-
-  while not is_solved:
-    print("Player", turn % 3, "has a chance to solve")
-    type_of_player = type_of_players[turn % 3] # wouldn't have hit this above
+    type_of_player = state.player_type
+    output_sink.emit("turn", "This player is:", type_of_player)
+    event_log.record("turn", state.turns_played, state.turn % 3, type_of_player)
+    bank = state.winnings[state.turn % 3]
+
+    with phase_profiler.phase("decision"):
+      if type_of_player == "human":
+        guess, dollar = human_turn(state.showing, state.winnings, state.previous_guesses, state.turn, state.puzzle,
+                                   state.rng)
+      else:
+        spin_function = game_engine.STRATEGIES[type_of_player].spin_function
+        player = state.players[state.turn % 3]
+        guess, dollar = player.take_turn(state.showing, state.winnings, state.previous_guesses, state.turn,
+                                         lambda: spin(spin_function, state.rng))
+
+    paid = bank - state.winnings[state.turn % 3] # What a vowel cost, if it was bought
+    with phase_profiler.phase("board_update"):
+      correct = game_engine.apply_guess(state, guess, dollar)
+    event_log.record_move(guess, dollar, correct, state.showing, paid)
+    message = None
+    if correct == game_engine.REPEATED:
+      message = "Sorry, that's already been guessed .... next player"
+    elif correct == 0 and len(guess) > 1:
+      message = "Wrong ... next player"
+    elif correct == 0 and guess != "_":
+      message = "Sorry, not in the puzzle ... next player"
+    with phase_profiler.phase("rendering"):
+      renderer.render(state.showing, state.clue, state.winnings, state.previous_guesses, message)
+      output_sink.flush() # Once per turn
+
+  while state.winner is None:
+    output_sink.emit("turn", "Player", state.turn % 3, "has a chance to solve")
+    event_log.record("turn", state.turns_played, state.turn % 3, state.player_type)
     # If human, let them guess, otheerwise let computer guess
-    if type_of_player == "human":
-      solve = input("Your guess to solve: ...... ").upper() # TODO: clean
+    if state.player_type == "human":
+      solve = output_sink.ask("Your guess to solve: ...... ").upper() # TODO: clean
     else:
-      solve = showing
-  
-    if solve == puzzle:
-      print("Player", turn % 3, "won!")
-      print("Winnings:", winnings)
-      is_solved = True
-    else:
-      print("Wrong ... next player")
-      turn = turn + 1
-      print("The clue is:", clue)
-      print_board(showing)
+      solve = state.showing
+
+    with phase_profiler.phase("board_update"):
+      solved = game_engine.attempt_solve(state, solve)
+    event_log.record("solve", solve, solved)
+    if not solved:
+      with phase_profiler.phase("rendering"):
+        renderer.render(state.showing, state.clue, message="Wrong ... next player")
+        output_sink.flush()
+
+  renderer.close()
+  output_sink.emit("game", "Player", state.winner, "won!")
+  output_sink.emit("game", "Winnings:", state.winnings)
+  output_sink.flush()
+  event_log.record("game_end", state.winner, state.winnings, state.turns_played)
+  phase_profiler.dump()
+  return state
 
 if __name__ == '__main__':
-  type_of_players = sys.argv[1:]
+  seed = None
+  renderer = None
+  type_of_players = []
+  for arg in sys.argv[1:]:
+    if arg.startswith('--seed='):
+      seed = int(arg.split('=')[1])
+    elif arg.startswith('--pace='):
+      game_clock.use_pace(arg.split('=')[1])
+    elif arg == '--ansi':
+      # Board pinned to the top of the terminal, redrawn cell by cell
+      renderer = board_renderer.AnsiFrameRenderer()
+    elif arg.startswith('--output='):
+      output_sink.use_output(arg.split('=', 1)[1])
+    elif arg.startswith('--log='):
+      # Every event of the game appended to a log (python event_log.py summary FILE)
+      event_log.start(arg.split('=', 1)[1])
+    elif arg == '--animate':
+      # The wheel spins and stops on the segment drawn
+      ascii_wheel.ANIMATE = True
+    elif arg == '--profile':
+      # Phase timings are printed when the game ends, or any time on kill -USR1
+      phase_profiler.start()
+      phase_profiler.dump_on_signal()
+    else:
+      type_of_players.append(arg)
   print(type_of_players)
   if len(type_of_players) != 3:
     print("There should be 3 players ... creating a default game with smart AI players")
-    print("Available player types: human, morse, oxford, trigram, smart, conservative, aggressive")
+    print("Available player types: human, alphabet, morse, oxford, trigram, solver, smart, conservative, aggressive")
+    print("Options: --seed=N (replay a game), --profile (time each phase of the turns), --ansi (fixed board),")
+    print("         --animate (spin the wheel)")
+    print("        ", game_clock.PACE_HELP)
+    print("        ", output_sink.OUTPUT_HELP)
+    print("         --log=FILE (append every game event to FILE)")
     type_of_players = ["human", "smart", "conservative"] # Updated default with smart players
-    time.sleep(3)
+    game_clock.sleep(3)
   #type_of_players = ["morse", "morse", "oxford"] # TODO: Set with command line
 
-  play_random_game(type_of_players)
+  play_random_game(type_of_players, seed, renderer)
+  output_sink.get_sink().close()
+  event_log.stop()
@@ -0,0 +1,761 @@
+import asyncio
+import collections
+import concurrent.futures
+import random
+import re
+import sys
+import ascii_wheel
+import board_renderer
+import game_clock
+import output_sink
+from smart_player import computer_turn_smart, computer_turn_smart_conservative, computer_turn_smart_aggressive
+from chatgpt_commentary import WheelOfFortuneCommentary
+
+# Global commentary system instance
+commentary_system = None
+
+def computer_turn(showing, winnings, previous_guesses, turn):
+  # Guess in the order of the alphabet
+  alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+  dollar = 0
+  for character in alphabet:
+    if character in previous_guesses:
+      continue
+    if is_vowel(character):
+      if winnings[(turn % 3)] < 250:
+        continue
+      else:
+        output_sink.emit("guess", "Computer bought:", character)
+        winnings[(turn % 3)] = winnings[(turn % 3)] - 250
+        if commentary_system:
+          commentary_system.vowel_purchase_commentary(character, turn % 3, winnings)
+        break
+    # Want to choose a consonant ... so spins wheel
+    dollar = spin_wheel()
+    if dollar == 0:
+      output_sink.emit("guess", "Computer lost a turn")
+      character = "_"
+      break
+    elif dollar == -1:
+      output_sink.emit("guess", "Computer went backrupt")
+      winnings[(turn % 3)] = 0
+      character = "_"
+      break
+    else:
+      output_sink.emit("guess", "Computer guessed:", character)
+      break
+  return character, dollar
+
+def computer_turn_morse(showing, winnings, previous_guesses, turn):
+  # Guess in the order that Samuel Morse identified for his code
+  alphabet = "ETAINOSHRDLUCMFWYGPBVKQJXZ"
+  dollar = 0
+  for character in alphabet:
+    if character in previous_guesses:
+      continue
+    if is_vowel(character):
+      if winnings[(turn % 3)] < 250:
+        continue
+      else:
+        output_sink.emit("guess", "Computer bought:", character)
+        winnings[(turn % 3)] = winnings[(turn % 3)] - 250
+        if commentary_system:
+          commentary_system.vowel_purchase_commentary(character, turn % 3, winnings)
+        break
+    # Want to choose a consonant ... so spins wheel
+    dollar = spin_wheel()
+    if dollar == 0:
+      output_sink.emit("guess", "Computer lost a turn")
+      character = "_"
+      break
+    elif dollar == -1:
+      output_sink.emit("guess", "Computer went backrupt")
+      winnings[(turn % 3)] = 0
+      character = "_"
+      break
+    else:
+      output_sink.emit("guess", "Computer guessed:", character)
+      break
+  return character, dollar
+
+def computer_turn_oxford(showing, winnings, previous_guesses, turn):
+  # From dictionary ... that's game optimized word not occurance of words
+  # Concise Oxford Dictionary (9th edition, 1995) 
+  # https://www3.nd.edu/~busiforc/handouts/cryptography/letterfrequencies.html
+
+  alphabet = "EARIOTNSLCUDPMHGBFYWKVXZJQ"
+  dollar = 0
+  for character in alphabet:
+    if character in previous_guesses:
+      continue
+    if is_vowel(character):
+      if winnings[(turn % 3)] < 250:
+        continue
+      else:
+        output_sink.emit("guess", "Computer bought:", character)
+        winnings[(turn % 3)] = winnings[(turn % 3)] - 250
+        if commentary_system:
+          commentary_system.vowel_purchase_commentary(character, turn % 3, winnings)
+        break
+    # Want to choose a consonant ... so spins wheel
+    dollar = spin_wheel()
+    if dollar == 0:
+      output_sink.emit("guess", "Computer lost a turn")
+      character = "_"
+      break
+    elif dollar == -1:
+      output_sink.emit("guess", "Computer went backrupt")
+      winnings[(turn % 3)] = 0
+      character = "_"
+      break
+    else:
+      output_sink.emit("guess", "Computer guessed:", character)
+      break
+  return character, dollar
+
+def computer_turn_trigrams_bigrams(showing, winnings, previous_guesses, turn):
+
+  allow_vowels = False
+  if winnings[(turn % 3)] >= 250:
+    allow_vowels = True
+
+  candidate_trigrams = [] 
+  showing_words = showing.split(' ')
+  for word in showing_words:
+    index = 0
+    while index < (len(word) - 2):
+      trigram = word[index:index+3]
+      #print(trigram)
+      if trigram[2] == "_" and "_" != trigram[0] and "_" != trigram[1]:
+        candidate_trigrams.append(trigram)
+      index = index + 1
+
+  candidate_bigrams = [] 
+  for word in showing_words:
+    index = 0
+    while index < (len(word) - 1):
+      bigram = word[index:index+2]
+      #print(bigram)
+      if "_" != bigram[0] and bigram[1] == "_":
+        candidate_bigrams.append(bigram)
+      index = index + 1
+
+  #print(candidate_trigrams)
+  #print(candidate_bigrams)
+
+  dollar = 0
+  guess = "_"
+
+  # Frewquencies from: http://mathcenter.oxford.emory.edu/site/math125/englishLetterFreqs/#:~:text=Most%20common%20bigrams%20(in%20order,%2C%20sa%2C%20em%2C%20ro.
+
+  #Most common trigrams (in order)
+  trigrams = ["THE", "AND", "THA", "ENT", "ING", "ION", "TIO", "FOR", "NDE", "HAS", "NCE", "EDT", "TIS", "OFT", "STH", "MEN"]
+  for trigram in trigrams:
+    to_match = trigram[0:2] + "_"
+    #print("TOMatch", to_match)
+    if to_match in candidate_trigrams:
+      candidate = trigram[2]
+      #print("CANDIDATE", candidate)
+      if is_vowel(candidate) and allow_vowels == False:
+        #print("can't vowel")
+        continue
+      elif candidate in previous_guesses:
+        #print("already guessed")
+        continue
+      else:
+        guess = candidate
+        #print("Actual CANDIDATE", candidate)
+        break
+  if guess != "_":
+    if is_vowel(guess):
+      output_sink.emit("guess", "Computer bought:", guess)
+      winnings[(turn % 3)] = winnings[(turn % 3)] - 250
+      if commentary_system:
+        commentary_system.vowel_purchase_commentary(guess, turn % 3, winnings)
+      return guess, dollar # Should be a vowel and 0 since we've already subtraced
+    else:
+      dollar = spin_wheel()
+      if dollar == 0:
+        output_sink.emit("guess", "Computer lost a turn")
+        guess = "_"
+      elif dollar == -1:
+        output_sink.emit("guess", "Computer went backrupt")
+        winnings[(turn % 3)] = 0
+        guess = "_"
+      else:
+        output_sink.emit("guess", "Computer guessed:", guess)
+      return guess, dollar
+
+  #print("No trigrams ... backing off to bigrams")
+
+  #Most common bigrams (in order)
+  #frequent bigrams from a file ... http://practicalcryptography.com/media/cryptanalysis/files/english_bigrams_1.txt Only want first 128
+  #bigrams = ["TH", "HE", "IN", "EN", "NT", "RE", "ER", "AN", "TI", "ES", "ON", "AT", "SE", "ND", "OR", "AR", "AL", "TE", "CO", "DE", "TO", "RA", "ET", "ED", "IT", "SA", "EM", "RO"]
+  bigrams = []
+  try:
+    with open("bigrams.txt") as g:
+      for line in g:
+        line = line.rstrip('\n')
+        bigram = line.split(' ')[0].upper()
+        bigrams.append(bigram)
+        if len(bigrams) == 128:
+          break # Arbitrary threshold to use
+  except FileNotFoundError:
+    # Fallback bigrams if file not found
+    bigrams = ["TH", "HE", "IN", "EN", "NT", "RE", "ER", "AN", "TI", "ES", "ON", "AT", "SE", "ND", "OR", "AR", "AL", "TE", "CO", "DE", "TO", "RA", "ET", "ED", "IT", "SA", "EM", "RO"]
+  
+  #print(bigrams)
+  for bigram in bigrams:
+    to_match = bigram[0] + "_"
+    #print(to_match)
+    if to_match in candidate_bigrams:
+      candidate = bigram[1]
+      #print("CANDIDATE", candidate)
+      if is_vowel(candidate) and allow_vowels == False:
+        #print("can't vowel")
+        continue
+      elif candidate in previous_guesses:
+        #print("already guessed")
+        continue
+      else:
+        guess = candidate
+        #print("Actual CANDIDATE", candidate)
+        break
+  if guess != "_":
+    if is_vowel(guess):
+      output_sink.emit("guess", "Computer bought:", guess)
+      winnings[(turn % 3)] = winnings[(turn % 3)] - 250
+      if commentary_system:
+        commentary_system.vowel_purchase_commentary(guess, turn % 3, winnings)
+      return guess, dollar # Should be a vowel and 0 since we've already subtraced
+    else:
+      dollar = spin_wheel()
+      if dollar == 0:
+        output_sink.emit("guess", "Computer lost a turn")
+        guess = "_"
+      elif dollar == -1:
+        output_sink.emit("guess", "Computer went backrupt")
+        winnings[(turn % 3)] = 0
+        guess = "_"
+      else:
+        output_sink.emit("guess", "Computer guessed:", guess)
+      return guess, dollar
+
+  #print("No bigrams ... backing off to unigrams")
+
+  # Unigrams are from the oxford strategy above
+  alphabet = "EARIOTNSLCUDPMHGBFYWKVXZJQ"
+
+
+  for character in alphabet:
+    if character in previous_guesses:
+      continue
+    if is_vowel(character):
+      if winnings[(turn % 3)] < 250:
+        continue
+      else:
+        output_sink.emit("guess", "Computer bought:", character)
+        winnings[(turn % 3)] = winnings[(turn % 3)] - 250
+        if commentary_system:
+          commentary_system.vowel_purchase_commentary(character, turn % 3, winnings)
+        break
+    # Want to choose a consonant ... so spins wheel
+    dollar = spin_wheel()
+    if dollar == 0:
+      output_sink.emit("guess", "Computer lost a turn")
+      character = "_"
+      break
+    elif dollar == -1:
+      output_sink.emit("guess", "Computer went backrupt")
+      winnings[(turn % 3)] = 0
+      character = "_"
+      break
+    else:
+      output_sink.emit("guess", "Computer guessed:", character)
+      break
+  return character, dollar
+
+def get_random_puzzle():
+  random_int = random.randint(0,900) # Roughly size of num puzzles in valid
+  number = 0
+  try:
+    with open("../../data/puzzles/valid.csv") as f:
+      for line in f:
+        line = line.rstrip('\n')
+        puzzle, clue, date, game_type = line.split(',')
+        if number == random_int:
+          #print(line)
+          clue = clue.replace("&amp;", "&") # HTML Code
+          puzzle = puzzle.replace("&amp;", "&") # HTML Code
+          return(puzzle, clue, date, game_type)
+        number = number + 1
+  except FileNotFoundError:
+    # Fallback puzzles if file not found
+    fallback_puzzles = [
+      ("WHEEL OF FORTUNE", "TV SHOW", "2024-01-01", "SHOW BIZ"),
+      ("ARTIFICIAL INTELLIGENCE", "TECHNOLOGY", "2024-01-01", "TECH"),
+      ("PYTHON PROGRAMMING", "COMPUTER SCIENCE", "2024-01-01", "TECH"),
+      ("CHATGPT COMMENTARY", "AI FEATURE", "2024-01-01", "TECH"),
+      ("GAME SHOW HOST", "ENTERTAINMENT", "2024-01-01", "SHOW BIZ")
+    ]
+    return random.choice(fallback_puzzles)
+
+def human_turn(showing, winnings, previous_guesses, turn, puzzle):
+
+  # Make sure human chooses a valid action
+  deciding = False
+  while not deciding:
+    decision = output_sink.ask("1: Spin, 2: Buy Vowel, 3: Solve ....  ")
+    if decision == "1" or decision == "2" or decision == "3":
+      deciding = True
+      if decision == "2" and winnings[(turn % 3)] < 250: # Minimum cost of a vowel
+        output_sink.emit("prompt", "Sorry .... you don't have enough money. Select 1 or 3")
+        deciding = False
+    else:
+      output_sink.emit("prompt", "Please choose 1, 2, or 3")
+
+  # Player decisions
+  if decision == "3":
+    deciding = True
+    solve = output_sink.ask("Your guess to solve: ...... ").upper() # TODO: clean
+    if solve == puzzle:
+      output_sink.emit("prompt", "YOU WIN!")
+      output_sink.emit("prompt", "Player", turn % 3, "won!")
+      output_sink.emit("prompt", "Winnings:", winnings)
+      if commentary_system:
+        commentary_system.solve_attempt_commentary(solve, True, puzzle, turn % 3, winnings)
+      # The whole puzzle as the guess: finish_turn fills the board and the game ends
+      guess = solve
+      dollar = 0
+    else:
+      output_sink.emit("prompt", "Wrong ... next player")
+      if commentary_system:
+        commentary_system.solve_attempt_commentary(solve, False, puzzle, turn % 3, winnings)
+      #turn = turn + 1
+      #print("The clue is:", clue)
+      #print_board(showing)
+      #continue
+      guess = "_"
+      dollar = 0
+  elif decision == "2":
+    winnings[(turn % 3)] = winnings[(turn % 3)] - 250
+    is_one_vowel = False
+    while is_one_vowel != True:
+      vowel = output_sink.ask("Guess a vowel: ").upper()
+      if len(vowel) != 1:
+        output_sink.emit("prompt", "Guess only one letter")
+      else:
+        is_one_vowel = is_vowel(vowel)
+
+      if not is_one_vowel:
+        output_sink.emit("prompt", "Not a vowel")
+    guess = vowel
+    dollar = 0
+    if commentary_system:
+      commentary_system.vowel_purchase_commentary(vowel, turn % 3, winnings)
+  elif decision == "1":
+    # Spin wheel
+    dollar = spin_wheel()
+    guess = ""
+    if dollar == 0:
+      output_sink.emit("prompt", "Sorry! Lose a turn. Next player")
+      #turn = turn + 1
+      #continue
+      guess = "_"
+    elif dollar == -1:
+      output_sink.emit("prompt", "Oh No! Bankrupt!")
+      winnings[(turn % 3)] = 0
+      #turn = turn + 1
+      #continue
+      guess = "_"
+    is_one_consonant = False
+    if guess == "_":
+      is_one_consonant = True # Hacky way
+    while is_one_consonant != True:
+      guess = output_sink.ask("Name a consonant .... ").upper()
+      if len(guess) != 1: 
+        output_sink.emit("prompt", "Guess only one letter")
+      else:
+        is_one_consonant = is_consonant(guess)
+
+      if not is_one_consonant:
+        output_sink.emit("prompt", "Not a consonant")
+  return guess, dollar
+
+def is_consonant(guess):
+  consonants = "BCDFGHJKLMNPQRSTVWXYZ"
+  if guess in consonants:
+    return True
+  else:
+    return False
+
+def is_vowel(guess):
+  vowels = "AEIOU"
+  if guess in vowels:
+    return True
+  else:
+    return False
+
+def print_board(showing):
+  # Formatted in one pass and written at once
+  output_sink.write("board", board_renderer.format_board(showing) + "\n")
+
+def spin_wheel():
+  wheel_values = [0,-1,500,550,600,650,700,750,800,850,900,-1,500,550,600,650,700,750,800,850,900,500,550,600]
+  # Note that the wheel changes over time ... free play now an 850. Different rounds, etc.
+  output_sink.emit("spin", "Wheel is spinning ....")
+  output_sink.emit("spin", "It landed on ....")
+  landing = random.randrange(len(wheel_values))
+  try:
+    if ascii_wheel.ANIMATE:
+      ascii_wheel.animate_spin(wheel_values, landing, radius=18, label_style="long")
+    else:
+      game_clock.sleep(2) # Drama!
+      ascii_wheel.draw_ascii_wheel(wheel_values, radius=18, label_style="long")
+  except:
+    output_sink.emit("spin", "🎡 [Wheel spinning animation would appear here]")
+  dollar = wheel_values[landing]
+  output_sink.emit("spin", "....", dollar, "dollars")
+  
+  # Add commentary for wheel spin results
+  if commentary_system:
+    # We'll add the player info when this is called from the main game loop
+    pass
+    
+  return dollar
+
+
+COMPUTER_TURNS = {
+  "morse": computer_turn_morse,
+  "oxford": computer_turn_oxford,
+  "trigram": computer_turn_trigrams_bigrams,
+  "smart": computer_turn_smart,
+  "conservative": computer_turn_smart_conservative,
+  "aggressive": computer_turn_smart_aggressive,
+}
+
+# The steps of a turn both game loops share; the asyncio loop only changes where it waits
+
+def start_game(commentary):
+  puzzle, clue, date, game_type = get_random_puzzle()
+  output_sink.emit("game", "Welcome to Wheel of Fortune")
+  output_sink.emit("game", "You are playing a game of type:", game_type)
+  output_sink.emit("board", "The clue is:", clue)
+  
+  # Game start commentary
+  if commentary:
+    commentary.game_start_commentary(clue, game_type)
+
+  # Mask out word
+  showing = puzzle
+  showing = re.sub(r"[A-Z]","_",showing)
+  print_board(showing)
+  return puzzle, clue, showing
+
+def start_turn(type_of_players, turn, winnings, commentary):
+  output_sink.emit("turn", "It is player", turn % 3, "'s turn")
+
+  # Type of player
+  type_of_player = type_of_players[turn % 3]
+  output_sink.emit("turn", "This player is:", type_of_player)
+  
+  # Player turn commentary
+  if commentary:
+    commentary.player_turn_commentary(turn % 3, type_of_player, winnings)
+  return type_of_player
+
+def take_turn(type_of_player, showing, winnings, previous_guesses, turn, puzzle):
+  if type_of_player == "human":
+    return human_turn(showing, winnings, previous_guesses, turn, puzzle)
+  return COMPUTER_TURNS[type_of_player](showing, winnings, previous_guesses, turn)
+
+def finish_turn(type_of_player, guess, dollar, puzzle, showing, clue, previous_guesses, turn, winnings, commentary):
+  # Board and winnings after a turn's (guess, dollar); returns (showing, turn)
+
+  if guess == puzzle:
+    # A human solved it (human_turn announced the win)
+    return puzzle, turn
+
+  # Add wheel spin commentary for computer players (human commentary is handled in human_turn)
+  if type_of_player != "human" and commentary and dollar != 0:
+    commentary.wheel_spin_commentary(dollar, turn % 3, winnings)
+
+  correct_places = []
+  # Double check that guess has not already been said (I've seen it on TV before)
+  if guess in previous_guesses and guess != "_":
+    output_sink.emit("game", "Sorry, that's already been guessed .... next player")
+    turn = turn + 1
+  else:
+    # Update board
+    previous_guesses.append(guess)
+    for pos,char in enumerate(puzzle):
+      if(char == guess):
+          correct_places.append(pos)
+    #print(correct_places)
+    if guess == "_": # Hacky way to say the comp got it wrong or bankrupt, etc.
+      turn = turn + 1
+    elif len(correct_places) < 1:
+      output_sink.emit("game", "Sorry, not in the puzzle ... next player")
+      turn = turn + 1
+      
+    # Add guess result commentary
+    if commentary and guess != "_":
+      commentary.guess_result_commentary(
+        guess, len(correct_places), dollar, showing, clue, 
+        previous_guesses, turn % 3, winnings
+      )
+      
+  winnings[(turn % 3)] = winnings[(turn % 3)] + (dollar * len(correct_places))
+  for correct_letter in correct_places:
+    showing = showing[:correct_letter] + guess + showing[correct_letter + 1:]
+  output_sink.emit("board", "Winnings:", winnings)
+  output_sink.emit("board", "Previous guesses:", previous_guesses)
+  output_sink.emit("board", "The clue is:", clue)
+  print_board(showing)
+  
+  # Add puzzle progress commentary
+  if commentary:
+    commentary.puzzle_progress_commentary(showing, clue, previous_guesses)
+  return showing, turn
+
+def check_solve(solve, puzzle, showing, clue, turn, winnings, commentary):
+  # A solve attempt; returns (is_solved, turn)
+  if solve == puzzle:
+    output_sink.emit("game", "Player", turn % 3, "won!")
+    output_sink.emit("game", "Winnings:", winnings)
+    if commentary:
+      commentary.solve_attempt_commentary(solve, True, puzzle, turn % 3, winnings)
+    return True, turn
+  output_sink.emit("game", "Wrong ... next player")
+  if commentary:
+    commentary.solve_attempt_commentary(solve, False, puzzle, turn % 3, winnings)
+  turn = turn + 1
+  output_sink.emit("board", "The clue is:", clue)
+  print_board(showing)
+  return False, turn
+
+def play_random_game(type_of_players, enable_commentary=True, commentary_style="dramatic", api_key=None):
+  global commentary_system
+  
+  # Initialize commentary system
+  if enable_commentary:
+    commentary_system = WheelOfFortuneCommentary(
+      api_key=api_key,
+      commentary_style=commentary_style,
+      enable_commentary=True
+    )
+  else:
+    commentary_system = None
+
+  # Play the game
+  puzzle, clue, showing = start_game(commentary_system)
+
+  # Play the game
+  previous_guesses = []
+  turn = 0
+
+  winnings = [0,0,0]
+  guess = ""
+
+  while showing != puzzle:
+    game_clock.sleep(2) # Let humans see what is going on
+    # Ends wierd if last letter is guessed and not solved.# TODO
+    type_of_player = start_turn(type_of_players, turn, winnings, commentary_system)
+    guess, dollar = take_turn(type_of_player, showing, winnings, previous_guesses, turn, puzzle)
+    showing, turn = finish_turn(type_of_player, guess, dollar, puzzle, showing, clue, previous_guesses, turn,
+                                winnings, commentary_system)
+    output_sink.flush() # Once per turn
+
+  is_solved = guess == puzzle
+  while not is_solved:
+    output_sink.emit("turn", "Player", turn % 3, "has a chance to solve")
+    type_of_player = type_of_players[turn % 3] # wouldn't have hit this above
+    # If human, let them guess, otheerwise let computer guess
+    if type_of_player == "human":
+      solve = output_sink.ask("Your guess to solve: ...... ").upper() # TODO: clean
+    else:
+      solve = showing
+  
+    is_solved, turn = check_solve(solve, puzzle, showing, clue, turn, winnings, commentary_system)
+    output_sink.flush()
+
+class CommentaryLane:
+  """
+  Stands in for the commentary system in the asyncio game: every commentary call is queued on
+  one worker thread and returns at once, so play carries on while the text is made.
+  The worker only keeps its lines; wait() shows them from the game loop, in the order asked for.
+  """
+
+  def __init__(self, system):
+    self.system = system
+    self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="commentary")
+    self.pending = collections.deque()
+    self.last = None
+
+  def __getattr__(self, name):
+    method = getattr(self.system, name)
+
+    def queue(*args):
+      # Lists (winnings, guesses) are copied so the line describes the moment it was asked for
+      args = [list(arg) if isinstance(arg, list) else arg for arg in args]
+      self.last = self.executor.submit(output_sink.capture_commentary, method, *args)
+      self.pending.append(self.last)
+      return self.last
+    return queue
+
+  async def wait(self, future=None):
+    """Wait until a queued call is done (default: everything queued so far) and show its lines and all before"""
+    future = future or self.last
+    if future not in self.pending:
+      return
+    while self.pending:
+      done = self.pending.popleft()
+      for text in await asyncio.wrap_future(done):
+        output_sink.commentary(text)
+      if done is future:
+        break
+
+  async def close(self):
+    await self.wait()
+    self.executor.shutdown()
+
+async def play_random_game_async(type_of_players, enable_commentary=True, commentary_style="dramatic", api_key=None):
+  # play_random_game with commentary generated while the next player decides and spins.
+  # A turn now takes as long as its slowest wait instead of all of them added up; commentary
+  # may run up to one turn behind, and is caught up before a human is asked anything and at the end
+  global commentary_system
+
+  lane = None
+  if enable_commentary:
+    lane = CommentaryLane(WheelOfFortuneCommentary(
+      api_key=api_key,
+      commentary_style=commentary_style,
+      enable_commentary=True
+    ))
+  # The turn functions call commentary_system directly, so they queue on the lane too
+  commentary_system = lane
+
+  puzzle, clue, showing = start_game(lane)
+  output_sink.flush()
+
+  previous_guesses = []
+  turn = 0
+  winnings = [0,0,0]
+  guess = ""
+  behind = None # Last commentary line of the previous turn
+
+  while showing != puzzle:
+    await game_clock.pause(2) # Let humans see what is going on
+    type_of_player = start_turn(type_of_players, turn, winnings, lane)
+    if type_of_player == "human":
+      if lane:
+        await lane.wait()
+      output_sink.flush()
+    # Turns block on the wheel's pause (and humans on input), so they run off the event loop
+    guess, dollar = await asyncio.to_thread(take_turn, type_of_player, showing, winnings, previous_guesses, turn,
+                                            puzzle)
+    showing, turn = finish_turn(type_of_player, guess, dollar, puzzle, showing, clue, previous_guesses, turn,
+                                winnings, lane)
+    if lane:
+      # Commentary may trail play by one turn, no more
+      await lane.wait(behind)
+      behind = lane.last
+    output_sink.flush() # Once per turn
+
+  is_solved = guess == puzzle
+  while not is_solved:
+    output_sink.emit("turn", "Player", turn % 3, "has a chance to solve")
+    if type_of_players[turn % 3] == "human":
+      if lane:
+        await lane.wait()
+      output_sink.flush()
+      solve = (await asyncio.to_thread(output_sink.ask, "Your guess to solve: ...... ")).upper()
+    else:
+      solve = showing
+
+    is_solved, turn = check_solve(solve, puzzle, showing, clue, turn, winnings, lane)
+    output_sink.flush()
+
+  if lane:
+    await lane.close() # The last word goes to the host
+  commentary_system = None
+  output_sink.flush()
+
+def print_usage():
+  print("\nWheel of Fortune with ChatGPT Commentary")
+  print("=" * 50)
+  print("Usage: python wheel_of_fortune_with_commentary.py [player1] [player2] [player3] [options]")
+  print("\nPlayer Types:")
+  print("  human       - Human player")
+  print("  morse       - Computer using Morse code frequency")
+  print("  oxford      - Computer using Oxford dictionary frequency")
+  print("  trigram     - Computer using trigram/bigram analysis")
+  print("  smart       - Smart AI player")
+  print("  conservative- Conservative AI player")
+  print("  aggressive  - Aggressive AI player")
+  print("\nCommentary Options:")
+  print("  --no-commentary     Disable ChatGPT commentary")
+  print("  --style=STYLE       Commentary style: dramatic, humorous, professional, casual")
+  print("  --api-key=KEY       OpenAI API key (or set OPENAI_API_KEY environment variable)")
+  print("\nPacing:")
+  print(" ", game_clock.PACE_HELP)
+  print("  --animate              Spin the wheel and stop on the segment drawn")
+  print(" ", output_sink.OUTPUT_HELP)
+  print("  --async                Commentary runs alongside play instead of holding up every turn")
+  print("\nExamples:")
+  print("  python wheel_of_fortune_with_commentary.py human smart conservative")
+  print("  python wheel_of_fortune_with_commentary.py human morse oxford --style=humorous")
+  print("  python wheel_of_fortune_with_commentary.py smart smart smart --no-commentary")
+  print()
+
+if __name__ == '__main__':
+  # Parse command line arguments
+  args = sys.argv[1:]
+  
+  # Default settings
+  type_of_players = []
+  enable_commentary = True
+  commentary_style = "dramatic"
+  api_key = None
+  run_async = False
+  
+  # Parse arguments
+  for arg in args:
+    if arg.startswith('--'):
+      if arg == '--no-commentary':
+        enable_commentary = False
+      elif arg.startswith('--style='):
+        commentary_style = arg.split('=')[1]
+      elif arg.startswith('--api-key='):
+        api_key = arg.split('=')[1]
+      elif arg.startswith('--pace='):
+        game_clock.use_pace(arg.split('=')[1])
+      elif arg.startswith('--output='):
+        output_sink.use_output(arg.split('=', 1)[1])
+      elif arg == '--async':
+        run_async = True
+      elif arg == '--animate':
+        ascii_wheel.ANIMATE = True
+      elif arg == '--help':
+        print_usage()
+        exit()
+    else:
+      type_of_players.append(arg)
+  
+  print("Players:", type_of_players)
+  print("Commentary enabled:", enable_commentary)
+  if enable_commentary:
+    print("Commentary style:", commentary_style)
+  
+  if len(type_of_players) != 3:
+    print("There should be 3 players ... creating a default game with smart AI players")
+    print("Available player types: human, morse, oxford, trigram, smart, conservative, aggressive")
+    print("Use --help for more options")
+    type_of_players = ["human", "smart", "conservative"] # Updated default with smart players
+    game_clock.sleep(3)
+
+  if run_async:
+    asyncio.run(play_random_game_async(type_of_players, enable_commentary, commentary_style, api_key))
+  else:
+    play_random_game(type_of_players, enable_commentary, commentary_style, api_key)
+  output_sink.get_sink().close()
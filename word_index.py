@@ -0,0 +1,158 @@
+"""
+Word-pattern index for Wheel of Fortune
+Maps a word as shown on the board ("_HEE_") and the letters already called to the corpus words it can be
+"""
+
+import functools
+from collections import Counter, namedtuple
+
+import puzzle_corpus
+from board_state import ALPHABET, LETTER_BITS
+
+# Distinct (pattern, guessed letters) lookups remembered per index
+LOOKUP_CACHE_SIZE = 65536
+
+# words: every candidate, most frequent first; expected[i]: hits ALPHABET[i] would get in this word and
+# present[i]: chance the word has ALPHABET[i] at all, over the candidates weighted by corpus frequency
+WordMatches = namedtuple("WordMatches", ["words", "expected", "present"])
+
+NO_MATCHES = WordMatches((), (0.0,) * 26, (0.0,) * 26)
+
+
+def letter_mask(text):
+    """26-bit mask of the letters in text"""
+    mask = 0
+    for character in text:
+        mask |= LETTER_BITS.get(character, 0)
+    return mask
+
+
+class WordIndex:
+    """
+    Every distinct puzzle word, bucketed by length and by (length, position, letter).
+    A lookup scans the smallest bucket its revealed letters allow and is cached,
+    so repeated board patterns cost a dictionary hit.
+    """
+
+    def __init__(self, words):
+        """
+        Args:
+            words: Iterable of words; repeats count towards how likely a word is
+        """
+        frequencies = Counter(words)
+        # Most frequent first, so candidates come back in order of likelihood
+        self.words = sorted(frequencies, key=lambda word: (-frequencies[word], word))
+        self.counts = [frequencies[word] for word in self.words]
+        self.masks = [letter_mask(word) for word in self.words]
+        # (letter index, occurrences) for each distinct letter of each word
+        self.letters = [tuple((ALPHABET.index(letter), word.count(letter)) for letter in sorted(set(word))
+                              if letter in LETTER_BITS)
+                        for word in self.words]
+
+        by_length = {}
+        by_position = {}
+        for word_id, word in enumerate(self.words):
+            by_length.setdefault(len(word), []).append(word_id)
+            for position, character in enumerate(word):
+                if character in LETTER_BITS:
+                    by_position.setdefault((len(word), position, character), []).append(word_id)
+        self.by_length = {length: tuple(ids) for length, ids in by_length.items()}
+        self.by_position = {key: tuple(ids) for key, ids in by_position.items()}
+
+        self.lookup = functools.lru_cache(maxsize=LOOKUP_CACHE_SIZE)(self._lookup)
+
+    @classmethod
+    def from_corpus(cls, corpus):
+        """Index the words of every puzzle in a PuzzleCorpus"""
+        return cls(word for row in range(len(corpus)) for word in corpus[row][0].split())
+
+    def __len__(self):
+        return len(self.words)
+
+    def _lookup(self, pattern, guessed_mask):
+        """
+        WordMatches for one word of the board. A candidate shows exactly the revealed
+        letters where the pattern does, and has no other called letter anywhere.
+        Use lookup(), the cached version.
+        """
+        length = len(pattern)
+        pool = self.by_length.get(length, ())
+        for position, shown in enumerate(pattern):
+            if shown != '_':
+                postings = self.by_position.get((length, position, shown), ())
+                if len(postings) < len(pool):
+                    pool = postings
+
+        revealed_mask = letter_mask(pattern)
+        masks = self.masks
+        words = self.words
+        matches = []
+        for word_id in pool:
+            if masks[word_id] & guessed_mask != revealed_mask:
+                continue
+            for shown, character in zip(pattern, words[word_id]):
+                if shown != character:
+                    # A blank can only hide a letter that has not been called
+                    bit = LETTER_BITS.get(character)
+                    if shown != '_' or bit is None or bit & revealed_mask:
+                        break
+            else:
+                matches.append(word_id)
+        if not matches:
+            return NO_MATCHES
+
+        expected = [0.0] * 26
+        present = [0.0] * 26
+        total = 0
+        for word_id in matches:
+            weight = self.counts[word_id]
+            total += weight
+            for letter, occurrences in self.letters[word_id]:
+                expected[letter] += weight * occurrences
+                present[letter] += weight
+        # Revealed letters are in every candidate but have nothing left to turn over
+        for letter_index, letter in enumerate(ALPHABET):
+            if LETTER_BITS[letter] & revealed_mask:
+                expected[letter_index] = present[letter_index] = 0.0
+        return WordMatches(tuple(words[word_id] for word_id in matches),
+                           tuple(hits / total for hits in expected),
+                           tuple(weight / total for weight in present))
+
+    def candidates(self, pattern, guessed=()):
+        """Corpus words that fit one word of the board, most frequent first"""
+        return list(self.lookup(pattern, letter_mask(guessed)).words)
+
+    def analyse(self, showing, guessed_mask):
+        """
+        (solution, expected) for a whole board: solution is the puzzle when every
+        hidden word has a single candidate (else None) and expected[i] the hits
+        ALPHABET[i] would get across the board.
+        """
+        expected = [0.0] * 26
+        solution = []
+        for pattern in showing.split(' '):
+            if '_' not in pattern:
+                if solution is not None:
+                    solution.append(pattern)
+                continue
+            matches = self.lookup(pattern, guessed_mask)
+            if len(matches.words) == 1 and solution is not None:
+                solution.append(matches.words[0])
+            else:
+                solution = None
+            for letter, hits in enumerate(matches.expected):
+                expected[letter] += hits
+        return (' '.join(solution) if solution is not None else None), expected
+
+
+_indexes = {}
+
+
+def get_word_index(path=None):
+    """Shared index per puzzle file (default puzzle_corpus.PUZZLE_FILE), built on first use"""
+    if path is None:
+        path = puzzle_corpus.PUZZLE_FILE
+    index = _indexes.get(path)
+    if index is None:
+        index = _indexes[path] = WordIndex.from_corpus(puzzle_corpus.get_corpus(path))
+    return index